@@ -14,15 +14,15 @@ The AI handles:
 """
 
 import os
-import pytest
-from playwright.sync_api import sync_playwright
 
 # Import testScout
 import sys
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from testscout import Scout, Context, VisualAssertions, create_scout
+import pytest
+from playwright.sync_api import sync_playwright
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from testscout import Context, Scout, VisualAssertions
 
 # Skip if no API key
 pytestmark = pytest.mark.skipif(
@@ -36,14 +36,25 @@ class TestAnyWebApp:
     Just change the URL and the assertions!
     """
 
+    @pytest.fixture(scope="class", autouse=True)
+    def browser_session(self, request):
+        """Launch the browser once for the whole class.
+
+        A chromium launch costs hundreds of milliseconds of process
+        startup; per-test isolation comes from the much cheaper
+        new_context() in setup instead.
+        """
+        request.cls.playwright = sync_playwright().start()
+        request.cls.browser = request.cls.playwright.chromium.launch(headless=True)
+        yield
+        request.cls.browser.close()
+        request.cls.playwright.stop()
+
     @pytest.fixture(autouse=True)
     def setup(self):
-        """Set up browser and scout for each test."""
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(headless=True)
-
-        browser_context = self.browser.new_context()
-        self.page = browser_context.new_page()
+        """Set up a fresh context and scout for each test."""
+        self.browser_context = self.browser.new_context()
+        self.page = self.browser_context.new_page()
 
         # Create context to capture everything
         self.context = Context()
@@ -60,8 +71,7 @@ class TestAnyWebApp:
 
         # Cleanup
         self.scout.cleanup()
-        self.browser.close()
-        self.playwright.stop()
+        self.browser_context.close()
 
         # Save report
         self.context.save_report("examples/last_test_report.txt")
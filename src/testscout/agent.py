@@ -13,13 +13,31 @@ Uses structured JSON output for reliable parsing.
 """
 
 import base64
+import json
+import re
 import time
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from .backends import ActionPlan, ActionType, GeminiBackend, OpenAIBackend, VisionBackend
 from .context import AIVerification, Context
 from .discovery import ElementDiscoverySync, PageElements
 
+# Quoted literals in an assertion ("The page shows 'Example Domain'")
+# can often be settled with a DOM text lookup instead of a model call.
+# The single-quote arm requires non-word boundaries so apostrophes
+# inside words ("don't") are not mistaken for quote delimiters.
+_QUOTED = re.compile(r"\"([^\"]+)\"|(?<!\w)'([^']+)'(?!\w)")
+# An affirmative-only guard: a found substring proves nothing for
+# "should not show 'X'" or "isn't visible" style assertions
+_NEGATION = re.compile(
+    r"\b(not|no|never|without|gone|hidden|disappear\w*)\b|n['\u2019]t\b", re.IGNORECASE
+)
+
+
+def _quoted_literals(assertion: str) -> list:
+    """Extract quoted strings from an assertion, either quote style."""
+    return [double or single for double, single in _QUOTED.findall(assertion)]
+
 
 class Scout:
     """
@@ -92,6 +110,11 @@ class Scout:
 
         self._action_count = 0
         self._last_screenshot_hash: Optional[str] = None
+        # Exact-match cache for verify/query responses, keyed by
+        # (prompt, screenshot hash): identical pixels get identical
+        # answers, so re-asking the model is a wasted round trip - most
+        # commonly in verify()'s poll loop when the page hasn't changed
+        self._response_cache: Dict[Any, Any] = {}
 
     def _get_screenshot_b64(self, with_markers: bool = True) -> str:
         """Get screenshot as base64."""
@@ -134,11 +157,10 @@ class Scout:
         start_time = time.time()
 
         for attempt in range(retry + 1):
-            # Refresh element discovery
-            elements = self._refresh_elements()
-
-            # Get screenshot with markers
+            # Screenshot with markers re-discovers elements in the same
+            # browser round-trip, so no separate discover call is needed
             screenshot_b64 = self._get_screenshot_b64(with_markers=True)
+            elements = self.discovery.elements
 
             # Ask AI to plan the action
             plan = self.backend.plan_action(instruction, screenshot_b64, elements)
@@ -269,17 +291,49 @@ class Scout:
         """
         start_time = time.time()
 
+        # Fast path: if the assertion quotes literal text and is not
+        # negated, finding every quoted string verbatim in the rendered
+        # page text answers it without a model round-trip. innerText
+        # excludes display:none content, so presence implies visibility
+        # for ordinary text. Anything else falls through to the model.
+        quoted = _quoted_literals(assertion)
+        text_predicate = None
+        if quoted and not _NEGATION.search(assertion):
+            text_predicate = "() => " + " && ".join(
+                f"document.body.innerText.includes({json.dumps(text)})" for text in quoted
+            )
+            try:
+                found = bool(self.page.evaluate(text_predicate))
+            except Exception:
+                found = False
+                text_predicate = None
+            if found:
+                self.context.add_ai_verification(
+                    AIVerification(
+                        action_type="assert",
+                        description=assertion,
+                        result=True,
+                        reason="Quoted text found verbatim in page text",
+                        duration_ms=(time.time() - start_time) * 1000,
+                    )
+                )
+                return True
+
         while time.time() - start_time < timeout:
             # Get fresh screenshot (no markers for cleaner verification)
             screenshot_b64 = self._get_screenshot_b64(with_markers=False)
 
-            # Check if screenshot changed (skip if identical to last check)
             screenshot_hash = self.context.get_screenshot_hash(base64.b64decode(screenshot_b64))
 
-            elements = self._refresh_elements()
-
-            # Ask AI to verify
-            result = self.backend.verify_assertion(assertion, screenshot_b64, elements)
+            # Skip the model round-trip when this exact assertion was
+            # already answered against these exact pixels (typical while
+            # polling an unchanged page)
+            cache_key = ("verify", assertion, screenshot_hash)
+            result = self._response_cache.get(cache_key)
+            if result is None:
+                elements = self._refresh_elements()
+                result = self.backend.verify_assertion(assertion, screenshot_b64, elements)
+                self._response_cache[cache_key] = result
 
             duration_ms = (time.time() - start_time) * 1000
 
@@ -296,7 +350,25 @@ class Scout:
                 )
                 return True
 
-            # Not passed yet - wait and retry
+            # Not passed yet - wait and retry. When the assertion quotes
+            # literal text, the wait is event-driven: wait_for_function
+            # re-evaluates on DOM mutation, so the pass is recorded the
+            # moment the text appears instead of at the next poll tick.
+            if text_predicate is not None:
+                try:
+                    self.page.wait_for_function(text_predicate, timeout=poll_interval * 1000)
+                except Exception:
+                    continue
+                self.context.add_ai_verification(
+                    AIVerification(
+                        action_type="assert",
+                        description=assertion,
+                        result=True,
+                        reason="Quoted text found verbatim in page text",
+                        duration_ms=(time.time() - start_time) * 1000,
+                    )
+                )
+                return True
             time.sleep(poll_interval)
 
         # Timeout - record failure
@@ -311,6 +383,59 @@ class Scout:
         )
         return False
 
+    def verify_all(self, assertions: list) -> bool:
+        """
+        Verify several assertions about the current page in one AI call.
+
+        The screenshot is the expensive part of a vision payload, so K
+        assertions about the same page are batched into a single call
+        instead of K round-trips. No retry polling - this checks the page
+        as it is right now; use verify() for assertions that need to wait.
+
+        Args:
+            assertions: Natural language assertions to check together
+
+        Returns:
+            True only if every assertion passes
+
+        Examples:
+            scout.verify_all([
+                "The dashboard should be visible",
+                "The user menu should show 'test@example.com'",
+            ])
+        """
+        return all(result.passed for result in self._verify_batch(assertions))
+
+    def _verify_batch(self, assertions: list) -> list:
+        """Run a batch verification and return the per-assertion results.
+
+        Shared by verify_all() and AssertionContext, which needs the
+        individual results to report which checks failed.
+        """
+        if not assertions:
+            return []
+
+        start_time = time.time()
+        screenshot_b64 = self._get_screenshot_b64(with_markers=False)
+        screenshot_hash = self.context.get_screenshot_hash(base64.b64decode(screenshot_b64))
+        elements = self._refresh_elements()
+
+        results = self.backend.verify_assertions(assertions, screenshot_b64, elements)
+
+        duration_ms = (time.time() - start_time) * 1000
+        for assertion, result in zip(assertions, results):
+            self.context.add_ai_verification(
+                AIVerification(
+                    action_type="assert",
+                    description=assertion,
+                    result=result.passed,
+                    reason=result.reason,
+                    screenshot_hash=screenshot_hash,
+                    duration_ms=duration_ms,
+                )
+            )
+        return results
+
     def query(self, question: str) -> str:
         """
         Ask AI a question about the current page state.
@@ -326,8 +451,14 @@ class Scout:
             count = scout.query("How many items are in the cart?")
         """
         screenshot_b64 = self._get_screenshot_b64(with_markers=False)
-        elements = self._refresh_elements()
-        return self.backend.query(question, screenshot_b64, elements)
+        screenshot_hash = self.context.get_screenshot_hash(base64.b64decode(screenshot_b64))
+        cache_key = ("query", question, screenshot_hash)
+        answer = self._response_cache.get(cache_key)
+        if answer is None:
+            elements = self._refresh_elements()
+            answer = self.backend.query(question, screenshot_b64, elements)
+            self._response_cache[cache_key] = answer
+        return answer
 
     def discover_elements(self, element_type: Optional[str] = None):
         """
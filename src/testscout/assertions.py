@@ -253,18 +253,28 @@ class AssertionContext:
             check.no_errors()
             check.element_visible("Email input")
 
-        # All assertions run, failures collected and reported together
+        # All assertions run in ONE AI call on exit, failures collected
+        # and reported together
+
+    Each check.* call only records the assertion; the batch is submitted
+    when the block exits, so the screenshot and page context are sent
+    once instead of once per check. Because the page is checked as it is
+    at exit time, per-check timeouts do not poll (the parameters are
+    kept for signature compatibility with VisualAssertions).
     """
 
     def __init__(self, scout):
         self.scout = scout
         self.assertions = VisualAssertions(scout)
         self.failures = []
+        # (assertion text, failure message) pairs awaiting the batch call
+        self._pending = []
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        self._flush()
         if self.failures:
             raise AssertionError(
                 f"{len(self.failures)} assertion(s) failed:\n"
@@ -272,26 +282,48 @@ class AssertionContext:
             )
         return False
 
+    def _flush(self):
+        """Submit all buffered checks in a single AI call."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        results = self.scout._verify_batch([assertion for assertion, _ in pending])
+        for (_, message), result in zip(pending, results):
+            if not result.passed:
+                self.failures.append(message)
+
     def page_shows(self, description: str, timeout: float = 10.0):
-        try:
-            self.assertions.page_shows(description, timeout)
-        except AssertionError as e:
-            self.failures.append(str(e))
+        self._pending.append(
+            (
+                f"The page should show: {description}",
+                f"Page does not show: {description}",
+            )
+        )
 
     def no_errors(self, timeout: float = 5.0):
-        try:
-            self.assertions.no_errors(timeout)
-        except AssertionError as e:
-            self.failures.append(str(e))
+        self._pending.append(
+            (
+                "The page should not display any error messages, broken layouts, or crash screens",
+                "Errors detected on page",
+            )
+        )
+        # Console errors are captured locally and cost nothing to check
+        if self.scout.context.has_critical_errors():
+            errors = self.scout.context.get_critical_errors()
+            self.failures.append(f"Critical console errors: {errors[:3]}")
 
     def element_visible(self, description: str, timeout: float = 10.0):
-        try:
-            self.assertions.element_visible(description, timeout)
-        except AssertionError as e:
-            self.failures.append(str(e))
+        self._pending.append(
+            (
+                f"An element matching '{description}' should be visible on the page",
+                f"Element not visible: {description}",
+            )
+        )
 
     def text_present(self, text: str, timeout: float = 10.0):
-        try:
-            self.assertions.text_present(text, timeout)
-        except AssertionError as e:
-            self.failures.append(str(e))
+        self._pending.append(
+            (
+                f"The text '{text}' should be visible somewhere on the page",
+                f"Text not found: {text}",
+            )
+        )
@@ -38,14 +38,50 @@ Directory structure:
             └── details.json
 """
 
+import gzip
+import hashlib
+import html
 import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# Thousands of ActionRecord/TimelineEvent instances accumulate per session;
+# slotted dataclasses roughly halve their memory footprint. dataclass(slots=True)
+# needs Python 3.10+, so older interpreters keep the plain layout.
+_SLOTS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Shared encoder for event/record lines. json.dumps with non-default options
+# constructs a fresh JSONEncoder per call; binding one instance's encode
+# avoids that, and compact separators shrink the JSONL output.
+_encode_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+# Severity -> badge color for the HTML report
+_SEVERITY_COLORS = {
+    "critical": "#dc2626",
+    "high": "#ea580c",
+    "medium": "#ca8a04",
+    "low": "#16a34a",
+    "info": "#6b7280",
+}
+
+
+# Field order of the compact element tuples the explorer hands to
+# start_action; expanded back to dicts only when encoding to disk
+_ELEMENT_FIELDS = ("ai_id", "tag", "text", "type", "visible", "aria_label")
+
+
+def _elements_to_dicts(elements: List[Any]) -> List[Dict[str, Any]]:
+    """Expand compact element tuples to the on-disk dict schema."""
+    return [e if isinstance(e, dict) else dict(zip(_ELEMENT_FIELDS, e)) for e in elements]
+
+
+@dataclass(**_SLOTS_KWARGS)
 class ActionRecord:
     """Record of a single action during exploration."""
 
@@ -53,6 +89,10 @@ class ActionRecord:
     timestamp: datetime
     url: str
 
+    # Pre-formatted at record time; reused for directory names and report rows
+    action_number_str: str = ""
+    timestamp_hms: str = ""
+
     # Screenshots
     screenshot_clean: Optional[bytes] = None
     screenshot_marked: Optional[bytes] = None
@@ -61,13 +101,16 @@ class ActionRecord:
     ai_prompt: str = ""
     ai_response_raw: str = ""
     ai_response_parsed: Optional[Dict[str, Any]] = None
+    ai_response_parsed_json: Optional[str] = None  # encoded once at record time
 
     # Elements visible to AI
-    visible_elements: List[Dict[str, Any]] = field(default_factory=list)
+    visible_elements: List[Any] = field(default_factory=list)
+    visible_elements_json: bytes = b"[]"  # encoded once at start_action time
 
     # Decision made
     decision: Optional[Dict[str, Any]] = None
     decision_reason: str = ""
+    decision_reason_html: str = ""  # escaped once at record time for the report
 
     # State
     depth: int = 0
@@ -82,7 +125,7 @@ class ActionRecord:
     model_used: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS_KWARGS)
 class TimelineEvent:
     """A single event in the exploration timeline."""
 
@@ -100,6 +143,158 @@ class TimelineEvent:
         }
 
 
+# Templates for the HTML summary report. Kept at module level so the row
+# builders do one .format() per row instead of re-interpolating a ~4KB
+# f-string per save.
+_ACTION_ROW_TMPL = """
+                <tr>
+                    <td>{num}</td>
+                    <td>{time}</td>
+                    <td>{decision_type}</td>
+                    <td>{reason}...</td>
+                    <td style="color: {status_color}">{status}</td>
+                    <td><a href="actions/{num}/">View</a></td>
+                </tr>
+            """
+
+_BUG_ROW_TMPL = """
+                <tr>
+                    <td><span style="background:{color};color:white;padding:2px 8px;border-radius:4px">{severity}</span></td>
+                    <td>{title}</td>
+                    <td>{description}...</td>
+                    <td><a href="bugs/bug_{num}/">View</a></td>
+                </tr>
+            """
+
+_HTML_HEAD_TMPL = """<!DOCTYPE html>
+<html>
+<head>
+    <title>TestScout Audit Trail - {session_id}</title>
+    <style>
+        body {{ font-family: system-ui, sans-serif; margin: 40px; background: #f5f5f5; }}
+        .container {{ max-width: 1400px; margin: 0 auto; }}
+        .card {{ background: white; padding: 24px; border-radius: 8px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); margin-bottom: 24px; }}
+        h1 {{ color: #1f2937; margin: 0 0 8px 0; }}
+        h2 {{ color: #374151; margin: 24px 0 16px 0; }}
+        .subtitle {{ color: #6b7280; margin-bottom: 24px; }}
+        .stats {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 16px; margin: 24px 0; }}
+        .stat {{ background: #f9fafb; padding: 16px; border-radius: 8px; text-align: center; }}
+        .stat-value {{ font-size: 2em; font-weight: bold; color: #4f46e5; }}
+        .stat-label {{ color: #6b7280; font-size: 0.9em; }}
+        table {{ width: 100%; border-collapse: collapse; margin-top: 16px; }}
+        th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #e5e7eb; }}
+        th {{ background: #f9fafb; font-weight: 600; }}
+        a {{ color: #4f46e5; text-decoration: none; }}
+        a:hover {{ text-decoration: underline; }}
+        .severity-critical {{ background: #dc2626; }}
+        .severity-high {{ background: #ea580c; }}
+        .severity-medium {{ background: #ca8a04; }}
+        .severity-low {{ background: #16a34a; }}
+        .severity-info {{ background: #6b7280; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="card">
+            <h1>TestScout Audit Trail</h1>
+            <p class="subtitle">
+                Session: {session_id}<br>
+                URL: <a href="{start_url}">{start_url}</a><br>
+                Generated: {generated}
+            </p>
+
+            <div class="stats">
+                <div class="stat">
+                    <div class="stat-value">{total_actions}</div>
+                    <div class="stat-label">Actions Taken</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{total_bugs}</div>
+                    <div class="stat-label">Bugs Found</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{duration:.0f}s</div>
+                    <div class="stat-label">Duration</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{network_failures}</div>
+                    <div class="stat-label">Network Errors</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{console_errors}</div>
+                    <div class="stat-label">Console Errors</div>
+                </div>
+            </div>
+
+            <div class="stats">
+                <div class="stat">
+                    <div class="stat-value" style="color: #dc2626">{critical}</div>
+                    <div class="stat-label">Critical</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value" style="color: #ea580c">{high}</div>
+                    <div class="stat-label">High</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value" style="color: #ca8a04">{medium}</div>
+                    <div class="stat-label">Medium</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value" style="color: #16a34a">{low}</div>
+                    <div class="stat-label">Low</div>
+                </div>
+            </div>
+        </div>
+
+        <div class="card">
+            <h2>Bugs Found</h2>
+            <table>
+                <tr>
+                    <th>Severity</th>
+                    <th>Title</th>
+                    <th>Description</th>
+                    <th>Details</th>
+                </tr>
+                """
+
+_HTML_MID = """
+            </table>
+        </div>
+
+        <div class="card">
+            <h2>Action Timeline</h2>
+            <table>
+                <tr>
+                    <th>#</th>
+                    <th>Time</th>
+                    <th>Action</th>
+                    <th>Reason</th>
+                    <th>Result</th>
+                    <th>Details</th>
+                </tr>
+                """
+
+_HTML_TAIL = """
+            </table>
+        </div>
+
+        <div class="card">
+            <h2>Files</h2>
+            <ul>
+                <li><a href="summary.json">summary.json</a> - Machine-readable summary</li>
+                <li><a href="{timeline_name}">{timeline_name}</a> - Full event timeline</li>
+                <li><a href="network/">network/</a> - Network request logs</li>
+                <li><a href="console/">console/</a> - Console output logs</li>
+                <li><a href="actions/">actions/</a> - Per-action details with screenshots</li>
+                <li><a href="bugs/">bugs/</a> - Bug details with screenshots</li>
+            </ul>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+
 class AuditTrail:
     """
     Captures complete audit trail of an exploration session.
@@ -117,7 +312,39 @@ class AuditTrail:
         audit.save("./exploration_output")
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        screenshot_compression: str = "store",
+        screenshot_format: str = "png",
+        stream_to: Optional[str] = None,
+        compress_jsonl: bool = False,
+    ):
+        """
+        Args:
+            screenshot_compression: "store" writes screenshot bytes verbatim
+                (default). "fast" re-encodes PNGs at zlib level 1 before
+                writing - Playwright captures at the expensive default level 6,
+                and Deflate effort dominates screenshot save time. Requires
+                Pillow; silently falls back to "store" if unavailable.
+            screenshot_format: "png" (default) keeps the captured format.
+                "webp" re-encodes to lossless WebP at the fastest method,
+                which is much cheaper than Deflate at a similar size.
+                Requires Pillow; falls back to PNG if unavailable.
+            stream_to: Optional directory. When set, timeline, network and
+                console events are appended to timeline.jsonl,
+                network/requests.jsonl and console/all.jsonl as they are
+                recorded instead of being flushed in one large stall at
+                save() time. Events remain available live (e.g. for tailing
+                during a long exploration) and survive a crash mid-session.
+            compress_jsonl: When True, the JSONL artifacts written at save()
+                time are gzip-compressed at level 1 (the speed profile) and
+                get a .jsonl.gz suffix. Long sessions produce tens of MBs of
+                highly repetitive JSONL, so this trades a little CPU for much
+                less disk I/O. Streamed files (stream_to) stay uncompressed.
+        """
+        self.screenshot_compression = screenshot_compression
+        self.screenshot_format = screenshot_format
+        self.compress_jsonl = compress_jsonl
         self.session_id: str = ""
         self.start_url: str = ""
         self.start_time: Optional[datetime] = None
@@ -137,6 +364,61 @@ class AuditTrail:
 
         self._current_action: Optional[ActionRecord] = None
         self._action_counter: int = 0
+        self._ts_cache: "tuple[float, str]" = (0.0, "")
+
+        # Incremental summary counters - kept up to date in complete_action/
+        # record_bug so the summary writers don't re-scan the full lists.
+        self._successful_actions: int = 0
+        self._failed_actions: int = 0
+        self._bugs_by_severity: Dict[str, int] = {}
+
+        self._stream_dir: Optional[Path] = None
+        self._timeline_fh = None
+        self._network_fh = None
+        self._console_fh = None
+        if stream_to:
+            self._stream_dir = Path(stream_to)
+            (self._stream_dir / "network").mkdir(parents=True, exist_ok=True)
+            (self._stream_dir / "console").mkdir(parents=True, exist_ok=True)
+            self._timeline_fh = open(self._stream_dir / "timeline.jsonl", "a")
+            self._network_fh = open(self._stream_dir / "network" / "requests.jsonl", "a")
+            self._console_fh = open(self._stream_dir / "console" / "all.jsonl", "a")
+
+    def close(self):
+        """Flush and close the streaming JSONL handles, if any.
+
+        Idempotent; called from save() when the trail streams to the
+        output directory, and safe to call directly for trails that are
+        discarded without saving.
+        """
+        for name in ("_timeline_fh", "_network_fh", "_console_fh"):
+            fh = getattr(self, name)
+            if fh is not None:
+                setattr(self, name, None)
+                try:
+                    fh.close()
+                except OSError:
+                    pass
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _now_iso(self) -> str:
+        """ISO timestamp string, cached per millisecond.
+
+        record_network_request/record_console_log can fire thousands of times
+        per second; events within the same millisecond share a timestamp, so
+        re-running isoformat() for each one is wasted allocation.
+        """
+        t = time.time()
+        if t - self._ts_cache[0] < 0.001:
+            return self._ts_cache[1]
+        s = datetime.fromtimestamp(t).isoformat()
+        self._ts_cache = (t, s)
+        return s
 
     def start_session(self, start_url: str):
         """Begin a new audit session."""
@@ -152,9 +434,9 @@ class AuditTrail:
         self._add_timeline_event(
             "session_end",
             {
-                "duration_seconds": (self.end_time - self.start_time).total_seconds()
-                if self.start_time
-                else 0,
+                "duration_seconds": (
+                    (self.end_time - self.start_time).total_seconds() if self.start_time else 0
+                ),
                 "total_actions": len(self.actions),
                 "total_bugs": len(self.bugs),
             },
@@ -165,7 +447,7 @@ class AuditTrail:
         url: str,
         screenshot_clean: Optional[bytes] = None,
         screenshot_marked: Optional[bytes] = None,
-        visible_elements: Optional[List[Dict[str, Any]]] = None,
+        visible_elements: Optional[List[Any]] = None,
         depth: int = 0,
         action_history: Optional[List[str]] = None,
     ) -> int:
@@ -177,13 +459,23 @@ class AuditTrail:
         self._action_counter += 1
         action_num = self._action_counter
 
+        now = datetime.now()
         self._current_action = ActionRecord(
             action_number=action_num,
-            timestamp=datetime.now(),
+            timestamp=now,
             url=url,
+            action_number_str=f"{action_num:03d}",
+            # Manual formatting beats strftime, which routes through libc
+            # locale handling on every call
+            timestamp_hms=f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}",
             screenshot_clean=screenshot_clean,
             screenshot_marked=screenshot_marked,
             visible_elements=visible_elements or [],
+            # Encode once here, off the save critical path - for pages with
+            # hundreds of elements this is most of the per-action save CPU.
+            visible_elements_json=json.dumps(
+                _elements_to_dicts(visible_elements or []), indent=2
+            ).encode("utf-8"),
             depth=depth,
             action_history=list(action_history or []),
         )
@@ -206,12 +498,18 @@ class AuditTrail:
         if self._current_action:
             self._current_action.ai_response_raw = raw_response
             self._current_action.ai_response_parsed = parsed_response
+            self._current_action.ai_response_parsed_json = (
+                _encode_json(parsed_response) if parsed_response is not None else None
+            )
 
-    def record_decision(self, decision: Dict[str, Any], reason: str = "", model_used: Optional[str] = None):
+    def record_decision(
+        self, decision: Dict[str, Any], reason: str = "", model_used: Optional[str] = None
+    ):
         """Record the decision made based on AI response."""
         if self._current_action:
             self._current_action.decision = decision
             self._current_action.decision_reason = reason
+            self._current_action.decision_reason_html = html.escape(reason[:50])
             if model_used:
                 self._current_action.model_used = model_used
 
@@ -234,6 +532,10 @@ class AuditTrail:
             self._current_action.duration_ms = duration_ms
 
             self.actions.append(self._current_action)
+            if success:
+                self._successful_actions += 1
+            else:
+                self._failed_actions += 1
 
             self._add_timeline_event(
                 "action_complete",
@@ -273,10 +575,14 @@ class AuditTrail:
             "screenshot": screenshot,  # Will be saved separately
             "console_errors": console_errors or [],
             "network_errors": network_errors or [],
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._now_iso(),
             "action_number": self._current_action.action_number if self._current_action else None,
+            # Escaped once here so the HTML report doesn't re-escape on every save
+            "title_html": html.escape(title),
+            "description_html": html.escape(description[:100]),
         }
         self.bugs.append(bug_data)
+        self._bugs_by_severity[severity] = self._bugs_by_severity.get(severity, 0) + 1
 
         self._add_timeline_event(
             "bug_found",
@@ -310,9 +616,11 @@ class AuditTrail:
             "status": status,
             "failed": failed,
             "failure_reason": failure_reason,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._now_iso(),
         }
         self.network_requests.append(request_data)
+        if self._network_fh:
+            self._network_fh.write(_encode_json(request_data) + "\n")
 
         if failed or (status and status >= 400):
             self.network_failures.append(request_data)
@@ -330,9 +638,11 @@ class AuditTrail:
             "text": text,
             "source": source,
             "line": line,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._now_iso(),
         }
         self.console_all.append(log_data)
+        if self._console_fh:
+            self._console_fh.write(_encode_json(log_data) + "\n")
 
         if level == "error":
             self.console_errors.append(log_data)
@@ -346,14 +656,15 @@ class AuditTrail:
         action_number: Optional[int] = None,
     ):
         """Add an event to the timeline."""
-        self.timeline.append(
-            TimelineEvent(
-                timestamp=datetime.now(),
-                event_type=event_type,
-                action_number=action_number,
-                data=data,
-            )
+        event = TimelineEvent(
+            timestamp=datetime.now(),
+            event_type=event_type,
+            action_number=action_number,
+            data=data,
         )
+        self.timeline.append(event)
+        if self._timeline_fh:
+            self._timeline_fh.write(_encode_json(event.to_dict()) + "\n")
 
     def save(self, output_dir: str):
         """
@@ -366,63 +677,167 @@ class AuditTrail:
         base_path = Path(output_dir)
         base_path.mkdir(parents=True, exist_ok=True)
 
+        # When streaming to the same directory, the streamed files are
+        # already on disk - close them instead of rewriting. save() is the
+        # terminal operation for a trail, so the handles are released here
+        # rather than leaked; events recorded afterwards still land in the
+        # in-memory lists.
+        streaming_here = self._stream_dir is not None and self._stream_dir == base_path
+        if streaming_here:
+            self.close()
+
         # Save summary files
         self._save_summary_json(base_path / "summary.json")
         self._save_summary_html(base_path / "summary.html")
-        self._save_timeline(base_path / "timeline.jsonl")
+        if not streaming_here:
+            self._save_timeline(base_path / "timeline.jsonl")
 
-        # Save action details
+        # Save action details (parallel - file I/O releases the GIL, so
+        # overlapping the per-action write syscalls is a big win for
+        # sessions with hundreds of actions). All directories are created in
+        # one batched pass up front so workers only ever open files.
         actions_dir = base_path / "actions"
-        for action in self.actions:
-            self._save_action(actions_dir, action)
+        if self.actions:
+            actions_dir.mkdir(parents=True, exist_ok=True)
+            for action in self.actions:
+                (actions_dir / action.action_number_str).mkdir(exist_ok=True)
+            with ThreadPoolExecutor(max_workers=min(32, len(self.actions))) as pool:
+                for future in [
+                    pool.submit(self._save_action, actions_dir, a) for a in self.actions
+                ]:
+                    future.result()
 
         # Save network logs
         network_dir = base_path / "network"
         network_dir.mkdir(parents=True, exist_ok=True)
-        self._save_jsonl(network_dir / "requests.jsonl", self.network_requests)
+        if not streaming_here:
+            self._save_jsonl(network_dir / "requests.jsonl", self.network_requests)
         self._save_jsonl(network_dir / "failures.jsonl", self.network_failures)
 
         # Save console logs
         console_dir = base_path / "console"
         console_dir.mkdir(parents=True, exist_ok=True)
-        self._save_jsonl(console_dir / "all.jsonl", self.console_all)
+        if not streaming_here:
+            self._save_jsonl(console_dir / "all.jsonl", self.console_all)
         self._save_jsonl(console_dir / "errors.jsonl", self.console_errors)
         self._save_jsonl(console_dir / "warnings.jsonl", self.console_warnings)
 
-        # Save bugs
+        # Save bugs (parallel, same reasoning as actions). Bugs found on the
+        # same page often carry byte-identical screenshots, so duplicates are
+        # detected by content hash up front and hardlinked to the first copy
+        # instead of being encoded and written again.
         bugs_dir = base_path / "bugs"
-        for bug in self.bugs:
-            self._save_bug(bugs_dir, bug)
+        if self.bugs:
+            bugs_dir.mkdir(parents=True, exist_ok=True)
+            seen_screenshots: Dict[str, Path] = {}
+            duplicate_links: List["tuple[Path, Path]"] = []
+            for bug in self.bugs:
+                bug_dir = bugs_dir / f"bug_{bug['bug_number']:03d}"
+                bug_dir.mkdir(exist_ok=True)
+                screenshot = bug.get("screenshot")
+                if screenshot:
+                    digest = hashlib.sha256(screenshot).hexdigest()
+                    first_dir = seen_screenshots.setdefault(digest, bug_dir)
+                    if first_dir is not bug_dir:
+                        bug.pop("screenshot")
+                        duplicate_links.append((first_dir, bug_dir))
+            with ThreadPoolExecutor(max_workers=min(32, len(self.bugs))) as pool:
+                for future in [pool.submit(self._save_bug, bugs_dir, b) for b in self.bugs]:
+                    future.result()
+            for first_dir, dup_dir in duplicate_links:
+                for src in first_dir.glob("screenshot.*"):
+                    dst = dup_dir / src.name
+                    try:
+                        os.link(src, dst)
+                    except OSError:
+                        # Cross-device or unsupported filesystem - fall back
+                        # to a plain copy
+                        dst.write_bytes(src.read_bytes())
+
+    @staticmethod
+    def _recompress_png(data: bytes, level: int = 1) -> bytes:
+        """Re-encode a PNG at a cheap zlib level. Returns input unchanged if
+        Pillow is not installed or the data cannot be decoded."""
+        try:
+            import io
+
+            from PIL import Image
+
+            out = io.BytesIO()
+            Image.open(io.BytesIO(data)).save(out, "PNG", compress_level=level)
+            return out.getvalue()
+        except Exception:
+            return data
+
+    @staticmethod
+    def _encode_webp(data: bytes) -> Optional[bytes]:
+        """Re-encode a screenshot as lossless WebP at the fastest method.
+        Returns None if Pillow is not installed or the data cannot be decoded."""
+        try:
+            import io
+
+            from PIL import Image
+
+            out = io.BytesIO()
+            Image.open(io.BytesIO(data)).save(out, "WEBP", lossless=True, quality=0, method=0)
+            return out.getvalue()
+        except Exception:
+            return None
+
+    def _encode_screenshot(self, data: bytes) -> "tuple[bytes, str]":
+        """Apply the configured format/compression. Returns (bytes, extension)."""
+        if self.screenshot_format == "webp":
+            encoded = self._encode_webp(data)
+            if encoded is not None:
+                return encoded, "webp"
+        if self.screenshot_compression == "fast":
+            data = self._recompress_png(data)
+        return data, "png"
+
+    @staticmethod
+    def _write_bytes(path: Path, data: bytes):
+        """Write a one-shot byte blob via os.open/os.write.
+
+        Skips the buffered file-object machinery entirely - these files are
+        written once in full, so the buffering layer only adds an extra copy
+        and object churn per file.
+        """
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+    def _write_screenshot(self, directory: Path, stem: str, data: bytes):
+        """Encode and write a screenshot blob in one syscall."""
+        data, ext = self._encode_screenshot(data)
+        self._write_bytes(directory / f"{stem}.{ext}", data)
 
     def _save_action(self, actions_dir: Path, action: ActionRecord):
-        """Save a single action's data."""
-        action_dir = actions_dir / f"{action.action_number:03d}"
-        action_dir.mkdir(parents=True, exist_ok=True)
+        """Save a single action's data. The directory is pre-created by save()."""
+        action_dir = actions_dir / action.action_number_str
 
         # Save screenshots
         if action.screenshot_clean:
-            with open(action_dir / "screenshot.png", "wb") as f:
-                f.write(action.screenshot_clean)
+            self._write_screenshot(action_dir, "screenshot", action.screenshot_clean)
 
         if action.screenshot_marked:
-            with open(action_dir / "screenshot_marked.png", "wb") as f:
-                f.write(action.screenshot_marked)
+            self._write_screenshot(action_dir, "screenshot_marked", action.screenshot_marked)
 
         # Save visible elements
-        with open(action_dir / "visible_elements.json", "w") as f:
-            json.dump(action.visible_elements, f, indent=2)
+        self._write_bytes(action_dir / "visible_elements.json", action.visible_elements_json)
 
         # Save AI prompt
-        with open(action_dir / "ai_prompt.txt", "w") as f:
-            f.write(action.ai_prompt)
-
-        # Save AI response
-        ai_response_data = {
-            "raw": action.ai_response_raw,
-            "parsed": action.ai_response_parsed,
-        }
-        with open(action_dir / "ai_response.json", "w") as f:
-            json.dump(ai_response_data, f, indent=2)
+        self._write_bytes(action_dir / "ai_prompt.txt", action.ai_prompt.encode("utf-8"))
+
+        # Save AI response - the parsed dict was encoded once at record time,
+        # so the file is assembled from prebuilt fragments instead of
+        # re-serializing the dict on every save
+        ai_response = '{"raw": %s, "parsed": %s}' % (
+            _encode_json(action.ai_response_raw),
+            action.ai_response_parsed_json or "null",
+        )
+        self._write_bytes(action_dir / "ai_response.json", ai_response.encode("utf-8"))
 
         # Save decision
         decision_data = {
@@ -433,8 +848,9 @@ class AuditTrail:
             "duration_ms": action.duration_ms,
             "model_used": action.model_used,
         }
-        with open(action_dir / "decision.json", "w") as f:
-            json.dump(decision_data, f, indent=2)
+        self._write_bytes(
+            action_dir / "decision.json", json.dumps(decision_data, indent=2).encode("utf-8")
+        )
 
         # Save state
         state_data = {
@@ -444,23 +860,22 @@ class AuditTrail:
             "depth": action.depth,
             "action_history": action.action_history,
         }
-        with open(action_dir / "state.json", "w") as f:
-            json.dump(state_data, f, indent=2)
+        self._write_bytes(
+            action_dir / "state.json", json.dumps(state_data, indent=2).encode("utf-8")
+        )
 
     def _save_bug(self, bugs_dir: Path, bug: Dict[str, Any]):
-        """Save a single bug's data."""
+        """Save a single bug's data. The directory is pre-created by save()."""
         bug_dir = bugs_dir / f"bug_{bug['bug_number']:03d}"
-        bug_dir.mkdir(parents=True, exist_ok=True)
 
         # Save screenshot if present
         screenshot = bug.pop("screenshot", None)
         if screenshot:
-            with open(bug_dir / "screenshot.png", "wb") as f:
-                f.write(screenshot)
+            self._write_screenshot(bug_dir, "screenshot", screenshot)
 
-        # Save details
-        with open(bug_dir / "details.json", "w") as f:
-            json.dump(bug, f, indent=2)
+        # Save details (presentation-only *_html fields stay out of the JSON)
+        details = {k: v for k, v in bug.items() if not k.endswith("_html")}
+        self._write_bytes(bug_dir / "details.json", json.dumps(details, indent=2).encode("utf-8"))
 
     def _save_summary_json(self, filepath: Path):
         """Save JSON summary."""
@@ -475,8 +890,8 @@ class AuditTrail:
                 else None
             ),
             "total_actions": len(self.actions),
-            "successful_actions": sum(1 for a in self.actions if a.success),
-            "failed_actions": sum(1 for a in self.actions if not a.success),
+            "successful_actions": self._successful_actions,
+            "failed_actions": self._failed_actions,
             "total_bugs": len(self.bugs),
             "bugs_by_severity": self._count_bugs_by_severity(),
             "network_requests": len(self.network_requests),
@@ -496,192 +911,92 @@ class AuditTrail:
         )
         bugs_by_severity = self._count_bugs_by_severity()
 
-        # Build action timeline HTML
+        # Build action timeline rows
         action_rows = []
         for action in self.actions:
-            status = "success" if action.success else "failed"
-            status_color = "#22c55e" if action.success else "#ef4444"
-            decision_type = (
-                action.decision.get("action", "unknown") if action.decision else "unknown"
-            )
             action_rows.append(
-                f"""
-                <tr>
-                    <td>{action.action_number:03d}</td>
-                    <td>{action.timestamp.strftime("%H:%M:%S")}</td>
-                    <td>{decision_type}</td>
-                    <td>{action.decision_reason[:50] if action.decision_reason else ""}...</td>
-                    <td style="color: {status_color}">{status}</td>
-                    <td><a href="actions/{action.action_number:03d}/">View</a></td>
-                </tr>
-            """
+                _ACTION_ROW_TMPL.format(
+                    num=action.action_number_str,
+                    time=action.timestamp_hms,
+                    decision_type=html.escape(
+                        action.decision.get("action", "unknown") if action.decision else "unknown"
+                    ),
+                    reason=action.decision_reason_html,
+                    status_color="#22c55e" if action.success else "#ef4444",
+                    status="success" if action.success else "failed",
+                )
             )
 
         # Build bug rows
         bug_rows = []
         for bug in self.bugs:
             severity = bug.get("severity", "info")
-            severity_colors = {
-                "critical": "#dc2626",
-                "high": "#ea580c",
-                "medium": "#ca8a04",
-                "low": "#16a34a",
-                "info": "#6b7280",
-            }
-            color = severity_colors.get(severity, "#6b7280")
             bug_rows.append(
-                f"""
-                <tr>
-                    <td><span style="background:{color};color:white;padding:2px 8px;border-radius:4px">{severity.upper()}</span></td>
-                    <td>{bug.get("title", "Unknown")}</td>
-                    <td>{bug.get("description", "")[:100]}...</td>
-                    <td><a href="bugs/bug_{bug['bug_number']:03d}/">View</a></td>
-                </tr>
-            """
+                _BUG_ROW_TMPL.format(
+                    color=_SEVERITY_COLORS.get(severity, "#6b7280"),
+                    severity=severity.upper(),
+                    title=bug.get("title_html", "Unknown"),
+                    description=bug.get("description_html", ""),
+                    num=f"{bug['bug_number']:03d}",
+                )
             )
 
-        html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>TestScout Audit Trail - {self.session_id}</title>
-    <style>
-        body {{ font-family: system-ui, sans-serif; margin: 40px; background: #f5f5f5; }}
-        .container {{ max-width: 1400px; margin: 0 auto; }}
-        .card {{ background: white; padding: 24px; border-radius: 8px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); margin-bottom: 24px; }}
-        h1 {{ color: #1f2937; margin: 0 0 8px 0; }}
-        h2 {{ color: #374151; margin: 24px 0 16px 0; }}
-        .subtitle {{ color: #6b7280; margin-bottom: 24px; }}
-        .stats {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 16px; margin: 24px 0; }}
-        .stat {{ background: #f9fafb; padding: 16px; border-radius: 8px; text-align: center; }}
-        .stat-value {{ font-size: 2em; font-weight: bold; color: #4f46e5; }}
-        .stat-label {{ color: #6b7280; font-size: 0.9em; }}
-        table {{ width: 100%; border-collapse: collapse; margin-top: 16px; }}
-        th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #e5e7eb; }}
-        th {{ background: #f9fafb; font-weight: 600; }}
-        a {{ color: #4f46e5; text-decoration: none; }}
-        a:hover {{ text-decoration: underline; }}
-        .severity-critical {{ background: #dc2626; }}
-        .severity-high {{ background: #ea580c; }}
-        .severity-medium {{ background: #ca8a04; }}
-        .severity-low {{ background: #16a34a; }}
-        .severity-info {{ background: #6b7280; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="card">
-            <h1>TestScout Audit Trail</h1>
-            <p class="subtitle">
-                Session: {self.session_id}<br>
-                URL: <a href="{self.start_url}">{self.start_url}</a><br>
-                Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-            </p>
-
-            <div class="stats">
-                <div class="stat">
-                    <div class="stat-value">{len(self.actions)}</div>
-                    <div class="stat-label">Actions Taken</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-value">{len(self.bugs)}</div>
-                    <div class="stat-label">Bugs Found</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-value">{duration:.0f}s</div>
-                    <div class="stat-label">Duration</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-value">{len(self.network_failures)}</div>
-                    <div class="stat-label">Network Errors</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-value">{len(self.console_errors)}</div>
-                    <div class="stat-label">Console Errors</div>
-                </div>
-            </div>
-
-            <div class="stats">
-                <div class="stat">
-                    <div class="stat-value" style="color: #dc2626">{bugs_by_severity.get("critical", 0)}</div>
-                    <div class="stat-label">Critical</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-value" style="color: #ea580c">{bugs_by_severity.get("high", 0)}</div>
-                    <div class="stat-label">High</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-value" style="color: #ca8a04">{bugs_by_severity.get("medium", 0)}</div>
-                    <div class="stat-label">Medium</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-value" style="color: #16a34a">{bugs_by_severity.get("low", 0)}</div>
-                    <div class="stat-label">Low</div>
-                </div>
-            </div>
-        </div>
-
-        <div class="card">
-            <h2>Bugs Found</h2>
-            <table>
-                <tr>
-                    <th>Severity</th>
-                    <th>Title</th>
-                    <th>Description</th>
-                    <th>Details</th>
-                </tr>
-                {"".join(bug_rows) if bug_rows else "<tr><td colspan='4'>No bugs found</td></tr>"}
-            </table>
-        </div>
-
-        <div class="card">
-            <h2>Action Timeline</h2>
-            <table>
-                <tr>
-                    <th>#</th>
-                    <th>Time</th>
-                    <th>Action</th>
-                    <th>Reason</th>
-                    <th>Result</th>
-                    <th>Details</th>
-                </tr>
-                {"".join(action_rows) if action_rows else "<tr><td colspan='6'>No actions taken</td></tr>"}
-            </table>
-        </div>
+        head = _HTML_HEAD_TMPL.format(
+            session_id=html.escape(self.session_id),
+            start_url=html.escape(self.start_url),
+            generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            total_actions=len(self.actions),
+            total_bugs=len(self.bugs),
+            duration=duration,
+            network_failures=len(self.network_failures),
+            console_errors=len(self.console_errors),
+            critical=bugs_by_severity.get("critical", 0),
+            high=bugs_by_severity.get("high", 0),
+            medium=bugs_by_severity.get("medium", 0),
+            low=bugs_by_severity.get("low", 0),
+        )
 
-        <div class="card">
-            <h2>Files</h2>
-            <ul>
-                <li><a href="summary.json">summary.json</a> - Machine-readable summary</li>
-                <li><a href="timeline.jsonl">timeline.jsonl</a> - Full event timeline</li>
-                <li><a href="network/">network/</a> - Network request logs</li>
-                <li><a href="console/">console/</a> - Console output logs</li>
-                <li><a href="actions/">actions/</a> - Per-action details with screenshots</li>
-                <li><a href="bugs/">bugs/</a> - Bug details with screenshots</li>
-            </ul>
-        </div>
-    </div>
-</body>
-</html>
-"""
+        # Stream sections to the file instead of joining everything into one
+        # giant string first; with hundreds of rows the single mega-string
+        # costs repeated large reallocations.
         with open(filepath, "w") as f:
-            f.write(html)
+            f.write(head)
+            if bug_rows:
+                f.writelines(bug_rows)
+            else:
+                f.write("<tr><td colspan='4'>No bugs found</td></tr>")
+            f.write(_HTML_MID)
+            if action_rows:
+                f.writelines(action_rows)
+            else:
+                f.write("<tr><td colspan='6'>No actions taken</td></tr>")
+            timeline_name = "timeline.jsonl.gz" if self.compress_jsonl else "timeline.jsonl"
+            f.write(_HTML_TAIL.format(timeline_name=timeline_name))
 
     def _save_timeline(self, filepath: Path):
         """Save timeline as JSONL."""
-        with open(filepath, "w") as f:
-            for event in self.timeline:
-                f.write(json.dumps(event.to_dict()) + "\n")
+        self._save_jsonl(filepath, [event.to_dict() for event in self.timeline])
 
     def _save_jsonl(self, filepath: Path, data: List[Dict[str, Any]]):
-        """Save a list of dicts as JSONL."""
-        with open(filepath, "w") as f:
-            for item in data:
-                f.write(json.dumps(item) + "\n")
+        """Save a list of dicts as JSONL.
+
+        Lines are accumulated into one growable buffer and flushed with a
+        single write, rather than one buffered write per line. With
+        compress_jsonl the buffer is gzipped first and the file gets a
+        .gz suffix.
+        """
+        buf = bytearray()
+        for item in data:
+            buf += _encode_json(item).encode("utf-8")
+            buf += b"\n"
+        if self.compress_jsonl:
+            self._write_bytes(
+                filepath.with_suffix(filepath.suffix + ".gz"),
+                gzip.compress(bytes(buf), compresslevel=1),
+            )
+        else:
+            self._write_bytes(filepath, buf)
 
     def _count_bugs_by_severity(self) -> Dict[str, int]:
-        """Count bugs grouped by severity."""
-        counts: Dict[str, int] = {}
-        for bug in self.bugs:
-            severity = bug.get("severity", "info")
-            counts[severity] = counts.get(severity, 0) + 1
-        return counts
+        """Count bugs grouped by severity (maintained incrementally in record_bug)."""
+        return self._bugs_by_severity
@@ -0,0 +1,50 @@
+"""
+Content-addressed cache for vision call results.
+
+Reruns and retries frequently re-ask the same question about a
+pixel-identical screenshot; without a cache every one of those repeats a
+multi-second API round-trip. Hashing the prompt and screenshot together
+(blake2b runs at GB/s, so the check is free next to the call it can save)
+turns exact repeats into microsecond hits.
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Optional
+
+
+class VisionCache:
+    """Thread-safe LRU cache with a per-entry TTL."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        """
+        Args:
+            maxsize: Entries beyond this evict the least recently used
+            ttl: Seconds before an entry is considered stale
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return the cached value, or None when absent or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.time() - stored_at > self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: bytes, value: Any):
+        """Store a value, evicting the least recently used past maxsize."""
+        with self._lock:
+            self._data[key] = (time.time(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
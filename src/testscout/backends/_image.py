@@ -0,0 +1,81 @@
+"""
+Screenshot preparation for vision API calls.
+
+Full-resolution browser screenshots (1080p and up) inflate vision token
+counts, latency, and cost - the image is usually the dominant part of the
+payload. Downscaling to a pixel budget before sending cuts all three
+roughly in proportion to the pixel count.
+
+Requires Pillow; silently returns the input unchanged if it is not
+installed, mirroring the optional screenshot handling in audit.py.
+"""
+
+import base64
+from io import BytesIO
+from typing import Optional, Tuple, Union
+
+PNG_MIME = "image/png"
+JPEG_MIME = "image/jpeg"
+
+# Screenshots are photographic-density UI renders; JPEG at this quality
+# is visually lossless to a vision model and 6-10x smaller than PNG
+_JPEG_QUALITY = 80
+
+
+def _sniff_mime(screenshot: Union[bytes, str]) -> str:
+    """Detect PNG vs JPEG from magic bytes (or their base64 prefixes)."""
+    if isinstance(screenshot, bytes):
+        if screenshot[:3] == b"\xff\xd8\xff":
+            return JPEG_MIME
+        return PNG_MIME
+    # base64 of the JPEG magic starts "/9j/", PNG's starts "iVBOR"
+    if screenshot.startswith("/9j/"):
+        return JPEG_MIME
+    return PNG_MIME
+
+
+def prepare_image_for_vision(
+    screenshot: Union[bytes, str],
+    max_side: Optional[int],
+) -> Tuple[Union[bytes, str], str]:
+    """
+    Downscale a screenshot so its longest side is at most max_side.
+
+    Downscaled images are re-encoded as JPEG: once the pixels are being
+    rewritten anyway, JPEG cuts the upload another several-fold over
+    PNG with no measurable effect on model answers.
+
+    Args:
+        screenshot: Screenshot as raw PNG bytes or a base64 string. Raw
+            bytes are cheaper - they skip a base64 decode/encode round-trip.
+        max_side: Pixel budget for the longest side; None disables scaling
+
+    Returns:
+        Tuple of (screenshot, mime_type) with the screenshot in the same
+        form it came in. The input is returned unchanged when no scaling is
+        needed or Pillow is unavailable.
+    """
+    mime = _sniff_mime(screenshot)
+    if not max_side:
+        return screenshot, mime
+
+    try:
+        from PIL import Image
+    except ImportError:
+        return screenshot, mime
+
+    try:
+        raw = screenshot if isinstance(screenshot, bytes) else base64.b64decode(screenshot)
+        img = Image.open(BytesIO(raw))
+        if max(img.size) <= max_side:
+            return screenshot, mime
+        img.thumbnail((max_side, max_side))
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        buf = BytesIO()
+        img.save(buf, format="JPEG", quality=_JPEG_QUALITY, optimize=True)
+        if isinstance(screenshot, bytes):
+            return buf.getvalue(), JPEG_MIME
+        return base64.b64encode(buf.getvalue()).decode("ascii"), JPEG_MIME
+    except Exception:
+        return screenshot, mime
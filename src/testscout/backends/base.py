@@ -5,11 +5,71 @@ This module defines the contract that all AI backends must implement.
 Backends can be swapped out to use different AI providers (Gemini, OpenAI, Claude, etc.)
 """
 
+import asyncio
+import hashlib
+import json
+import re
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from difflib import SequenceMatcher
 from enum import Enum
+from functools import partial
 from typing import Any, Dict, List, Optional
 
+# slots=True drops the per-instance __dict__ (plans and results are created
+# for every AI call), but the keyword only exists on Python 3.10+
+_SLOTS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# orjson parses typical model responses 2-5x faster than the stdlib codec
+# and matters most for large discover_elements arrays. Optional: the stdlib
+# is the fallback, and orjson.JSONDecodeError subclasses json.JSONDecodeError
+# so the error handling below covers both.
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Matches a fenced code block, with or without a "json" language tag
+_JSON_BLOCK = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+
+def _extract_json(text: str) -> Any:
+    """
+    Parse JSON out of a model response.
+
+    Tries the text as-is first (the common case with JSON output modes),
+    then the contents of a markdown code fence, then the outermost
+    brace/bracket span - models occasionally wrap JSON in prose despite
+    instructions. Raises json.JSONDecodeError when nothing parses, so a
+    wasted retry round-trip is only taken when there is genuinely no JSON.
+    """
+    text = text.strip()
+    try:
+        return _loads(text)
+    except json.JSONDecodeError:
+        pass
+
+    match = _JSON_BLOCK.search(text)
+    if match:
+        try:
+            return _loads(match.group(1))
+        except json.JSONDecodeError:
+            pass
+
+    for opener, closer in (("{", "}"), ("[", "]")):
+        start = text.find(opener)
+        end = text.rfind(closer)
+        if start != -1 and end > start:
+            try:
+                return _loads(text[start : end + 1])
+            except json.JSONDecodeError:
+                continue
+
+    raise json.JSONDecodeError("No JSON found in model response", text, 0)
+
 
 class ActionType(Enum):
     """Types of actions the AI can plan."""
@@ -24,7 +84,12 @@ class ActionType(Enum):
     NONE = "none"  # No action needed
 
 
-@dataclass
+# Value -> member lookup table: a dict hit is far cheaper than routing
+# unknown action strings through ActionType()'s ValueError path
+_ACTION_BY_STR = {a.value: a for a in ActionType}
+
+
+@dataclass(**_SLOTS_KWARGS)
 class ActionPlan:
     """Structured action plan from AI."""
 
@@ -35,15 +100,12 @@ class ActionPlan:
     duration_ms: Optional[int] = None  # For wait
     reason: str = ""  # Why this action
     confidence: float = 1.0
+    model_used: Optional[str] = None  # Which model produced this plan
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ActionPlan":
         """Create ActionPlan from dictionary response."""
-        action_str = data.get("action", "none").lower()
-        try:
-            action = ActionType(action_str)
-        except ValueError:
-            action = ActionType.NONE
+        action = _ACTION_BY_STR.get(data.get("action", "none").lower(), ActionType.NONE)
 
         return cls(
             action=action,
@@ -56,13 +118,102 @@ class ActionPlan:
         )
 
 
-@dataclass
+# --- Local instruction matching ---
+#
+# A large fraction of test steps are of the form "Click the login button"
+# against a page that has exactly one element labeled "Login". Resolving
+# those locally skips the multimodal API round-trip entirely - seconds
+# saved per step, the largest win available on this path.
+
+# Instructions the matcher will attempt: an unambiguous verb followed by a
+# target phrase. fill/type/select need a text payload and stay on the API.
+_LOCAL_VERBS = {
+    "click": ActionType.CLICK,
+    "press": ActionType.CLICK,
+    "tap": ActionType.CLICK,
+    "hover": ActionType.HOVER,
+}
+
+_LOCAL_INSTRUCTION = re.compile(
+    r"^\s*(?P<verb>click|press|tap|hover)(?:\s+(?:on|over))?(?:\s+the)?\s+(?P<target>.+?)[.!]?\s*$",
+    re.IGNORECASE,
+)
+
+# Generic trailing words users add to describe the element kind; stripped
+# so "login button" matches a button whose text is just "Login"
+_TYPE_WORDS = frozenset(
+    {"button", "link", "input", "field", "checkbox", "dropdown", "tab", "menu", "icon", "option"}
+)
+
+_MATCH_CUTOFF = 0.92
+
+
+def _normalize_label(text: str) -> str:
+    return " ".join(text.replace('"', " ").replace("'", " ").lower().split())
+
+
+def _try_local_match(instruction: str, elements) -> Optional[ActionPlan]:
+    """
+    Resolve an instruction against the element list without an API call.
+
+    Returns an ActionPlan only for a confident, unique hit: a recognized
+    verb, and exactly one visible enabled element whose text or aria label
+    matches the target phrase above the similarity cutoff. Anything
+    ambiguous returns None and falls through to the vision model.
+    """
+    if elements is None or not getattr(elements, "elements", None):
+        return None
+    parsed = _LOCAL_INSTRUCTION.match(instruction)
+    if parsed is None:
+        return None
+
+    action = _LOCAL_VERBS[parsed.group("verb").lower()]
+    target = _normalize_label(parsed.group("target"))
+    words = target.split()
+    if words and words[-1] in _TYPE_WORDS:
+        stripped = " ".join(words[:-1])
+    else:
+        stripped = target
+    if not stripped:
+        return None
+
+    best: Optional[ActionPlan] = None
+    hits = 0
+    for el in elements.elements:
+        if not (getattr(el, "is_visible", True) and getattr(el, "is_enabled", True)):
+            continue
+        score = 0.0
+        for label in (getattr(el, "text", ""), getattr(el, "aria_label", "")):
+            if not label:
+                continue
+            candidate = _normalize_label(label)
+            if candidate in (target, stripped):
+                score = 1.0
+                break
+            ratio = SequenceMatcher(None, stripped, candidate).ratio()
+            if ratio > score:
+                score = ratio
+        if score >= _MATCH_CUTOFF:
+            hits += 1
+            if hits > 1:
+                return None  # ambiguous - let the model disambiguate
+            best = ActionPlan(
+                action=action,
+                element_id=el.ai_id,
+                reason=f"Local match: element {el.ai_id} labeled like {stripped!r}",
+                confidence=score,
+            )
+    return best
+
+
+@dataclass(**_SLOTS_KWARGS)
 class AssertionResult:
     """Result of an AI assertion."""
 
     passed: bool
     reason: str
     confidence: float = 1.0
+    model_used: Optional[str] = None  # Which model produced this result
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AssertionResult":
@@ -80,6 +231,11 @@ class VisionBackend(ABC):
 
     Implement this interface to add support for new AI providers.
 
+    The screenshot_b64 arguments accept raw PNG bytes as well as base64
+    strings; the built-in backends only base64-encode at the last step
+    (or not at all, for SDKs that take bytes), so passing bytes skips an
+    encode/decode round-trip on large captures.
+
     Example:
         class MyCustomBackend(VisionBackend):
             def plan_action(self, instruction, screenshot_b64, elements):
@@ -89,6 +245,38 @@ class VisionBackend(ABC):
             # ... implement other methods
     """
 
+    def __init__(self, enable_cache: bool = False, cache_ttl: float = 300.0):
+        """
+        Args:
+            enable_cache: Memoize results keyed on a content hash of
+                (prompt, screenshot), so exact repeats - reruns, retries on
+                an unchanged page - skip the API round-trip entirely.
+            cache_ttl: Seconds before a cached result expires.
+        """
+        if enable_cache:
+            from ._cache import VisionCache
+
+            self._cache = VisionCache(ttl=cache_ttl)
+        else:
+            self._cache = None
+
+    @property
+    def cache(self):
+        """The VisionCache when caching is enabled, else None.
+
+        Read via getattr so custom backends that never call
+        VisionBackend.__init__ keep working.
+        """
+        return getattr(self, "_cache", None)
+
+    @staticmethod
+    def _cache_key(prompt: str, screenshot) -> bytes:
+        """Content hash of a (prompt, screenshot) pair."""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(prompt.encode())
+        h.update(screenshot if isinstance(screenshot, bytes) else screenshot.encode())
+        return h.digest()
+
     @abstractmethod
     def plan_action(
         self,
@@ -166,3 +354,128 @@ class VisionBackend(ABC):
             List of elements AI identified with position/description
         """
         pass
+
+    # --- Batched variants ---
+    #
+    # The screenshot is by far the most expensive part of a vision payload,
+    # so K independent questions about the same page should not cost K
+    # round-trips. These defaults pack all questions into one prompt and
+    # parse a JSON array back, sending the image exactly once.
+
+    def verify_assertions(
+        self,
+        assertions: List[str],
+        screenshot_b64: str,
+        elements=None,  # Optional[PageElements]
+    ) -> List[AssertionResult]:
+        """
+        Verify several assertions about the same screenshot in one call.
+
+        Falls back to individual verify_assertion calls when the batched
+        response cannot be parsed into one result per assertion.
+        """
+        if not assertions:
+            return []
+        if len(assertions) == 1:
+            return [self.verify_assertion(assertions[0], screenshot_b64, elements)]
+
+        numbered = "\n".join(f"{i + 1}. {a}" for i, a in enumerate(assertions))
+        prompt = f"""You are verifying {len(assertions)} UI assertions against the screenshot.
+
+ASSERTIONS:
+{numbered}
+
+For each assertion in order, is it TRUE or FALSE based on what you see?
+
+Return ONLY a JSON array with exactly {len(assertions)} entries:
+[{{"passed": true | false, "reason": "<brief>", "confidence": <0.0 to 1.0>}}, ...]
+"""
+        try:
+            data = _extract_json(self.query(prompt, screenshot_b64, elements))
+            results = [AssertionResult.from_dict(d) for d in data]
+            if len(results) == len(assertions):
+                return results
+        except Exception:
+            pass
+        return [self.verify_assertion(a, screenshot_b64, elements) for a in assertions]
+
+    def query_many(
+        self,
+        questions: List[str],
+        screenshot_b64: str,
+        elements=None,  # Optional[PageElements]
+    ) -> List[str]:
+        """
+        Answer several questions about the same screenshot in one call.
+
+        Falls back to individual query calls when the batched response
+        cannot be parsed into one answer per question.
+        """
+        if not questions:
+            return []
+        if len(questions) == 1:
+            return [self.query(questions[0], screenshot_b64, elements)]
+
+        numbered = "\n".join(f"{i + 1}. {q}" for i, q in enumerate(questions))
+        prompt = f"""Look at the screenshot and answer these {len(questions)} questions.
+
+QUESTIONS:
+{numbered}
+
+Return ONLY a JSON array of {len(questions)} concise string answers, in order.
+"""
+        try:
+            answers = _extract_json(self.query(prompt, screenshot_b64, elements))
+            if isinstance(answers, list) and len(answers) == len(questions):
+                return [str(a) for a in answers]
+        except Exception:
+            pass
+        return [self.query(q, screenshot_b64, elements) for q in questions]
+
+    # --- Async variants ---
+    #
+    # Each synchronous method above blocks on one HTTPS round-trip, so suites
+    # issuing many independent AI calls pay serialized network latency. The
+    # async variants let callers `await asyncio.gather(...)` them instead.
+    # The defaults below run the sync implementation in a worker thread;
+    # backends whose SDK has native async support should override them.
+
+    async def _run_sync(self, fn, *args, **kwargs):
+        """Run a sync backend method in the default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(fn, *args, **kwargs))
+
+    async def aplan_action(
+        self,
+        instruction: str,
+        screenshot_b64: str,
+        elements,  # PageElements type
+    ) -> ActionPlan:
+        """Async variant of plan_action."""
+        return await self._run_sync(self.plan_action, instruction, screenshot_b64, elements)
+
+    async def averify_assertion(
+        self,
+        assertion: str,
+        screenshot_b64: str,
+        elements=None,  # Optional[PageElements]
+    ) -> AssertionResult:
+        """Async variant of verify_assertion."""
+        return await self._run_sync(self.verify_assertion, assertion, screenshot_b64, elements)
+
+    async def aquery(
+        self,
+        question: str,
+        screenshot_b64: str,
+        elements=None,  # Optional[PageElements]
+    ) -> str:
+        """Async variant of query."""
+        return await self._run_sync(self.query, question, screenshot_b64, elements)
+
+    async def adiscover_elements(
+        self,
+        screenshot_b64: str,
+        element_type: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Async variant of discover_elements."""
+        return await self._run_sync(self.discover_elements, screenshot_b64, element_type)
@@ -5,11 +5,92 @@ Supports Gemini 2.0 Flash and other Gemini models for visual AI testing.
 Includes automatic fallback to cheaper models on rate limits.
 """
 
+import asyncio
+import hashlib
 import json
+import logging
+import random
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ._image import prepare_image_for_vision
+from .base import (
+    ActionPlan,
+    ActionType,
+    AssertionResult,
+    VisionBackend,
+    _extract_json,
+    _try_local_match,
+)
+
+logger = logging.getLogger(__name__)
+
+# Imported once, lazily, so plain `import testscout` stays cheap for users
+# without the gemini extra while repeated backend construction skips the
+# import machinery entirely.
+_GENAI = None
+_CONFIGURED_KEY = None
+
+
+def _get_genai(api_key: str):
+    """Return the google.generativeai module, configured for api_key.
+
+    genai.configure is a process-global side effect, so it is only invoked
+    when the key actually changes; constructing many backends with the same
+    key (one per test worker is common) no longer reconfigures each time.
+    """
+    global _GENAI, _CONFIGURED_KEY
+    if _GENAI is None:
+        import google.generativeai as genai
+
+        _GENAI = genai
+    if api_key != _CONFIGURED_KEY:
+        _GENAI.configure(api_key=api_key)
+        _CONFIGURED_KEY = api_key
+    return _GENAI
+
+
+@lru_cache(maxsize=8)
+def _shared_model(model_name: str, api_key_hash: str):
+    """Shared GenerativeModel for (model, key) - reuses the underlying
+    transport channel across backend instances, so test parametrizations
+    that build a fresh backend per test skip channel warmup. Keyed on a
+    hash of the key, never the key itself.
+    """
+    return _GENAI.GenerativeModel(model_name)
+
+
+def _hash_key(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
 
-from .base import ActionPlan, AssertionResult, VisionBackend
+# Resolved lazily on the first error so importing this module stays cheap
+# for users without the gemini extra; () makes the isinstance check a no-op
+_RESOURCE_EXHAUSTED = None
+
+_RATE_LIMIT_TOKENS = ("429", "quota", "rate")
+
+
+def _is_rate_limit(e: Exception) -> bool:
+    """Whether an exception is a rate-limit/quota error.
+
+    Prefers the SDK's ResourceExhausted type - faster and more precise
+    than string matching - and falls back to one lowercase scan of the
+    message for errors that surface through other exception classes.
+    """
+    global _RESOURCE_EXHAUSTED
+    if _RESOURCE_EXHAUSTED is None:
+        try:
+            from google.api_core.exceptions import ResourceExhausted
+
+            _RESOURCE_EXHAUSTED = ResourceExhausted
+        except ImportError:
+            _RESOURCE_EXHAUSTED = ()
+    if isinstance(e, _RESOURCE_EXHAUSTED):
+        return True
+    msg = str(e).lower()
+    return any(t in msg for t in _RATE_LIMIT_TOKENS)
 
 
 # Model hierarchy: primary -> fallback (on rate limits)
@@ -20,6 +101,107 @@ MODEL_FALLBACKS = {
     "gemini-1.5-flash": None,  # No fallback for cheapest model
 }
 
+# Response schemas for constrained decoding (Gemini's OpenAPI-style schema
+# dialect). With a schema the model cannot emit anything but conformant
+# JSON, so parse failures - and the wasted NONE-plan round-trips they
+# trigger - disappear for these calls.
+_ACTION_PLAN_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "action": {
+            "type": "string",
+            "enum": ["click", "fill", "type", "select", "scroll", "wait", "hover", "none"],
+        },
+        "element_id": {"type": "integer", "nullable": True},
+        "text": {"type": "string", "nullable": True},
+        "direction": {"type": "string", "nullable": True},
+        "duration_ms": {"type": "integer", "nullable": True},
+        "reason": {"type": "string"},
+        "confidence": {"type": "number"},
+    },
+    "required": ["action", "reason", "confidence"],
+}
+
+_ASSERTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "passed": {"type": "boolean"},
+        "reason": {"type": "string"},
+        "confidence": {"type": "number"},
+    },
+    "required": ["passed", "reason", "confidence"],
+}
+
+
+# Static prompt skeletons, split around the dynamic fields. Built once at
+# import instead of re-assembling ~40-line f-strings on every call.
+_PLAN_PROMPT_PREFIX = """You are a browser automation agent. You see a screenshot and a list of interactive elements.
+
+TASK: """
+
+_PLAN_PROMPT_MID = """
+
+AVAILABLE ELEMENTS (use element_id to target):
+"""
+
+_PLAN_PROMPT_SUFFIX = """
+
+Based on the screenshot AND the element list, decide what action to take.
+If the visual element you want to interact with matches an element in the list, use that element_id.
+
+Return ONLY valid JSON (no markdown, no explanation):
+{
+    "action": "click" | "fill" | "type" | "select" | "scroll" | "wait" | "hover" | "none",
+    "element_id": <number from list, or null>,
+    "text": "<text to fill/type, or null>",
+    "direction": "up" | "down" | null,
+    "duration_ms": <milliseconds to wait, or null>,
+    "reason": "<brief explanation>",
+    "confidence": <0.0 to 1.0>
+}
+"""
+
+_ASSERTION_PROMPT_PREFIX = """You are verifying a UI assertion. Look at the screenshot carefully.
+
+ASSERTION: """
+
+_ASSERTION_PROMPT_SUFFIX = """
+
+Is this assertion TRUE or FALSE based on what you see?
+
+Return ONLY valid JSON (no markdown, no explanation):
+{
+    "passed": true | false,
+    "reason": "<brief explanation of what you see>",
+    "confidence": <0.0 to 1.0>
+}
+"""
+
+_QUERY_PROMPT_PREFIX = """Look at this screenshot and answer the question.
+"""
+
+_QUERY_PROMPT_SUFFIX = """
+
+Give a concise, direct answer.
+"""
+
+_DISCOVER_PROMPT_PREFIX = """Look at this screenshot and identify all interactive elements """
+
+_DISCOVER_PROMPT_SUFFIX = """.
+
+For each element you can see, provide:
+- type: button, link, input, checkbox, dropdown, etc.
+- label: visible text or aria label
+- position: approximate location (top-left, center, bottom-right, etc.)
+- description: brief visual description
+
+Return ONLY valid JSON array (no markdown):
+[
+    {"type": "button", "label": "Sign In", "position": "top-right", "description": "Blue button"},
+    ...
+]
+"""
+
 
 class GeminiBackend(VisionBackend):
     """
@@ -28,6 +210,10 @@ class GeminiBackend(VisionBackend):
     Uses Google's Generative AI SDK to power visual testing with Gemini models.
     Automatically falls back to cheaper models on rate limits.
 
+    All four public methods also have async variants (aplan_action etc.)
+    that use the SDK's native async API, so independent calls can be
+    overlapped with asyncio.gather instead of paying serialized latency.
+
     Example:
         ```python
         backend = GeminiBackend(
@@ -38,7 +224,15 @@ class GeminiBackend(VisionBackend):
         ```
     """
 
-    def __init__(self, api_key: str, model: str = "gemini-2.0-flash", fallback_model: str = "gemini-1.5-flash"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-2.0-flash",
+        fallback_model: str = "gemini-1.5-flash",
+        image_max_side: Optional[int] = None,
+        enable_cache: bool = False,
+        cache_ttl: float = 300.0,
+    ):
         """
         Initialize Gemini backend.
 
@@ -46,32 +240,65 @@ class GeminiBackend(VisionBackend):
             api_key: Google Generative AI API key
             model: Gemini model name (default: gemini-2.0-flash)
             fallback_model: Model to use when primary hits rate limits (default: gemini-1.5-flash)
+            image_max_side: Downscale screenshots so the longest side is at
+                most this many pixels before sending (needs Pillow). None
+                (default) sends them at full resolution.
+            enable_cache: Memoize results by (prompt, screenshot) content
+                hash so exact repeats skip the API round-trip.
+            cache_ttl: Seconds before a cached result expires.
         """
-        import google.generativeai as genai
-
-        genai.configure(api_key=api_key)
+        super().__init__(enable_cache=enable_cache, cache_ttl=cache_ttl)
+        genai = _get_genai(api_key)
         self.genai = genai
         self.primary_model_name = model
         self.fallback_model_name = fallback_model
-        self.model = genai.GenerativeModel(model)
-        self.fallback_model = genai.GenerativeModel(fallback_model) if fallback_model else None
+        key_hash = _hash_key(api_key)
+        self.model = _shared_model(model, key_hash)
+        self.fallback_model = _shared_model(fallback_model, key_hash) if fallback_model else None
         self.model_name = model  # Current active model name
         self.last_used_model = model  # Track which model was used for last call
+        self.image_max_side = image_max_side
+        # JSON output mode: the model cannot emit markdown fences at all,
+        # which avoids the parse-failure -> NONE plan -> retry round-trip.
+        # Plan/assertion calls additionally pin a response schema.
+        self._json_config = genai.types.GenerationConfig(response_mime_type="application/json")
+        self._plan_config = genai.types.GenerationConfig(
+            response_mime_type="application/json",
+            response_schema=_ACTION_PLAN_SCHEMA,
+        )
+        self._assertion_config = genai.types.GenerationConfig(
+            response_mime_type="application/json",
+            response_schema=_ASSERTION_SCHEMA,
+        )
 
-    def _make_image_part(self, screenshot_b64: str) -> Dict[str, Any]:
-        """Create image part for Gemini API."""
+    def _make_image_part(self, screenshot_b64: Union[bytes, str]) -> Dict[str, Any]:
+        """Create image part for Gemini API, downscaled to the pixel budget.
+
+        Accepts raw PNG bytes as well as base64 strings; bytes go straight
+        to the SDK, skipping an encode/decode round-trip on large captures.
+        """
+        data, mime = prepare_image_for_vision(screenshot_b64, self.image_max_side)
         return {
-            "mime_type": "image/png",
-            "data": screenshot_b64,
+            "mime_type": mime,
+            "data": data,
         }
 
-    def _generate_with_fallback(self, content: List, max_retries: int = 3) -> Tuple[Any, str]:
+    def _generate_with_fallback(
+        self, content: List, max_retries: int = 3, generation_config=None
+    ) -> Tuple[Any, str]:
         """
         Generate content with automatic fallback on rate limits.
 
         Returns:
             Tuple of (response, model_name_used)
         """
+        cache_key = self._content_cache_key(content)
+        if cache_key is not None:
+            hit = self.cache.get(cache_key)
+            if hit is not None:
+                self.last_used_model = hit[1]
+                return hit
+
         models_to_try = [
             (self.model, self.primary_model_name),
         ]
@@ -83,23 +310,32 @@ class GeminiBackend(VisionBackend):
         for model, model_name in models_to_try:
             for attempt in range(max_retries):
                 try:
-                    response = model.generate_content(content)
+                    response = model.generate_content(content, generation_config=generation_config)
                     self.last_used_model = model_name
+                    if cache_key is not None:
+                        self.cache.put(cache_key, (response, model_name))
                     return response, model_name
                 except Exception as e:
-                    error_str = str(e).lower()
-                    is_rate_limit = "429" in str(e) or "quota" in error_str or "rate" in error_str
+                    is_rate_limit = _is_rate_limit(e)
                     last_error = e
 
                     if is_rate_limit:
                         if attempt < max_retries - 1:
                             # Wait before retry on same model
                             wait_time = 10 * (attempt + 1)  # 10s, 20s, 30s
-                            print(f"Rate limit on {model_name}, waiting {wait_time}s (attempt {attempt + 1}/{max_retries})...")
+                            logger.warning(
+                                "Rate limit on %s, waiting %ss (attempt %s/%s)",
+                                model_name,
+                                wait_time,
+                                attempt + 1,
+                                max_retries,
+                            )
                             time.sleep(wait_time)
                         else:
                             # Move to fallback model
-                            print(f"Rate limit exhausted on {model_name}, trying fallback...")
+                            logger.warning(
+                                "Rate limit exhausted on %s, trying fallback", model_name
+                            )
                             break
                     else:
                         # Non-rate-limit error, retry briefly
@@ -111,6 +347,74 @@ class GeminiBackend(VisionBackend):
         # If we get here, all models failed
         raise last_error or Exception("All models failed")
 
+    def _content_cache_key(self, content: List) -> Optional[bytes]:
+        """Cache key for a [prompt, image_part] content list, or None when
+        caching is off or the content has another shape."""
+        if self.cache is None or len(content) != 2 or not isinstance(content[0], str):
+            return None
+        image_part = content[1]
+        if not isinstance(image_part, dict) or "data" not in image_part:
+            return None
+        return self._cache_key(content[0], image_part["data"])
+
+    async def _agenerate_with_fallback(
+        self, content: List, max_retries: int = 3, generation_config=None
+    ) -> Tuple[Any, str]:
+        """
+        Async counterpart of _generate_with_fallback.
+
+        Uses the SDK's native async API and backs off with asyncio.sleep
+        (exponential, with jitter so concurrent callers don't retry in
+        lockstep), so a rate-limited call never blocks the event loop the
+        way the sync path's time.sleep blocks its thread.
+        """
+        cache_key = self._content_cache_key(content)
+        if cache_key is not None:
+            hit = self.cache.get(cache_key)
+            if hit is not None:
+                self.last_used_model = hit[1]
+                return hit
+
+        models_to_try = [
+            (self.model, self.primary_model_name),
+        ]
+        if self.fallback_model:
+            models_to_try.append((self.fallback_model, self.fallback_model_name))
+
+        last_error = None
+
+        for model, model_name in models_to_try:
+            for attempt in range(max_retries):
+                try:
+                    response = await model.generate_content_async(
+                        content, generation_config=generation_config
+                    )
+                    self.last_used_model = model_name
+                    if cache_key is not None:
+                        self.cache.put(cache_key, (response, model_name))
+                    return response, model_name
+                except Exception as e:
+                    is_rate_limit = _is_rate_limit(e)
+                    last_error = e
+
+                    if is_rate_limit:
+                        if attempt < max_retries - 1:
+                            # Exponential backoff + jitter: 10s, 20s, 40s...
+                            wait_time = min(10 * 2**attempt, 60) + random.uniform(0, 1)
+                            await asyncio.sleep(wait_time)
+                        else:
+                            # Move to fallback model
+                            break
+                    else:
+                        # Non-rate-limit error, retry briefly
+                        if attempt < max_retries - 1:
+                            await asyncio.sleep(1)
+                        else:
+                            raise e
+
+        # If we get here, all models failed
+        raise last_error or Exception("All models failed")
+
     def generate_raw(self, content: List) -> Tuple[str, str]:
         """
         Generate raw content with automatic fallback.
@@ -124,58 +428,55 @@ class GeminiBackend(VisionBackend):
         response, model_name = self._generate_with_fallback(content)
         return response.text, model_name
 
-    def plan_action(
-        self,
-        instruction: str,
-        screenshot_b64: str,
-        elements,
-    ) -> ActionPlan:
-        """Plan an action using Gemini vision."""
-        element_summary = elements.to_prompt_summary() if elements else "No elements discovered."
+    # --- Prompt builders (shared by the sync and async paths) ---
 
-        prompt = f"""You are a browser automation agent. You see a screenshot and a list of interactive elements.
+    def _plan_prompt(self, instruction: str, elements) -> str:
+        element_summary = elements.to_prompt_summary() if elements else "No elements discovered."
+        return "".join(
+            (
+                _PLAN_PROMPT_PREFIX,
+                instruction,
+                _PLAN_PROMPT_MID,
+                element_summary,
+                _PLAN_PROMPT_SUFFIX,
+            )
+        )
 
-TASK: {instruction}
+    def _assertion_prompt(self, assertion: str, elements) -> str:
+        element_context = ""
+        if elements:
+            element_context = f"\n\nAvailable elements on page:\n{elements.to_prompt_summary()}"
+        return "".join(
+            (_ASSERTION_PROMPT_PREFIX, assertion, "\n", element_context, _ASSERTION_PROMPT_SUFFIX)
+        )
 
-AVAILABLE ELEMENTS (use element_id to target):
-{element_summary}
+    def _query_prompt(self, question: str, elements) -> str:
+        element_context = ""
+        if elements:
+            element_context = f"\n\nAvailable elements:\n{elements.to_prompt_summary()}"
+        return "".join(
+            (
+                _QUERY_PROMPT_PREFIX,
+                element_context,
+                "\n\nQUESTION: ",
+                question,
+                _QUERY_PROMPT_SUFFIX,
+            )
+        )
 
-Based on the screenshot AND the element list, decide what action to take.
-If the visual element you want to interact with matches an element in the list, use that element_id.
+    def _discover_prompt(self, element_type: Optional[str]) -> str:
+        type_filter = f"of type '{element_type}'" if element_type else ""
+        return "".join((_DISCOVER_PROMPT_PREFIX, type_filter, _DISCOVER_PROMPT_SUFFIX))
 
-Return ONLY valid JSON (no markdown, no explanation):
-{{
-    "action": "click" | "fill" | "type" | "select" | "scroll" | "wait" | "hover" | "none",
-    "element_id": <number from list, or null>,
-    "text": "<text to fill/type, or null>",
-    "direction": "up" | "down" | null,
-    "duration_ms": <milliseconds to wait, or null>,
-    "reason": "<brief explanation>",
-    "confidence": <0.0 to 1.0>
-}}
-"""
+    # --- Response parsers (shared by the sync and async paths) ---
 
+    def _parse_plan(self, text: str, model_used: str) -> ActionPlan:
         try:
-            response, model_used = self._generate_with_fallback([
-                prompt,
-                self._make_image_part(screenshot_b64),
-            ])
-
-            # Clean response - remove markdown code blocks if present
-            text = response.text.strip()
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-            text = text.strip()
-
-            data = json.loads(text)
+            data = _extract_json(text)
             plan = ActionPlan.from_dict(data)
             plan.model_used = model_used  # Track which model made this decision
             return plan
         except (json.JSONDecodeError, AttributeError) as e:
-            from .base import ActionType
-
             plan = ActionPlan(
                 action=ActionType.NONE,
                 reason=f"Failed to parse AI response: {e}",
@@ -183,57 +484,19 @@ Return ONLY valid JSON (no markdown, no explanation):
             )
             plan.model_used = self.last_used_model
             return plan
-        except Exception as e:
-            from .base import ActionType
-
-            plan = ActionPlan(
-                action=ActionType.NONE,
-                reason=f"AI error: {str(e)[:100]}",
-                confidence=0.0,
-            )
-            plan.model_used = self.last_used_model
-            return plan
-
-    def verify_assertion(
-        self,
-        assertion: str,
-        screenshot_b64: str,
-        elements=None,
-    ) -> AssertionResult:
-        """Verify an assertion using Gemini vision."""
-        element_context = ""
-        if elements:
-            element_context = f"\n\nAvailable elements on page:\n{elements.to_prompt_summary()}"
-
-        prompt = f"""You are verifying a UI assertion. Look at the screenshot carefully.
 
-ASSERTION: {assertion}
-{element_context}
-
-Is this assertion TRUE or FALSE based on what you see?
-
-Return ONLY valid JSON (no markdown, no explanation):
-{{
-    "passed": true | false,
-    "reason": "<brief explanation of what you see>",
-    "confidence": <0.0 to 1.0>
-}}
-"""
+    def _plan_error(self, e: Exception) -> ActionPlan:
+        plan = ActionPlan(
+            action=ActionType.NONE,
+            reason=f"AI error: {str(e)[:100]}",
+            confidence=0.0,
+        )
+        plan.model_used = self.last_used_model
+        return plan
 
+    def _parse_assertion(self, text: str, model_used: str) -> AssertionResult:
         try:
-            response, model_used = self._generate_with_fallback([
-                prompt,
-                self._make_image_part(screenshot_b64),
-            ])
-
-            text = response.text.strip()
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-            text = text.strip()
-
-            data = json.loads(text)
+            data = _extract_json(text)
             result = AssertionResult.from_dict(data)
             result.model_used = model_used
             return result
@@ -245,14 +508,130 @@ Return ONLY valid JSON (no markdown, no explanation):
             )
             result.model_used = self.last_used_model
             return result
+
+    def _assertion_error(self, e: Exception) -> AssertionResult:
+        result = AssertionResult(
+            passed=False,
+            reason=f"AI error: {str(e)[:100]}",
+            confidence=0.0,
+        )
+        result.model_used = self.last_used_model
+        return result
+
+    @staticmethod
+    def _parse_query(text: str, model_used: str) -> str:
+        return text.strip()
+
+    @staticmethod
+    def _query_error(e: Exception) -> str:
+        return f"Error querying AI: {str(e)[:100]}"
+
+    @staticmethod
+    def _parse_elements(text: str, model_used: str) -> List[Dict[str, Any]]:
+        return _extract_json(text)
+
+    @staticmethod
+    def _elements_error(e: Exception) -> List[Dict[str, Any]]:
+        return []
+
+    # --- Shared invocation path ---
+
+    def _invoke(self, prompt, screenshot_b64, parse, on_error, generation_config=None):
+        """Single call path behind all four public methods.
+
+        Builds the content list, runs the retry/fallback call, and routes
+        the response text through parse (or the exception through
+        on_error). Cross-cutting concerns - caching, image preparation,
+        model fallback, future timeout tuning or tracing - live here once
+        instead of being copy-pasted per method.
+        """
+        try:
+            response, model_used = self._generate_with_fallback(
+                [prompt, self._make_image_part(screenshot_b64)],
+                generation_config=generation_config,
+            )
+            return parse(response.text, model_used)
         except Exception as e:
-            result = AssertionResult(
-                passed=False,
-                reason=f"AI error: {str(e)[:100]}",
-                confidence=0.0,
+            return on_error(e)
+
+    async def _ainvoke(self, prompt, screenshot_b64, parse, on_error, generation_config=None):
+        """Async counterpart of _invoke."""
+        try:
+            response, model_used = await self._agenerate_with_fallback(
+                [prompt, self._make_image_part(screenshot_b64)],
+                generation_config=generation_config,
             )
-            result.model_used = self.last_used_model
-            return result
+            return parse(response.text, model_used)
+        except Exception as e:
+            return on_error(e)
+
+    # --- Public API ---
+
+    def plan_action(
+        self,
+        instruction: str,
+        screenshot_b64: str,
+        elements,
+    ) -> ActionPlan:
+        """Plan an action using Gemini vision."""
+        plan = _try_local_match(instruction, elements)
+        if plan is not None:
+            return plan
+        return self._invoke(
+            self._plan_prompt(instruction, elements),
+            screenshot_b64,
+            parse=self._parse_plan,
+            on_error=self._plan_error,
+            generation_config=self._plan_config,
+        )
+
+    async def aplan_action(
+        self,
+        instruction: str,
+        screenshot_b64: str,
+        elements,
+    ) -> ActionPlan:
+        """Async variant of plan_action."""
+        plan = _try_local_match(instruction, elements)
+        if plan is not None:
+            return plan
+        return await self._ainvoke(
+            self._plan_prompt(instruction, elements),
+            screenshot_b64,
+            parse=self._parse_plan,
+            on_error=self._plan_error,
+            generation_config=self._plan_config,
+        )
+
+    def verify_assertion(
+        self,
+        assertion: str,
+        screenshot_b64: str,
+        elements=None,
+    ) -> AssertionResult:
+        """Verify an assertion using Gemini vision."""
+        return self._invoke(
+            self._assertion_prompt(assertion, elements),
+            screenshot_b64,
+            parse=self._parse_assertion,
+            on_error=self._assertion_error,
+            generation_config=self._assertion_config,
+        )
+
+    async def averify_assertion(
+        self,
+        assertion: str,
+        screenshot_b64: str,
+        elements=None,
+    ) -> AssertionResult:
+        """Async variant of verify_assertion."""
+        return await self._ainvoke(
+            self._assertion_prompt(assertion, elements),
+            screenshot_b64,
+            parse=self._parse_assertion,
+            on_error=self._assertion_error,
+            generation_config=self._assertion_config,
+        )
 
     def query(
         self,
@@ -261,26 +640,26 @@ Return ONLY valid JSON (no markdown, no explanation):
         elements=None,
     ) -> str:
         """Ask Gemini a question about the page."""
-        element_context = ""
-        if elements:
-            element_context = f"\n\nAvailable elements:\n{elements.to_prompt_summary()}"
-
-        prompt = f"""Look at this screenshot and answer the question.
-{element_context}
-
-QUESTION: {question}
-
-Give a concise, direct answer.
-"""
+        return self._invoke(
+            self._query_prompt(question, elements),
+            screenshot_b64,
+            parse=self._parse_query,
+            on_error=self._query_error,
+        )
 
-        try:
-            response, _ = self._generate_with_fallback([
-                prompt,
-                self._make_image_part(screenshot_b64),
-            ])
-            return response.text.strip()
-        except Exception as e:
-            return f"Error querying AI: {str(e)[:100]}"
+    async def aquery(
+        self,
+        question: str,
+        screenshot_b64: str,
+        elements=None,
+    ) -> str:
+        """Async variant of query."""
+        return await self._ainvoke(
+            self._query_prompt(question, elements),
+            screenshot_b64,
+            parse=self._parse_query,
+            on_error=self._query_error,
+        )
 
     def discover_elements(
         self,
@@ -288,36 +667,24 @@ Give a concise, direct answer.
         element_type: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Use Gemini to visually identify elements on the page."""
-        type_filter = f"of type '{element_type}'" if element_type else ""
-
-        prompt = f"""Look at this screenshot and identify all interactive elements {type_filter}.
-
-For each element you can see, provide:
-- type: button, link, input, checkbox, dropdown, etc.
-- label: visible text or aria label
-- position: approximate location (top-left, center, bottom-right, etc.)
-- description: brief visual description
-
-Return ONLY valid JSON array (no markdown):
-[
-    {{"type": "button", "label": "Sign In", "position": "top-right", "description": "Blue button"}},
-    ...
-]
-"""
+        return self._invoke(
+            self._discover_prompt(element_type),
+            screenshot_b64,
+            parse=self._parse_elements,
+            on_error=self._elements_error,
+            generation_config=self._json_config,
+        )
 
-        try:
-            response, _ = self._generate_with_fallback([
-                prompt,
-                self._make_image_part(screenshot_b64),
-            ])
-
-            text = response.text.strip()
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-            text = text.strip()
-
-            return json.loads(text)
-        except (json.JSONDecodeError, AttributeError, Exception):
-            return []
+    async def adiscover_elements(
+        self,
+        screenshot_b64: str,
+        element_type: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Async variant of discover_elements."""
+        return await self._ainvoke(
+            self._discover_prompt(element_type),
+            screenshot_b64,
+            parse=self._parse_elements,
+            on_error=self._elements_error,
+            generation_config=self._json_config,
+        )
@@ -4,10 +4,114 @@ OpenAI GPT-4V backend implementation for testScout.
 Supports GPT-4o and other OpenAI vision models for visual AI testing.
 """
 
-import json
-from typing import Any, Dict, List, Optional
+import base64
+from typing import Any, Dict, List, Optional, Union
 
-from .base import ActionPlan, ActionType, AssertionResult, VisionBackend
+from ._image import prepare_image_for_vision
+from .base import (
+    ActionPlan,
+    ActionType,
+    AssertionResult,
+    VisionBackend,
+    _extract_json,
+    _try_local_match,
+)
+
+# Constrained output for the JSON-returning calls - the model cannot emit
+# markdown fences, which avoids parse failures and their retry round-trips
+_JSON_FORMAT = {"type": "json_object"}
+
+# Structured Outputs for plan/assert calls: a strict JSON schema makes the
+# response conformant by construction, so parse failures - and the wasted
+# NONE-plan round-trips they trigger - disappear for these calls.
+_PLAN_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "action_plan",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "enum": ["click", "fill", "type", "select", "scroll", "wait", "hover", "none"],
+                },
+                "element_id": {"type": ["integer", "null"]},
+                "text": {"type": ["string", "null"]},
+                "direction": {"type": ["string", "null"]},
+                "duration_ms": {"type": ["integer", "null"]},
+                "reason": {"type": "string"},
+                "confidence": {"type": "number"},
+            },
+            "required": [
+                "action",
+                "element_id",
+                "text",
+                "direction",
+                "duration_ms",
+                "reason",
+                "confidence",
+            ],
+            "additionalProperties": False,
+        },
+    },
+}
+
+_ASSERTION_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "assertion_result",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "passed": {"type": "boolean"},
+                "reason": {"type": "string"},
+                "confidence": {"type": "number"},
+            },
+            "required": ["passed", "reason", "confidence"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+# Static prompt skeletons, split around the dynamic fields. Built once at
+# import instead of re-assembling the f-strings on every call.
+_PLAN_PROMPT_PREFIX = """You are a browser automation agent.
+
+TASK: """
+
+_PLAN_PROMPT_MID = """
+
+AVAILABLE ELEMENTS:
+"""
+
+_PLAN_PROMPT_SUFFIX = """
+
+Return ONLY JSON:
+{"action": "click|fill|type|select|scroll|wait|hover|none", "element_id": <number or null>, "text": "<string or null>", "reason": "<brief>", "confidence": <0-1>}
+"""
+
+_ASSERTION_PROMPT_PREFIX = """Verify this assertion about the screenshot:
+
+ASSERTION: """
+
+_ASSERTION_PROMPT_SUFFIX = """
+
+Return ONLY JSON: {"passed": true|false, "reason": "<brief>", "confidence": <0-1>}
+"""
+
+# Screenshots are PNG in the common case; precomputing the prefix means the
+# megabyte-scale base64 payload is joined with one concat instead of being
+# copied through f-string formatting on every call
+_PNG_DATA_URL_PREFIX = "data:image/png;base64,"
+
+_DISCOVER_PROMPT_PREFIX = """List all interactive elements """
+
+_DISCOVER_PROMPT_SUFFIX = """ you see.
+Return JSON array: [{"type": "...", "label": "...", "position": "...", "description": "..."}]
+"""
 
 
 class OpenAIBackend(VisionBackend):
@@ -16,6 +120,10 @@ class OpenAIBackend(VisionBackend):
 
     Uses OpenAI's Chat Completions API with vision capabilities.
 
+    All four public methods also have async variants (aplan_action etc.)
+    backed by AsyncOpenAI, so independent calls can be overlapped with
+    asyncio.gather instead of paying serialized latency.
+
     Example:
         ```python
         backend = OpenAIBackend(
@@ -26,40 +134,192 @@ class OpenAIBackend(VisionBackend):
         ```
     """
 
-    def __init__(self, api_key: str, model: str = "gpt-4o"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o",
+        image_max_side: Optional[int] = None,
+        image_detail: str = "auto",
+        enable_cache: bool = False,
+        cache_ttl: float = 300.0,
+        http_client: Optional[Any] = None,
+        async_http_client: Optional[Any] = None,
+    ):
         """
         Initialize OpenAI backend.
 
         Args:
             api_key: OpenAI API key
             model: OpenAI model name (default: gpt-4o)
+            image_max_side: Downscale screenshots so the longest side is at
+                most this many pixels before sending (needs Pillow). None
+                (default) sends them at full resolution.
+            image_detail: Vision detail level - "low" caps image tokens and
+                is much cheaper, "high" preserves fidelity, "auto" (default)
+                lets the API decide.
+            enable_cache: Memoize results by (prompt, screenshot) content
+                hash so exact repeats skip the API round-trip.
+            cache_ttl: Seconds before a cached result expires.
+            http_client: Externally owned httpx.Client to use instead of
+                creating one. Lets several backends (or a whole test
+                session) share one warm connection pool; the caller is
+                responsible for closing it.
+            async_http_client: Async counterpart of ``http_client``.
         """
-        from openai import OpenAI
+        super().__init__(enable_cache=enable_cache, cache_ttl=cache_ttl)
+        import httpx
+        from openai import AsyncOpenAI, OpenAI
 
-        self.client = OpenAI(api_key=api_key)
+        # Shared, tuned connection pools: keep-alive connections avoid
+        # paying TCP+TLS setup per call, and the raised limits allow real
+        # concurrency when many calls are gathered at once.
+        self._owns_http = http_client is None
+        self._owns_ahttp = async_http_client is None
+        limits = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        timeout = httpx.Timeout(60.0, connect=10.0)
+        self._http = http_client or httpx.Client(limits=limits, timeout=timeout)
+        self._ahttp = async_http_client or httpx.AsyncClient(limits=limits, timeout=timeout)
+        self.client = OpenAI(api_key=api_key, http_client=self._http)
+        self.aclient = AsyncOpenAI(api_key=api_key, http_client=self._ahttp)
         self.model = model
+        self.image_max_side = image_max_side
+        self.image_detail = image_detail
+
+    def close(self):
+        """Release the pooled HTTP connections (sync side).
 
-    def _call_vision(self, prompt: str, screenshot_b64: str) -> str:
+        External clients passed via ``http_client`` are left open for
+        their owner to close.
+        """
+        if self._owns_http:
+            self._http.close()
+
+    async def aclose(self):
+        """Release the pooled HTTP connections (async side)."""
+        if self._owns_ahttp:
+            await self._ahttp.aclose()
+
+    def __del__(self):
+        try:
+            if self._owns_http:
+                self._http.close()
+        except Exception:
+            pass
+
+    def _vision_messages(
+        self, prompt: str, screenshot_b64: Union[bytes, str]
+    ) -> List[Dict[str, Any]]:
+        """Build the messages payload for a vision call.
+
+        Accepts raw PNG bytes as well as base64 strings; bytes are encoded
+        exactly once here, at the last step before the data URL.
+        """
+        data, mime = prepare_image_for_vision(screenshot_b64, self.image_max_side)
+        if isinstance(data, bytes):
+            data = base64.b64encode(data).decode("ascii")
+        if mime == "image/png":
+            url = _PNG_DATA_URL_PREFIX + data
+        else:
+            url = "data:" + mime + ";base64," + data
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": prompt},
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": url,
+                            "detail": self.image_detail,
+                        },
+                    },
+                ],
+            }
+        ]
+
+    def _call_vision(self, prompt: str, screenshot_b64: str, response_format=None) -> str:
         """Make a vision API call to OpenAI."""
+        cache_key = self._cache_key(prompt, screenshot_b64) if self.cache else None
+        if cache_key is not None:
+            hit = self.cache.get(cache_key)
+            if hit is not None:
+                return hit
+
+        kwargs = {"response_format": response_format} if response_format else {}
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": prompt},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/png;base64,{screenshot_b64}",
-                            },
-                        },
-                    ],
-                }
-            ],
+            messages=self._vision_messages(prompt, screenshot_b64),
             max_tokens=1000,
+            **kwargs,
         )
-        return response.choices[0].message.content
+        text = response.choices[0].message.content
+        if cache_key is not None:
+            self.cache.put(cache_key, text)
+        return text
+
+    async def _acall_vision(self, prompt: str, screenshot_b64: str, response_format=None) -> str:
+        """Make an async vision API call to OpenAI."""
+        cache_key = self._cache_key(prompt, screenshot_b64) if self.cache else None
+        if cache_key is not None:
+            hit = self.cache.get(cache_key)
+            if hit is not None:
+                return hit
+
+        kwargs = {"response_format": response_format} if response_format else {}
+        response = await self.aclient.chat.completions.create(
+            model=self.model,
+            messages=self._vision_messages(prompt, screenshot_b64),
+            max_tokens=1000,
+            **kwargs,
+        )
+        text = response.choices[0].message.content
+        if cache_key is not None:
+            self.cache.put(cache_key, text)
+        return text
+
+    # --- Prompt builders and parsers (shared by the sync and async paths) ---
+
+    def _plan_prompt(self, instruction: str, elements) -> str:
+        element_summary = elements.to_prompt_summary() if elements else "No elements discovered."
+        return "".join(
+            (
+                _PLAN_PROMPT_PREFIX,
+                instruction,
+                _PLAN_PROMPT_MID,
+                element_summary,
+                _PLAN_PROMPT_SUFFIX,
+            )
+        )
+
+    def _assertion_prompt(self, assertion: str) -> str:
+        return "".join((_ASSERTION_PROMPT_PREFIX, assertion, _ASSERTION_PROMPT_SUFFIX))
+
+    def _discover_prompt(self, element_type: Optional[str]) -> str:
+        type_filter = f"of type '{element_type}'" if element_type else ""
+        return "".join((_DISCOVER_PROMPT_PREFIX, type_filter, _DISCOVER_PROMPT_SUFFIX))
+
+    @staticmethod
+    def _parse_plan(text: str) -> ActionPlan:
+        try:
+            return ActionPlan.from_dict(_extract_json(text))
+        except Exception as e:
+            return ActionPlan(action=ActionType.NONE, reason=f"Parse error: {e}", confidence=0.0)
+
+    @staticmethod
+    def _parse_assertion(text: str) -> AssertionResult:
+        try:
+            return AssertionResult.from_dict(_extract_json(text))
+        except Exception:
+            return AssertionResult(passed=False, reason="Parse error", confidence=0.0)
+
+    @staticmethod
+    def _parse_elements(text: str) -> List[Dict[str, Any]]:
+        try:
+            return _extract_json(text)
+        except Exception:
+            return []
+
+    # --- Public API ---
 
     def plan_action(
         self,
@@ -68,26 +328,24 @@ class OpenAIBackend(VisionBackend):
         elements,
     ) -> ActionPlan:
         """Plan an action using GPT-4V vision."""
-        element_summary = elements.to_prompt_summary() if elements else "No elements discovered."
-
-        prompt = f"""You are a browser automation agent.
-
-TASK: {instruction}
+        plan = _try_local_match(instruction, elements)
+        if plan is not None:
+            return plan
+        prompt = self._plan_prompt(instruction, elements)
+        return self._parse_plan(self._call_vision(prompt, screenshot_b64, _PLAN_FORMAT))
 
-AVAILABLE ELEMENTS:
-{element_summary}
-
-Return ONLY JSON:
-{{"action": "click|fill|type|select|scroll|wait|hover|none", "element_id": <number or null>, "text": "<string or null>", "reason": "<brief>", "confidence": <0-1>}}
-"""
-        text = self._call_vision(prompt, screenshot_b64)
-        try:
-            text = text.strip()
-            if text.startswith("```"):
-                text = text.split("```")[1].replace("json", "").strip()
-            return ActionPlan.from_dict(json.loads(text))
-        except Exception as e:
-            return ActionPlan(action=ActionType.NONE, reason=f"Parse error: {e}", confidence=0.0)
+    async def aplan_action(
+        self,
+        instruction: str,
+        screenshot_b64: str,
+        elements,
+    ) -> ActionPlan:
+        """Async variant of plan_action."""
+        plan = _try_local_match(instruction, elements)
+        if plan is not None:
+            return plan
+        prompt = self._plan_prompt(instruction, elements)
+        return self._parse_plan(await self._acall_vision(prompt, screenshot_b64, _PLAN_FORMAT))
 
     def verify_assertion(
         self,
@@ -96,20 +354,20 @@ Return ONLY JSON:
         elements=None,
     ) -> AssertionResult:
         """Verify an assertion using GPT-4V vision."""
-        prompt = f"""Verify this assertion about the screenshot:
-
-ASSERTION: {assertion}
+        prompt = self._assertion_prompt(assertion)
+        return self._parse_assertion(self._call_vision(prompt, screenshot_b64, _ASSERTION_FORMAT))
 
-Return ONLY JSON: {{"passed": true|false, "reason": "<brief>", "confidence": <0-1>}}
-"""
-        text = self._call_vision(prompt, screenshot_b64)
-        try:
-            text = text.strip()
-            if text.startswith("```"):
-                text = text.split("```")[1].replace("json", "").strip()
-            return AssertionResult.from_dict(json.loads(text))
-        except Exception:
-            return AssertionResult(passed=False, reason="Parse error", confidence=0.0)
+    async def averify_assertion(
+        self,
+        assertion: str,
+        screenshot_b64: str,
+        elements=None,
+    ) -> AssertionResult:
+        """Async variant of verify_assertion."""
+        prompt = self._assertion_prompt(assertion)
+        return self._parse_assertion(
+            await self._acall_vision(prompt, screenshot_b64, _ASSERTION_FORMAT)
+        )
 
     def query(
         self,
@@ -121,20 +379,30 @@ Return ONLY JSON: {{"passed": true|false, "reason": "<brief>", "confidence": <0-
         prompt = f"Look at this screenshot and answer: {question}"
         return self._call_vision(prompt, screenshot_b64)
 
+    async def aquery(
+        self,
+        question: str,
+        screenshot_b64: str,
+        elements=None,
+    ) -> str:
+        """Async variant of query."""
+        prompt = f"Look at this screenshot and answer: {question}"
+        return await self._acall_vision(prompt, screenshot_b64)
+
     def discover_elements(
         self,
         screenshot_b64: str,
         element_type: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Use GPT-4V to visually identify elements on the page."""
-        type_filter = f"of type '{element_type}'" if element_type else ""
-        prompt = f"""List all interactive elements {type_filter} you see.
-Return JSON array: [{{"type": "...", "label": "...", "position": "...", "description": "..."}}]
-"""
-        text = self._call_vision(prompt, screenshot_b64)
-        try:
-            if text.startswith("```"):
-                text = text.split("```")[1].replace("json", "").strip()
-            return json.loads(text)
-        except Exception:
-            return []
+        prompt = self._discover_prompt(element_type)
+        return self._parse_elements(self._call_vision(prompt, screenshot_b64))
+
+    async def adiscover_elements(
+        self,
+        screenshot_b64: str,
+        element_type: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Async variant of discover_elements."""
+        prompt = self._discover_prompt(element_type)
+        return self._parse_elements(await self._acall_vision(prompt, screenshot_b64))
@@ -30,8 +30,15 @@ def explore_command(args):
 
     # Run exploration
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=args.headless)
-        page = browser.new_page()
+        # Connecting to an existing browser over CDP skips the 300-800ms
+        # chromium cold launch; a long-running host keeps one browser and
+        # each run gets its own context as the isolation boundary
+        if args.cdp_endpoint:
+            browser = p.chromium.connect_over_cdp(args.cdp_endpoint)
+        else:
+            browser = p.chromium.launch(headless=not args.headed)
+        context = browser.new_context()
+        page = context.new_page()
 
         explorer = Explorer(
             page,
@@ -47,7 +54,11 @@ def explore_command(args):
             max_depth=args.max_depth,
         )
 
-        browser.close()
+        context.close()
+        if not args.cdp_endpoint:
+            # Only close browsers we launched; a shared CDP browser stays
+            # alive for the next invocation
+            browser.close()
 
     # Save report
     report.save(args.output)
@@ -58,8 +69,59 @@ def explore_command(args):
     print("   Open in browser to see detailed findings")
 
 
-def main():
-    """Main CLI entry point."""
+def _add_explore_arguments(parser):
+    """Attach the explore command's arguments to a parser."""
+    parser.add_argument("url", help="URL to explore (e.g., http://localhost:8888)")
+    parser.add_argument(
+        "--max-actions",
+        type=int,
+        default=50,
+        help="Maximum number of actions to take (default: 50)",
+    )
+    parser.add_argument(
+        "--max-time", type=int, default=300, help="Maximum time in seconds (default: 300)"
+    )
+    parser.add_argument(
+        "--max-depth", type=int, default=5, help="Maximum navigation depth (default: 5)"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["gemini", "openai"],
+        default="gemini",
+        help="AI backend to use (default: gemini)",
+    )
+    parser.add_argument(
+        "--api-key", help="API key for the backend (or set GEMINI_API_KEY/OPENAI_API_KEY env var)"
+    )
+    parser.add_argument(
+        "--cdp-endpoint",
+        help="Connect to an existing browser over CDP (e.g. http://localhost:9222) "
+        "instead of launching one",
+    )
+    parser.add_argument(
+        "--output",
+        default="exploration_report.html",
+        help="Output file path (default: exploration_report.html)",
+    )
+    parser.add_argument(
+        "--headed",
+        action="store_true",
+        help="Run browser in headed mode (show browser window); headless is the default",
+    )
+
+
+def _build_explore_parser() -> argparse.ArgumentParser:
+    """Standalone parser for the explore command only."""
+    parser = argparse.ArgumentParser(
+        prog="testscout explore",
+        description="Autonomously explore a website to find bugs",
+    )
+    _add_explore_arguments(parser)
+    return parser
+
+
+def _build_full_parser() -> argparse.ArgumentParser:
+    """Full parser with every subcommand, for help and error output."""
     parser = argparse.ArgumentParser(
         description="testScout - AI-Powered E2E Testing Framework",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -85,53 +147,35 @@ For more information, visit: https://github.com/rhowardstone/testScout
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # Explore command
     explore_parser = subparsers.add_parser(
         "explore", help="Autonomously explore a website to find bugs"
     )
-    explore_parser.add_argument("url", help="URL to explore (e.g., http://localhost:8888)")
-    explore_parser.add_argument(
-        "--max-actions",
-        type=int,
-        default=50,
-        help="Maximum number of actions to take (default: 50)",
-    )
-    explore_parser.add_argument(
-        "--max-time", type=int, default=300, help="Maximum time in seconds (default: 300)"
-    )
-    explore_parser.add_argument(
-        "--max-depth", type=int, default=5, help="Maximum navigation depth (default: 5)"
-    )
-    explore_parser.add_argument(
-        "--backend",
-        choices=["gemini", "openai"],
-        default="gemini",
-        help="AI backend to use (default: gemini)",
-    )
-    explore_parser.add_argument(
-        "--api-key", help="API key for the backend (or set GEMINI_API_KEY/OPENAI_API_KEY env var)"
-    )
-    explore_parser.add_argument(
-        "--output",
-        default="exploration_report.html",
-        help="Output file path (default: exploration_report.html)",
-    )
-    explore_parser.add_argument(
-        "--headless",
-        action="store_true",
-        default=True,
-        help="Run browser in headless mode (default: True)",
-    )
-    explore_parser.add_argument(
-        "--headed",
-        action="store_false",
-        dest="headless",
-        help="Run browser in headed mode (show browser window)",
-    )
+    _add_explore_arguments(explore_parser)
     explore_parser.set_defaults(func=explore_command)
 
-    # Parse args
-    args = parser.parse_args()
+    return parser
+
+
+# Subcommand -> (parser builder, handler). Dispatch peeks at argv so only
+# the requested subcommand's parser is ever constructed; the full parser
+# (every subparser materialized) is only built for help and error paths.
+_COMMANDS = {
+    "explore": (_build_explore_parser, explore_command),
+}
+
+
+def main():
+    """Main CLI entry point."""
+    argv = sys.argv[1:]
+
+    command = _COMMANDS.get(argv[0]) if argv else None
+    if command is not None:
+        build_parser, handler = command
+        handler(build_parser().parse_args(argv[1:]))
+        return
+
+    parser = _build_full_parser()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
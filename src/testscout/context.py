@@ -10,12 +10,18 @@ Captures everything that happens during a test:
 """
 
 import hashlib
+import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# dataclass(slots=True) needs 3.10+; captured logs and requests are
+# created in bulk, so the per-instance __dict__ is worth dropping
+_SLOTS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class LogLevel(Enum):
     DEBUG = "debug"
@@ -25,7 +31,7 @@ class LogLevel(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(**_SLOTS_KWARGS)
 class ConsoleLog:
     """A single console message."""
 
@@ -45,7 +51,7 @@ class ConsoleLog:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS_KWARGS)
 class NetworkRequest:
     """A network request/response."""
 
@@ -67,7 +73,7 @@ class NetworkRequest:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS_KWARGS)
 class AIVerification:
     """Record of an AI decision or verification."""
 
@@ -113,6 +119,9 @@ class Context:
     ai_verifications: List[AIVerification] = field(default_factory=list)
     screenshots: Dict[str, bytes] = field(default_factory=dict)
     _screenshot_cache: Dict[str, str] = field(default_factory=dict)  # hash -> timestamp
+    # Bumped on every captured event; lets consumers skip re-scanning
+    # the logs when nothing new has arrived
+    _event_seq: int = 0
 
     # Critical error patterns (framework-specific)
     CRITICAL_PATTERNS = [
@@ -143,6 +152,10 @@ class Context:
         "undefined is not an object",
     ]
 
+    # One compiled alternation: a single scan per log line replaces a
+    # substring search per pattern
+    _CRITICAL_RE = re.compile("|".join(re.escape(p) for p in CRITICAL_PATTERNS))
+
     def attach_to_page(self, page):
         """Attach event listeners to capture page activity."""
 
@@ -156,6 +169,7 @@ class Context:
                 "debug": LogLevel.DEBUG,
             }
             level = level_map.get(msg.type, LogLevel.LOG)
+            self._event_seq += 1
             self.console_logs.append(
                 ConsoleLog(
                     level=level,
@@ -166,9 +180,11 @@ class Context:
             )
 
         def on_page_error(error):
+            self._event_seq += 1
             self.page_errors.append(str(error))
 
         def on_response(response):
+            self._event_seq += 1
             self.network_requests.append(
                 NetworkRequest(
                     url=response.url,
@@ -190,6 +206,7 @@ class Context:
                     else str(failure) if failure else "Unknown"
                 )
             )
+            self._event_seq += 1
             self.network_requests.append(
                 NetworkRequest(
                     url=request.url,
@@ -210,7 +227,7 @@ class Context:
 
     def save_screenshot(self, name: str, data: bytes) -> str:
         """Save a screenshot with deduplication."""
-        hash_val = hashlib.sha256(data).hexdigest()[:16]
+        hash_val = self.get_screenshot_hash(data)
         if hash_val in self._screenshot_cache:
             return self._screenshot_cache[hash_val]
         self.screenshots[name] = data
@@ -219,12 +236,15 @@ class Context:
 
     def is_screenshot_cached(self, data: bytes) -> bool:
         """Check if we've seen this exact screenshot before."""
-        hash_val = hashlib.sha256(data).hexdigest()[:16]
-        return hash_val in self._screenshot_cache
+        return self.get_screenshot_hash(data) in self._screenshot_cache
 
     def get_screenshot_hash(self, data: bytes) -> str:
-        """Get hash for a screenshot."""
-        return hashlib.sha256(data).hexdigest()[:16]
+        """Get hash for a screenshot.
+
+        blake2b hashes multi-megabyte PNGs noticeably faster than
+        sha256, and a 16-byte digest is plenty for dedup fingerprints.
+        """
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
 
     @property
     def errors(self) -> List[str]:
@@ -232,6 +252,27 @@ class Context:
         console_errors = [log.text for log in self.console_logs if log.level == LogLevel.ERROR]
         return console_errors + self.page_errors
 
+    def recent_errors(self, n: int = 5) -> List[str]:
+        """Last ``n`` error messages without building the full errors list.
+
+        ``self.errors`` rebuilds and concatenates every captured error on
+        each access; callers that only want the tail (bug reports show the
+        most recent few) can walk backwards from the end instead.
+        """
+        out: List[str] = []
+        for msg in reversed(self.page_errors):
+            out.append(msg)
+            if len(out) == n:
+                break
+        if len(out) < n:
+            for log in reversed(self.console_logs):
+                if log.level == LogLevel.ERROR:
+                    out.append(log.text)
+                    if len(out) == n:
+                        break
+        out.reverse()
+        return out
+
     @property
     def warnings(self) -> List[str]:
         """Get all warning messages."""
@@ -244,16 +285,13 @@ class Context:
 
     def has_critical_errors(self) -> bool:
         """Check if any critical errors occurred."""
-        all_errors = " ".join(self.errors)
-        return any(pattern in all_errors for pattern in self.CRITICAL_PATTERNS)
+        search = self._CRITICAL_RE.search
+        return any(search(error) for error in self.errors)
 
     def get_critical_errors(self) -> List[str]:
         """Get list of critical errors."""
-        critical = []
-        for error in self.errors:
-            if any(pattern in error for pattern in self.CRITICAL_PATTERNS):
-                critical.append(error)
-        return critical
+        search = self._CRITICAL_RE.search
+        return [error for error in self.errors if search(error)]
 
     def summary(self) -> Dict[str, Any]:
         """Generate summary statistics."""
@@ -10,10 +10,16 @@ This solves the core problem: AI can SEE a button visually but fails to
 generate a working CSS selector. With SoM, AI just says "click element 4".
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+# slots=True drops the per-instance __dict__ (one DiscoveredElement is
+# built per element per discover call), but the keyword only exists on
+# Python 3.10+
+_SLOTS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class ElementType(Enum):
     BUTTON = "button"
@@ -27,7 +33,12 @@ class ElementType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+# Value -> member table: a dict hit per element beats routing through the
+# enum's __call__ lookup machinery
+_ELEMENT_TYPE_BY_VALUE = {et.value: et for et in ElementType}
+
+
+@dataclass(**_SLOTS_KWARGS)
 class DiscoveredElement:
     """An element found on the page with its properties."""
 
@@ -39,19 +50,27 @@ class DiscoveredElement:
     aria_label: str
     name: str
     id: str
-    classes: List[str]
-    href: Optional[str]
-    src: Optional[str]
     is_visible: bool
     is_enabled: bool
-    bounding_box: Dict[str, float]
+    # Heavy fields are not part of the slim discovery payload; they stay
+    # None until fetched on demand via ElementDiscovery.get_details()
+    classes: Optional[List[str]] = None
+    href: Optional[str] = None
+    src: Optional[str] = None
+    bounding_box: Optional[Dict[str, float]] = None
+    # Casefolded text computed once at construction; find_by_text would
+    # otherwise re-lowercase every element on every call
+    _text_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._text_lower = (self.text or "").casefold()
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "ai_id": self.ai_id,
             "type": self.element_type.value,
             "tag": self.tag,
-            "text": self.text[:100] if self.text else "",
+            "text": self.text[:100],
             "placeholder": self.placeholder,
             "aria_label": self.aria_label,
             "name": self.name,
@@ -71,57 +90,91 @@ class PageElements:
 
     elements: List[DiscoveredElement] = field(default_factory=list)
     screenshot_hash: Optional[str] = None
+    # Memoized to_prompt_summary result; a PageElements is a per-discover()
+    # snapshot, so the summary never changes once built
+    _summary_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # Lookup indices built once at construction (same snapshot reasoning):
+    # find_by_id runs once per AI action step, so it should be a dict hit,
+    # not a linear scan
+    _by_id: Dict[int, DiscoveredElement] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_type: Dict[ElementType, List[DiscoveredElement]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        for el in self.elements:
+            self._by_id[el.ai_id] = el
+            self._by_type.setdefault(el.element_type, []).append(el)
 
     def find_by_id(self, ai_id: int) -> Optional[DiscoveredElement]:
-        for el in self.elements:
-            if el.ai_id == ai_id:
-                return el
-        return None
+        return self._by_id.get(ai_id)
 
     def find_by_text(self, text: str, partial: bool = True) -> List[DiscoveredElement]:
-        results = []
-        text_lower = text.lower()
-        for el in self.elements:
-            el_text = (el.text or "").lower()
-            if partial and text_lower in el_text:
-                results.append(el)
-            elif not partial and text_lower == el_text:
-                results.append(el)
-        return results
+        needle = text.casefold()
+        if partial:
+            return [el for el in self.elements if needle in el._text_lower]
+        return [el for el in self.elements if needle == el._text_lower]
 
     def find_by_type(self, element_type: ElementType) -> List[DiscoveredElement]:
-        return [el for el in self.elements if el.element_type == element_type]
+        return self._by_type.get(element_type, [])
 
     def to_prompt_summary(self) -> str:
-        """Generate a summary for AI prompts."""
-        if not self.elements:
-            return "No interactive elements found on page."
+        """Generate a summary for AI prompts.
 
-        lines = ["Interactive elements on page:"]
-        for el in self.elements:
-            desc = f"  [{el.ai_id}] {el.element_type.value}"
-            if el.text:
-                desc += f' "{el.text[:50]}"'
-            if el.placeholder:
-                desc += f" (placeholder: {el.placeholder})"
-            if el.aria_label:
-                desc += f" (aria: {el.aria_label})"
-            lines.append(desc)
-        return "\n".join(lines)
-
-
-# JavaScript to inject into page for Set-of-Marks
+        Memoized: several backend calls against the same page snapshot
+        (multi-assertion patterns are typical) serialize the element list
+        once instead of once per call.
+        """
+        if self._summary_cache is not None:
+            return self._summary_cache
+
+        if not self.elements:
+            summary = "No interactive elements found on page."
+        else:
+            lines = ["Interactive elements on page:"]
+            append = lines.append
+            for el in self.elements:
+                # One f-string per line instead of chained += concatenations,
+                # which allocate an intermediate string per optional part
+                text = f' "{el.text[:50]}"' if el.text else ""
+                placeholder = f" (placeholder: {el.placeholder})" if el.placeholder else ""
+                aria = f" (aria: {el.aria_label})" if el.aria_label else ""
+                append(f"  [{el.ai_id}] {el.element_type.value}{text}{placeholder}{aria}")
+            summary = "\n".join(lines)
+
+        self._summary_cache = summary
+        return summary
+
+
+# JavaScript to inject into page for Set-of-Marks. Takes a showMarkers
+# flag so discovery and marker drawing fuse into one evaluate round-trip -
+# each page.evaluate is a websocket round-trip, so the flag halves the CDP
+# chatter of a screenshot-with-markers step.
 SOM_INJECT_SCRIPT = """
-() => {
-    // Remove any existing markers
-    document.querySelectorAll('[data-testscout-id]').forEach(el => {
-        el.removeAttribute('data-testscout-id');
-        el.style.outline = '';
-    });
-    document.querySelectorAll('.testscout-marker').forEach(el => el.remove());
+({ showMarkers, viewportOnly }) => {
+    // Clear the previous run's state. The tracked arrays make this a walk
+    // over exactly the touched nodes; the selector walk only runs when no
+    // earlier discovery recorded them (fresh document, standalone use).
+    if (window.__testscout_tagged || window.__testscout_badges) {
+        (window.__testscout_tagged || []).forEach(el => {
+            el.removeAttribute('data-testscout-id');
+            el.style.outline = '';
+        });
+        (window.__testscout_badges || []).forEach(b => b.remove());
+    } else {
+        document.querySelectorAll('[data-testscout-id]').forEach(el => {
+            el.removeAttribute('data-testscout-id');
+            el.style.outline = '';
+        });
+        document.querySelectorAll('.testscout-marker').forEach(el => el.remove());
+    }
+    window.__testscout_badges = [];
 
-    // Find all interactive elements
-    const selectors = [
+    // One composite selector = one DOM traversal; the selector engine
+    // dedups elements matching several alternatives, so no seen-Set needed
+    const selector = [
         'button',
         'a[href]',
         'input:not([type="hidden"])',
@@ -135,65 +188,107 @@ SOM_INJECT_SCRIPT = """
         '[role="menuitem"]',
         '[onclick]',
         '[tabindex]:not([tabindex="-1"])',
-    ];
+    ].join(', ');
 
     const elements = [];
-    const seen = new Set();
-
-    selectors.forEach(selector => {
-        document.querySelectorAll(selector).forEach(el => {
-            if (seen.has(el)) return;
-            seen.add(el);
-
-            const rect = el.getBoundingClientRect();
-            const isVisible = rect.width > 0 && rect.height > 0 &&
-                             window.getComputedStyle(el).visibility !== 'hidden' &&
-                             window.getComputedStyle(el).display !== 'none';
-
-            if (!isVisible) return;
-
-            const id = elements.length;
-            el.setAttribute('data-testscout-id', id);
-
-            // Determine element type
-            let type = 'custom';
-            const tag = el.tagName.toLowerCase();
-            if (tag === 'button' || el.getAttribute('role') === 'button') type = 'button';
-            else if (tag === 'a') type = 'link';
-            else if (tag === 'input') {
-                const inputType = el.getAttribute('type') || 'text';
-                if (inputType === 'checkbox') type = 'checkbox';
-                else if (inputType === 'radio') type = 'radio';
-                else type = 'input';
-            }
-            else if (tag === 'select') type = 'select';
-            else if (tag === 'textarea') type = 'textarea';
-            else if (tag === 'img') type = 'image';
-
-            elements.push({
-                ai_id: id,
-                type: type,
-                tag: tag,
-                text: (el.innerText || el.textContent || '').trim().substring(0, 200),
-                placeholder: el.getAttribute('placeholder') || '',
-                aria_label: el.getAttribute('aria-label') || '',
-                name: el.getAttribute('name') || '',
-                id: el.getAttribute('id') || '',
-                classes: Array.from(el.classList),
-                href: el.getAttribute('href'),
-                src: el.getAttribute('src'),
-                is_visible: isVisible,
-                is_enabled: !el.disabled,
-                bounding_box: {
-                    x: rect.x,
-                    y: rect.y,
-                    width: rect.width,
-                    height: rect.height
-                }
-            });
+    const vw = window.innerWidth;
+    const vh = window.innerHeight;
+
+    // Badges collect in a fragment and attach once after the loop: one
+    // reflow instead of one per element
+    const frag = document.createDocumentFragment();
+    const scrollX = window.scrollX;
+    const scrollY = window.scrollY;
+
+    // Rects measured here are kept for the highlight script, which would
+    // otherwise force a fresh layout per element to place each badge
+    const rects = new WeakMap();
+    const tagged = [];
+    const badges = window.__testscout_badges;
+
+    document.querySelectorAll(selector).forEach(el => {
+        const rect = el.getBoundingClientRect();
+        // Zero-size check first: it is cheap and rules most elements
+        // out before the expensive getComputedStyle (which can flush
+        // style recalc), and the style object is read once, not twice
+        if (rect.width <= 0 || rect.height <= 0) return;
+        // The screenshot only captures the viewport, so elements outside
+        // it are invisible to the AI anyway; skip them unless asked not to
+        if (viewportOnly &&
+            (rect.bottom < 0 || rect.top > vh || rect.right < 0 || rect.left > vw)) return;
+        const cs = window.getComputedStyle(el);
+        if (cs.visibility === 'hidden' || cs.display === 'none') return;
+
+        const id = elements.length;
+        el.setAttribute('data-testscout-id', id);
+        rects.set(el, rect);
+        tagged.push(el);
+
+        if (showMarkers) {
+            // Add red border
+            el.style.outline = '2px solid #ff0000';
+            el.style.outlineOffset = '2px';
+
+            // Add number badge
+            const badge = document.createElement('div');
+            badge.className = 'testscout-marker';
+            badge.textContent = id;
+            badge.style.cssText = `
+                position: absolute;
+                background: #ff0000;
+                color: white;
+                font-size: 10px;
+                font-weight: bold;
+                padding: 1px 4px;
+                border-radius: 3px;
+                z-index: 999999;
+                pointer-events: none;
+            `;
+            badge.style.left = (rect.left + scrollX - 5) + 'px';
+            badge.style.top = (rect.top + scrollY - 12) + 'px';
+            frag.appendChild(badge);
+            badges.push(badge);
+        }
+
+        // Determine element type
+        let type = 'custom';
+        const tag = el.tagName.toLowerCase();
+        if (tag === 'button' || el.getAttribute('role') === 'button') type = 'button';
+        else if (tag === 'a') type = 'link';
+        else if (tag === 'input') {
+            const inputType = el.getAttribute('type') || 'text';
+            if (inputType === 'checkbox') type = 'checkbox';
+            else if (inputType === 'radio') type = 'radio';
+            else type = 'input';
+        }
+        else if (tag === 'select') type = 'select';
+        else if (tag === 'textarea') type = 'textarea';
+        else if (tag === 'img') type = 'image';
+
+        // Slim payload: the prompt summary only needs these fields, and
+        // CDP JSON transfer is O(payload). Class lists, urls and rects are
+        // fetched per element on demand (see the details script).
+        elements.push({
+            ai_id: id,
+            type: type,
+            tag: tag,
+            text: (el.innerText || el.textContent || '').trim().substring(0, 200),
+            placeholder: el.getAttribute('placeholder') || '',
+            aria_label: el.getAttribute('aria-label') || '',
+            name: el.getAttribute('name') || '',
+            id: el.getAttribute('id') || '',
+            is_visible: true,
+            is_enabled: !el.disabled
         });
     });
 
+    if (showMarkers) {
+        document.body.appendChild(frag);
+    }
+
+    window.__testscout_rects = rects;
+    window.__testscout_tagged = tagged;
+
     return elements;
 }
 """
@@ -201,6 +296,12 @@ SOM_INJECT_SCRIPT = """
 # JavaScript to add visual markers (red borders + number badges)
 SOM_HIGHLIGHT_SCRIPT = """
 (showMarkers) => {
+    const frag = document.createDocumentFragment();
+    const scrollX = window.scrollX;
+    const scrollY = window.scrollY;
+    const rects = window.__testscout_rects;
+    const badges = window.__testscout_badges || (window.__testscout_badges = []);
+
     document.querySelectorAll('[data-testscout-id]').forEach(el => {
         const id = el.getAttribute('data-testscout-id');
 
@@ -225,34 +326,145 @@ SOM_HIGHLIGHT_SCRIPT = """
                 pointer-events: none;
             `;
 
-            const rect = el.getBoundingClientRect();
-            badge.style.left = (rect.left + window.scrollX - 5) + 'px';
-            badge.style.top = (rect.top + window.scrollY - 12) + 'px';
-            document.body.appendChild(badge);
+            // Rect cached at discovery time; falling back to a live
+            // measurement only for elements tagged some other way
+            const rect = (rects && rects.get(el)) || el.getBoundingClientRect();
+            badge.style.left = (rect.left + scrollX - 5) + 'px';
+            badge.style.top = (rect.top + scrollY - 12) + 'px';
+            frag.appendChild(badge);
+            badges.push(badge);
         } else {
             // Remove markers
             el.style.outline = '';
         }
     });
 
-    if (!showMarkers) {
-        document.querySelectorAll('.testscout-marker').forEach(el => el.remove());
+    if (showMarkers) {
+        // Single append = single reflow for all badges
+        document.body.appendChild(frag);
+    } else {
+        badges.forEach(b => b.remove());
+        window.__testscout_badges = [];
     }
 }
 """
 
+# JavaScript to fetch the heavy fields for one chosen element
+SOM_DETAILS_SCRIPT = """
+(aiId) => {
+    const el = document.querySelector('[data-testscout-id="' + aiId + '"]');
+    if (!el) return null;
+    const rect = el.getBoundingClientRect();
+    return {
+        classes: Array.from(el.classList),
+        href: el.getAttribute('href'),
+        src: el.getAttribute('src'),
+        bounding_box: {
+            x: rect.x,
+            y: rect.y,
+            width: rect.width,
+            height: rect.height
+        }
+    };
+}
+"""
+
 # JavaScript to clean up all markers
 SOM_CLEANUP_SCRIPT = """
 () => {
-    document.querySelectorAll('[data-testscout-id]').forEach(el => {
-        el.removeAttribute('data-testscout-id');
-        el.style.outline = '';
-    });
-    document.querySelectorAll('.testscout-marker').forEach(el => el.remove());
+    // The discovery script tracks what it touched, so cleanup iterates
+    // those arrays instead of running two document-wide selector walks;
+    // the walks remain as a fallback for untracked state.
+    if (window.__testscout_tagged || window.__testscout_badges) {
+        (window.__testscout_tagged || []).forEach(el => {
+            el.removeAttribute('data-testscout-id');
+            el.style.outline = '';
+        });
+        (window.__testscout_badges || []).forEach(b => b.remove());
+    } else {
+        document.querySelectorAll('[data-testscout-id]').forEach(el => {
+            el.removeAttribute('data-testscout-id');
+            el.style.outline = '';
+        });
+        document.querySelectorAll('.testscout-marker').forEach(el => el.remove());
+    }
+    window.__testscout_tagged = [];
+    window.__testscout_badges = [];
 }
 """
 
 
+# The scripts above total several KB; shipping and reparsing them on every
+# call is wasted CDP traffic. They are registered once per page as
+# window.__testscout (add_init_script re-defines them on every navigation)
+# and each step then sends only a ~60-byte call stub.
+SOM_REGISTER_SCRIPT = (
+    "window.__testscout = {\n"
+    "    discover: " + SOM_INJECT_SCRIPT.strip() + ",\n"
+    "    highlight: " + SOM_HIGHLIGHT_SCRIPT.strip() + ",\n"
+    "    cleanup: " + SOM_CLEANUP_SCRIPT.strip() + ",\n"
+    "    details: " + SOM_DETAILS_SCRIPT.strip() + "\n"
+    "};"
+)
+
+# Function-wrapped form for page.evaluate (init scripts take bare statements)
+_SOM_DEFINE_FN = "() => { " + SOM_REGISTER_SCRIPT + " }"
+
+# Sentinel returned when the current document predates registration
+_SOM_MISSING = "__testscout_missing__"
+
+
+def _som_call_script(name: str) -> str:
+    return "(arg) => window.__testscout ? window.__testscout.%s(arg) : '%s'" % (name, _SOM_MISSING)
+
+
+_SOM_DISCOVER_CALL = _som_call_script("discover")
+_SOM_HIGHLIGHT_CALL = _som_call_script("highlight")
+_SOM_CLEANUP_CALL = _som_call_script("cleanup")
+_SOM_DETAILS_CALL = _som_call_script("details")
+
+
+def _build_page_elements(raw_elements: List[Dict[str, Any]]) -> PageElements:
+    """Construct a PageElements snapshot from the raw JS payload.
+
+    Shared by the sync and async discovery classes - one call site keeps
+    the hot per-element loop's bytecode (and its 3.11+ inline caches) in
+    one place instead of two drifting copies.
+    """
+    elements = []
+    for raw in raw_elements:
+        try:
+            el = DiscoveredElement(
+                ai_id=raw["ai_id"],
+                element_type=_ELEMENT_TYPE_BY_VALUE.get(raw["type"], ElementType.CUSTOM),
+                tag=raw["tag"],
+                text=raw["text"] or "",
+                placeholder=raw["placeholder"],
+                aria_label=raw["aria_label"],
+                name=raw["name"],
+                id=raw["id"],
+                is_visible=raw["is_visible"],
+                is_enabled=raw["is_enabled"],
+            )
+            elements.append(el)
+        except KeyError:
+            continue
+
+    return PageElements(elements=elements)
+
+
+def _apply_details(page_elements: Optional[PageElements], ai_id: int, details) -> None:
+    """Backfill on-demand heavy fields onto a discovered element."""
+    if details is None or page_elements is None:
+        return
+    el = page_elements.find_by_id(ai_id)
+    if el is not None:
+        el.classes = details["classes"]
+        el.href = details["href"]
+        el.src = details["src"]
+        el.bounding_box = details["bounding_box"]
+
+
 class ElementDiscovery:
     """
     Discovers and marks interactive elements on a page.
@@ -272,63 +484,92 @@ class ElementDiscovery:
         await discovery.cleanup()
     """
 
-    def __init__(self, page):
+    def __init__(self, page, image_format: str = "jpeg", quality: int = 70):
+        """
+        Args:
+            page: Playwright page object
+            image_format: Screenshot encoding - "jpeg" (default) is 5-10x
+                smaller than PNG on typical UI captures, which the vision
+                models downsample anyway; pass "png" for lossless captures
+            quality: JPEG quality (ignored for png)
+        """
         self.page = page
+        self.image_format = image_format
+        self.quality = quality
         self._last_elements: Optional[PageElements] = None
-
-    async def discover(self) -> PageElements:
-        """Discover all interactive elements and tag them with data-testscout-id."""
-        raw_elements = await self.page.evaluate(SOM_INJECT_SCRIPT)
-
-        elements = []
-        for raw in raw_elements:
-            try:
-                el = DiscoveredElement(
-                    ai_id=raw["ai_id"],
-                    element_type=ElementType(raw["type"]),
-                    tag=raw["tag"],
-                    text=raw["text"],
-                    placeholder=raw["placeholder"],
-                    aria_label=raw["aria_label"],
-                    name=raw["name"],
-                    id=raw["id"],
-                    classes=raw["classes"],
-                    href=raw.get("href"),
-                    src=raw.get("src"),
-                    is_visible=raw["is_visible"],
-                    is_enabled=raw["is_enabled"],
-                    bounding_box=raw["bounding_box"],
-                )
-                elements.append(el)
-            except Exception:
-                continue
-
-        self._last_elements = PageElements(elements=elements)
+        self._som_registered = False
+
+    def _screenshot_kwargs(self) -> Dict[str, Any]:
+        if self.image_format == "jpeg":
+            return {"type": "jpeg", "quality": self.quality}
+        return {"type": self.image_format}
+
+    async def _som(self, call_script: str, arg=None):
+        """Invoke a registered SoM function, defining the namespace lazily.
+
+        Documents loaded before registration return the missing sentinel;
+        the full source is then evaluated once and the call retried, so the
+        per-step payload stays a tiny stub in the steady state.
+        """
+        if not self._som_registered:
+            await self.page.add_init_script(SOM_REGISTER_SCRIPT)
+            self._som_registered = True
+        result = await self.page.evaluate(call_script, arg)
+        if result == _SOM_MISSING:
+            await self.page.evaluate(_SOM_DEFINE_FN)
+            result = await self.page.evaluate(call_script, arg)
+        return result
+
+    async def discover(self, show: bool = False, viewport_only: bool = True) -> PageElements:
+        """Discover all interactive elements and tag them with data-testscout-id.
+
+        With show=True the visual markers are drawn in the same evaluate
+        call, saving a round-trip over discover() + show_markers(). With
+        viewport_only (the default) elements outside the visible viewport
+        are skipped - the screenshot cannot show them to the AI anyway;
+        pass False when taking full-page screenshots.
+        """
+        raw_elements = await self._som(
+            _SOM_DISCOVER_CALL, {"showMarkers": show, "viewportOnly": viewport_only}
+        )
+
+        self._last_elements = _build_page_elements(raw_elements)
         return self._last_elements
 
+    async def get_details(self, ai_id: int) -> Optional[Dict[str, Any]]:
+        """Fetch the heavy fields (classes, href, src, bounding box) for
+        one element and backfill them onto the discovered snapshot."""
+        details = await self._som(_SOM_DETAILS_CALL, ai_id)
+        _apply_details(self._last_elements, ai_id, details)
+        return details
+
     async def show_markers(self):
         """Show visual markers (red borders + number badges) on elements."""
-        await self.page.evaluate(SOM_HIGHLIGHT_SCRIPT, True)
+        await self._som(_SOM_HIGHLIGHT_CALL, True)
 
     async def hide_markers(self):
         """Hide visual markers but keep data-testscout-id attributes."""
-        await self.page.evaluate(SOM_HIGHLIGHT_SCRIPT, False)
+        await self._som(_SOM_HIGHLIGHT_CALL, False)
 
     async def cleanup(self):
         """Remove all testscout attributes and markers from page."""
-        await self.page.evaluate(SOM_CLEANUP_SCRIPT)
+        await self._som(_SOM_CLEANUP_CALL)
 
     async def screenshot_with_markers(self) -> bytes:
-        """Take a screenshot with visual markers shown."""
-        await self.show_markers()
-        screenshot = await self.page.screenshot()
+        """Take a screenshot with visual markers shown.
+
+        Re-discovers with markers in one evaluate (updating .elements),
+        so callers can read the element list without a separate discover.
+        """
+        await self.discover(show=True)
+        screenshot = await self.page.screenshot(**self._screenshot_kwargs())
         await self.hide_markers()
         return screenshot
 
     async def screenshot_clean(self) -> bytes:
         """Take a screenshot without markers."""
         await self.hide_markers()
-        return await self.page.screenshot()
+        return await self.page.screenshot(**self._screenshot_kwargs())
 
     @property
     def elements(self) -> Optional[PageElements]:
@@ -340,58 +581,70 @@ class ElementDiscovery:
 class ElementDiscoverySync:
     """Synchronous version of ElementDiscovery."""
 
-    def __init__(self, page):
+    def __init__(self, page, image_format: str = "jpeg", quality: int = 70):
         self.page = page
+        self.image_format = image_format
+        self.quality = quality
         self._last_elements: Optional[PageElements] = None
-
-    def discover(self) -> PageElements:
-        """Discover all interactive elements and tag them with data-testscout-id."""
-        raw_elements = self.page.evaluate(SOM_INJECT_SCRIPT)
-
-        elements = []
-        for raw in raw_elements:
-            try:
-                el = DiscoveredElement(
-                    ai_id=raw["ai_id"],
-                    element_type=ElementType(raw["type"]),
-                    tag=raw["tag"],
-                    text=raw["text"],
-                    placeholder=raw["placeholder"],
-                    aria_label=raw["aria_label"],
-                    name=raw["name"],
-                    id=raw["id"],
-                    classes=raw["classes"],
-                    href=raw.get("href"),
-                    src=raw.get("src"),
-                    is_visible=raw["is_visible"],
-                    is_enabled=raw["is_enabled"],
-                    bounding_box=raw["bounding_box"],
-                )
-                elements.append(el)
-            except Exception:
-                continue
-
-        self._last_elements = PageElements(elements=elements)
+        self._som_registered = False
+
+    def _screenshot_kwargs(self) -> Dict[str, Any]:
+        if self.image_format == "jpeg":
+            return {"type": "jpeg", "quality": self.quality}
+        return {"type": self.image_format}
+
+    def _som(self, call_script: str, arg=None):
+        """Sync counterpart of ElementDiscovery._som."""
+        if not self._som_registered:
+            self.page.add_init_script(SOM_REGISTER_SCRIPT)
+            self._som_registered = True
+        result = self.page.evaluate(call_script, arg)
+        if result == _SOM_MISSING:
+            self.page.evaluate(_SOM_DEFINE_FN)
+            result = self.page.evaluate(call_script, arg)
+        return result
+
+    def discover(self, show: bool = False, viewport_only: bool = True) -> PageElements:
+        """Discover all interactive elements and tag them with data-testscout-id.
+
+        With show=True the visual markers are drawn in the same evaluate
+        call, saving a round-trip over discover() + show_markers(). With
+        viewport_only (the default) elements outside the visible viewport
+        are skipped - the screenshot cannot show them to the AI anyway;
+        pass False when taking full-page screenshots.
+        """
+        raw_elements = self._som(
+            _SOM_DISCOVER_CALL, {"showMarkers": show, "viewportOnly": viewport_only}
+        )
+
+        self._last_elements = _build_page_elements(raw_elements)
         return self._last_elements
 
+    def get_details(self, ai_id: int) -> Optional[Dict[str, Any]]:
+        """Sync counterpart of ElementDiscovery.get_details."""
+        details = self._som(_SOM_DETAILS_CALL, ai_id)
+        _apply_details(self._last_elements, ai_id, details)
+        return details
+
     def show_markers(self):
-        self.page.evaluate(SOM_HIGHLIGHT_SCRIPT, True)
+        self._som(_SOM_HIGHLIGHT_CALL, True)
 
     def hide_markers(self):
-        self.page.evaluate(SOM_HIGHLIGHT_SCRIPT, False)
+        self._som(_SOM_HIGHLIGHT_CALL, False)
 
     def cleanup(self):
-        self.page.evaluate(SOM_CLEANUP_SCRIPT)
+        self._som(_SOM_CLEANUP_CALL)
 
     def screenshot_with_markers(self) -> bytes:
-        self.show_markers()
-        screenshot = self.page.screenshot()
+        """Screenshot with markers; re-discovers in the same evaluate."""
+        self.discover(show=True)
+        screenshot = self.page.screenshot(**self._screenshot_kwargs())
         self.hide_markers()
         return screenshot
 
     def screenshot_clean(self) -> bytes:
         self.hide_markers()
-        return self.page.screenshot()
+        return self.page.screenshot(**self._screenshot_kwargs())
 
     @property
     def elements(self) -> Optional[PageElements]:
@@ -24,19 +24,48 @@ Usage:
     report.save("exploration_report.html")
 """
 
-import base64
 import hashlib
+import io
 import json
+import random
+import re
+import sys
+import tempfile
 import time
+from collections import Counter, deque
+from collections.abc import MutableMapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Deque, Dict, List, Optional, Set
 
 from .agent import Scout
 from .audit import AuditTrail
-from .context import Context
+from .backends._image import _sniff_mime
+from .context import Context, LogLevel
+
+# orjson serializes the report dict in C, which matters for sessions with
+# thousands of bugs; the stdlib encoder is the fallback (install the
+# "speed" extra to get orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# json5 tolerates common LLM formatting quirks (trailing commas,
+# single-quoted strings) that the strict stdlib parser rejects; used
+# only as a salvage pass so a cosmetic glitch doesn't cost a multi-second
+# model round trip. Purely optional - without it we just retry as before.
+try:
+    import json5
+except ImportError:
+    json5 = None
+
+# Greedy first-brace-to-last-brace span, for pulling the JSON object out
+# of any prose the model wraps around it
+_JSON_BLOCK = re.compile(r"\{.*\}", re.DOTALL)
 
 
 class BugSeverity(Enum):
@@ -47,6 +76,24 @@ class BugSeverity(Enum):
     INFO = "info"  # Observation, potential issue
 
 
+# Redirect statuses marking the intermediate document hops an action can
+# pass through before settling on its final URL
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+# Badge colors for the HTML report, shared across all bug rows
+_SEVERITY_COLOR = {
+    BugSeverity.CRITICAL: "#dc2626",
+    BugSeverity.HIGH: "#ea580c",
+    BugSeverity.MEDIUM: "#ca8a04",
+    BugSeverity.LOW: "#16a34a",
+    BugSeverity.INFO: "#6b7280",
+}
+
+# Uppercased badge labels, precomputed so the row loop does a dict
+# lookup instead of enum-descriptor + str.upper per bug
+_SEVERITY_LABEL = {s: s.value.upper() for s in BugSeverity}
+
+
 @dataclass
 class Bug:
     """A discovered bug or issue."""
@@ -59,7 +106,9 @@ class Bug:
     screenshot: Optional[bytes] = None
     console_errors: List[str] = field(default_factory=list)
     network_errors: List[str] = field(default_factory=list)
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Epoch nanoseconds: an int beats constructing a datetime per bug on
+    # the detection hot path; formatted only on serialization
+    timestamp_ns: int = field(default_factory=time.time_ns)
     element_context: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
@@ -71,7 +120,7 @@ class Bug:
             "url": self.url,
             "console_errors": self.console_errors,
             "network_errors": self.network_errors,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": datetime.fromtimestamp(self.timestamp_ns / 1e9).isoformat(),
             "element_context": self.element_context,
         }
 
@@ -81,15 +130,22 @@ class ExplorationState:
     """Tracks the exploration state to avoid loops."""
 
     visited_urls: Set[str] = field(default_factory=set)
-    clicked_elements: Set[str] = field(default_factory=set)  # hash of element + url
+    clicked_elements: Set[bytes] = field(default_factory=set)  # hash of element + url
     page_states: Dict[str, str] = field(default_factory=dict)  # url -> dom_hash
-    action_history: List[str] = field(default_factory=list)
+    # Bounded: only the recent tail is ever shown to the AI, and the
+    # audit trail keeps the full log
+    action_history: Deque[str] = field(default_factory=lambda: deque(maxlen=256))
     current_depth: int = 0
     start_url: str = ""
 
-    def element_key(self, url: str, element_desc: str) -> str:
-        """Create unique key for an element on a page."""
-        return hashlib.md5(f"{url}:{element_desc}".encode()).hexdigest()
+    def element_key(self, url: str, element_desc: str) -> bytes:
+        """Create unique key for an element on a page.
+
+        Raw 16-byte digests instead of 32-char hex: the keys are opaque set
+        members checked on every loop iteration, so half the bytes and no
+        hexlify step on the hot path.
+        """
+        return hashlib.blake2b(f"{url}:{element_desc}".encode(), digest_size=16).digest()
 
     def has_visited_element(self, url: str, element_desc: str) -> bool:
         return self.element_key(url, element_desc) in self.clicked_elements
@@ -100,6 +156,49 @@ class ExplorationState:
     def add_action(self, action: str):
         self.action_history.append(action)
 
+    def recent_actions(self, n: int) -> List[str]:
+        """Last n actions, oldest first."""
+        history = self.action_history
+        return list(islice(history, max(0, len(history) - n), len(history)))
+
+
+class ScreenshotStore(MutableMapping):
+    """Dict-like store for screenshots that spills cold bytes to disk.
+
+    Each capture is a few hundred KB; a long run holding them all in a
+    plain dict keeps tens of MB alive for the whole session. Values go
+    into per-key SpooledTemporaryFiles instead: small ones stay in RAM,
+    anything past the threshold rolls over to disk transparently.
+    """
+
+    # Per-entry RAM budget before a capture rolls over to a temp file
+    _MAX_IN_MEMORY = 1024 * 1024
+
+    def __init__(self):
+        self._files: Dict[str, tempfile.SpooledTemporaryFile] = {}
+
+    def __setitem__(self, name: str, data: bytes):
+        f = tempfile.SpooledTemporaryFile(max_size=self._MAX_IN_MEMORY)
+        f.write(data)
+        old = self._files.get(name)
+        if old is not None:
+            old.close()
+        self._files[name] = f
+
+    def __getitem__(self, name: str) -> bytes:
+        f = self._files[name]
+        f.seek(0)
+        return f.read()
+
+    def __delitem__(self, name: str):
+        self._files.pop(name).close()
+
+    def __iter__(self):
+        return iter(self._files)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
 
 @dataclass
 class ExplorationReport:
@@ -112,16 +211,17 @@ class ExplorationReport:
     duration_seconds: float = 0
     coverage_summary: Dict[str, int] = field(default_factory=dict)
     ai_observations: List[str] = field(default_factory=list)
-    screenshots: Dict[str, bytes] = field(default_factory=dict)
+    screenshots: MutableMapping = field(default_factory=ScreenshotStore)
 
     def add_bug(self, bug: Bug):
         self.bugs.append(bug)
 
     def summary(self) -> str:
-        critical = sum(1 for b in self.bugs if b.severity == BugSeverity.CRITICAL)
-        high = sum(1 for b in self.bugs if b.severity == BugSeverity.HIGH)
-        medium = sum(1 for b in self.bugs if b.severity == BugSeverity.MEDIUM)
-        low = sum(1 for b in self.bugs if b.severity == BugSeverity.LOW)
+        counts = Counter(b.severity for b in self.bugs)
+        critical = counts[BugSeverity.CRITICAL]
+        high = counts[BugSeverity.HIGH]
+        medium = counts[BugSeverity.MEDIUM]
+        low = counts[BugSeverity.LOW]
 
         return f"""
 EXPLORATION REPORT
@@ -139,56 +239,42 @@ BUGS FOUND: {len(self.bugs)}
 """
 
     def to_html(self) -> str:
-        """Generate HTML report."""
-        bug_rows = []
-        for i, bug in enumerate(self.bugs):
-            steps = "<br>".join(f"{j + 1}. {s}" for j, s in enumerate(bug.reproduction_steps))
-            errors = "<br>".join(bug.console_errors[:5]) if bug.console_errors else "None"
-
-            severity_color = {
-                BugSeverity.CRITICAL: "#dc2626",
-                BugSeverity.HIGH: "#ea580c",
-                BugSeverity.MEDIUM: "#ca8a04",
-                BugSeverity.LOW: "#16a34a",
-                BugSeverity.INFO: "#6b7280",
-            }.get(bug.severity, "#6b7280")
-
-            bug_rows.append(
-                f"""
-            <tr>
-                <td><span style="background:{severity_color};color:white;padding:2px 8px;border-radius:4px">{bug.severity.value.upper()}</span></td>
-                <td><strong>{bug.title}</strong><br><small>{bug.description}</small></td>
-                <td><small>{steps}</small></td>
-                <td><small style="color:#dc2626">{errors}</small></td>
-            </tr>
-            """
-            )
+        """Generate HTML report.
 
-        return f"""
+        Streams into a StringIO rather than interpolating one giant
+        f-string, so large reports are built in ~1x final size instead
+        of copying every intermediate string.
+        """
+        buf = io.StringIO()
+        w = buf.write
+
+        w("""
 <!DOCTYPE html>
 <html>
 <head>
     <title>TestScout Exploration Report</title>
     <style>
-        body {{ font-family: system-ui, sans-serif; margin: 40px; background: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 40px; border-radius: 8px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); }}
-        h1 {{ color: #1f2937; }}
-        .summary {{ display: grid; grid-template-columns: repeat(4, 1fr); gap: 20px; margin: 20px 0; }}
-        .stat {{ background: #f3f4f6; padding: 20px; border-radius: 8px; text-align: center; }}
-        .stat-value {{ font-size: 2em; font-weight: bold; color: #4f46e5; }}
-        .stat-label {{ color: #6b7280; }}
-        table {{ width: 100%; border-collapse: collapse; margin-top: 20px; }}
-        th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #e5e7eb; }}
-        th {{ background: #f9fafb; }}
-        .observations {{ background: #fef3c7; padding: 20px; border-radius: 8px; margin-top: 20px; }}
+        body { font-family: system-ui, sans-serif; margin: 40px; background: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 40px; border-radius: 8px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); }
+        h1 { color: #1f2937; }
+        .summary { display: grid; grid-template-columns: repeat(4, 1fr); gap: 20px; margin: 20px 0; }
+        .stat { background: #f3f4f6; padding: 20px; border-radius: 8px; text-align: center; }
+        .stat-value { font-size: 2em; font-weight: bold; color: #4f46e5; }
+        .stat-label { color: #6b7280; }
+        table { width: 100%; border-collapse: collapse; margin-top: 20px; }
+        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #e5e7eb; }
+        th { background: #f9fafb; }
+        .observations { background: #fef3c7; padding: 20px; border-radius: 8px; margin-top: 20px; }
     </style>
 </head>
 <body>
     <div class="container">
         <h1>🔍 TestScout Exploration Report</h1>
-        <p>Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
-        <p>Start URL: <a href="{self.start_url}">{self.start_url}</a></p>
+""")
+        w(f'        <p>Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>\n')
+        w(f'        <p>Start URL: <a href="{self.start_url}">{self.start_url}</a></p>\n')
 
+        w(f"""
         <div class="summary">
             <div class="stat">
                 <div class="stat-value">{len(self.bugs)}</div>
@@ -216,25 +302,44 @@ BUGS FOUND: {len(self.bugs)}
                 <th>Reproduction Steps</th>
                 <th>Errors</th>
             </tr>
-            {"".join(bug_rows) if bug_rows else "<tr><td colspan='4'>No bugs found! 🎉</td></tr>"}
-        </table>
+""")
+
+        if self.bugs:
+            for bug in self.bugs:
+                steps = "<br>".join(f"{j + 1}. {s}" for j, s in enumerate(bug.reproduction_steps))
+                errors = "<br>".join(bug.console_errors[:5]) if bug.console_errors else "None"
+                severity_color = _SEVERITY_COLOR.get(bug.severity, "#6b7280")
 
-        {
-            f'''
+                w(f"""
+            <tr>
+                <td><span style="background:{severity_color};color:white;padding:2px 8px;border-radius:4px">{_SEVERITY_LABEL[bug.severity]}</span></td>
+                <td><strong>{bug.title}</strong><br><small>{bug.description}</small></td>
+                <td><small>{steps}</small></td>
+                <td><small style="color:#dc2626">{errors}</small></td>
+            </tr>
+            """)
+        else:
+            w("            <tr><td colspan='4'>No bugs found! 🎉</td></tr>\n")
+
+        w("        </table>\n")
+
+        if self.ai_observations:
+            w("""
         <div class="observations">
             <h3>🤖 AI Observations</h3>
             <ul>
-                {"".join(f"<li>{obs}</li>" for obs in self.ai_observations)}
-            </ul>
+""")
+            for obs in self.ai_observations:
+                w(f"                <li>{obs}</li>\n")
+            w("""            </ul>
         </div>
-        '''
-            if self.ai_observations
-            else ""
-        }
-    </div>
+""")
+
+        w("""    </div>
 </body>
 </html>
-"""
+""")
+        return buf.getvalue()
 
     def save(self, filepath: str):
         """Save report to file."""
@@ -245,47 +350,31 @@ BUGS FOUND: {len(self.bugs)}
             with open(filepath, "w") as f:
                 f.write(self.to_html())
         elif filepath.endswith(".json"):
-            with open(filepath, "w") as f:
-                json.dump(
-                    {
-                        "start_url": self.start_url,
-                        "bugs": [b.to_dict() for b in self.bugs],
-                        "pages_visited": self.pages_visited,
-                        "actions_taken": self.actions_taken,
-                        "duration_seconds": self.duration_seconds,
-                        "ai_observations": self.ai_observations,
-                    },
-                    f,
-                    indent=2,
-                )
+            obj = {
+                "start_url": self.start_url,
+                "bugs": [b.to_dict() for b in self.bugs],
+                "pages_visited": self.pages_visited,
+                "actions_taken": self.actions_taken,
+                "duration_seconds": self.duration_seconds,
+                "ai_observations": self.ai_observations,
+            }
+            if orjson is not None:
+                with open(filepath, "wb") as f:
+                    f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, "w", buffering=65536) as f:
+                    json.dump(obj, f, indent=2)
         else:
             with open(filepath, "w") as f:
                 f.write(self.summary())
                 f.write("\n\nBUGS:\n")
                 for bug in self.bugs:
-                    f.write(f"\n[{bug.severity.value.upper()}] {bug.title}\n")
+                    f.write(f"\n[{_SEVERITY_LABEL[bug.severity]}] {bug.title}\n")
                     f.write(f"  {bug.description}\n")
                     f.write(f"  Steps: {' -> '.join(bug.reproduction_steps)}\n")
 
 
-class Explorer:
-    """
-    Autonomous QA Agent that explores web applications to find bugs.
-
-    The Explorer:
-    1. Starts at a URL and autonomously navigates
-    2. Clicks buttons, fills forms, explores menus
-    3. Detects JS errors, network failures, broken UI
-    4. Reports bugs with reproduction steps
-
-    Usage:
-        explorer = Explorer(page, api_key="...")
-        report = explorer.explore("http://localhost:8888", max_actions=100)
-        print(report.summary())
-        report.save("report.html")
-    """
-
-    EXPLORE_PROMPT = """You are an autonomous QA engineer exploring a web application as a BRAND NEW USER.
+_EXPLORE_PROMPT = """You are an autonomous QA engineer exploring a web application as a BRAND NEW USER.
 
 CURRENT PAGE: {url}
 ALREADY CLICKED (avoid these): {clicked}
@@ -341,6 +430,57 @@ Return JSON:
 }}
 """
 
+
+def _split_prompt_template(template):
+    """Split a .format-style template at {url}/{clicked}/{elements} once.
+
+    Rendering then joins five strings instead of re-scanning the ~2KB
+    template (and its {{ }} escapes) with str.format on every iteration.
+    """
+    head, rest = template.split("{url}")
+    mid1, rest = rest.split("{clicked}")
+    mid2, tail = rest.split("{elements}")
+    return tuple(p.replace("{{", "{").replace("}}", "}") for p in (head, mid1, mid2, tail))
+
+
+_EXPLORE_PARTS = _split_prompt_template(_EXPLORE_PROMPT)
+
+
+def _render_explore_prompt(url: str, clicked: str, elements: str) -> str:
+    """Render the explore prompt from the pre-split template."""
+    head, mid1, mid2, tail = _EXPLORE_PARTS
+    return "".join((head, url, mid1, clicked, mid2, elements, tail))
+
+
+def _backoff(attempt: int) -> float:
+    """Exponential retry delay with jitter, capped at 8 seconds.
+
+    A fixed sleep underwaits when the service is actually loaded and
+    overwaits on one-off glitches; the jitter keeps concurrent explorers
+    from retrying in lockstep.
+    """
+    return min(8.0, 0.25 * (2**attempt)) + random.uniform(0, 0.25)
+
+
+class Explorer:
+    """
+    Autonomous QA Agent that explores web applications to find bugs.
+
+    The Explorer:
+    1. Starts at a URL and autonomously navigates
+    2. Clicks buttons, fills forms, explores menus
+    3. Detects JS errors, network failures, broken UI
+    4. Reports bugs with reproduction steps
+
+    Usage:
+        explorer = Explorer(page, api_key="...")
+        report = explorer.explore("http://localhost:8888", max_actions=100)
+        print(report.summary())
+        report.save("report.html")
+    """
+
+    EXPLORE_PROMPT = _EXPLORE_PROMPT
+
     def __init__(
         self,
         page,
@@ -361,6 +501,27 @@ Return JSON:
         self.state = ExplorationState()
         self.report = ExplorationReport(start_url="")
 
+        # Single-slot cache for the element prompt summary, keyed by
+        # (url, element signature): when an action didn't change the DOM
+        # the summary from the previous iteration is reused as-is
+        self._summary_cache_key: Optional[Any] = None
+        self._summary_cache_value: Any = None
+
+        # Context event counter at the last bug scan; lets _check_for_bugs
+        # return immediately when nothing new has been captured
+        self._bug_check_seq = -1
+        # High-water marks into the context logs so each captured error is
+        # turned into a bug exactly once
+        self._processed_console_idx = 0
+        self._processed_page_error_idx = 0
+        self._processed_network_idx = 0
+
+        # Single-slot cache for discovery results, keyed by (url, DOM
+        # sentinel): the flow is discover -> ask AI -> discover again to
+        # act on the chosen element, and nothing touches the page in
+        # between, so the second full DOM walk is usually redundant
+        self._discover_cache: Optional[Any] = None
+
         # Audit trail for complete exploration history
         self.enable_audit = enable_audit
         self.audit = AuditTrail() if enable_audit else None
@@ -447,10 +608,12 @@ Return JSON:
             self.report.add_bug(blank_page_issue)
             # Still continue exploring to capture any console errors
 
-        self.state.visited_urls.add(start_url)
+        self.state.visited_urls.add(sys.intern(start_url))
         self.report.pages_visited = 1
 
         action_count = 0
+        # Network requests already scanned for redirect hops
+        redirect_scan_idx = len(self.context.network_requests)
 
         while action_count < max_actions:
             elapsed = time.time() - start_time
@@ -458,8 +621,12 @@ Return JSON:
                 self.report.ai_observations.append(f"Stopped: time limit ({max_time}s) reached")
                 break
 
+            # Snapshot the URL once per iteration; every page.url access is
+            # a CDP round-trip to the browser
+            current_url = self.page.url
+
             # Check for bugs on current page
-            self._check_for_bugs()
+            self._check_for_bugs(current_url)
 
             # Get AI's decision for next action
             decision = self._get_next_action()
@@ -509,11 +676,23 @@ Return JSON:
             # Action history is now updated inside _execute_exploration_action
             # with the actual element description instead of the AI's reason
 
-            # Check if we navigated to a new page
-            current_url = self.page.url
-            if current_url not in self.state.visited_urls:
-                self.state.visited_urls.add(current_url)
-                self.report.pages_visited += 1
+            # Check if we navigated to a new page (the action may have
+            # changed the URL, so this read has to be fresh). An action can
+            # also hop through several URLs via server redirects before
+            # settling; fold those in with one set union instead of per-url
+            # membership checks. Interning keeps one copy of each URL
+            # string no matter how often the same page is revisited.
+            requests = self.context.network_requests
+            new_urls = {
+                sys.intern(r.url)
+                for r in islice(requests, redirect_scan_idx, None)
+                if r.status in _REDIRECT_STATUSES and r.url.startswith(start_url)
+            }
+            redirect_scan_idx = len(requests)
+            new_urls.add(sys.intern(self.page.url))
+            new_urls -= self.state.visited_urls
+            self.state.visited_urls |= new_urls
+            self.report.pages_visited += len(new_urls)
 
             # Small delay between actions
             time.sleep(0.5)
@@ -559,7 +738,9 @@ Return JSON:
                        name like 'exploration_2024-11-29_153042/'
         """
         if not self.audit:
-            raise ValueError("Audit trail not enabled. Set enable_audit=True when creating Explorer.")
+            raise ValueError(
+                "Audit trail not enabled. Set enable_audit=True when creating Explorer."
+            )
 
         self.audit.save(output_dir)
 
@@ -575,41 +756,31 @@ Return JSON:
         Returns a Bug if blank page detected, None otherwise.
         """
         try:
-            # Check multiple indicators of a blank page
-            checks = []
-
-            # Check 1: Body has minimal content
-            body_length = self.page.evaluate("document.body?.innerHTML?.length || 0")
-            checks.append(("body_content", body_length > 100))
-
-            # Check 2: Check for common SPA root elements with content
-            root_selectors = ["#root", "#app", "#__next", ".app", "[data-reactroot]"]
-            has_spa_content = False
-            for selector in root_selectors:
-                try:
-                    content_length = self.page.evaluate(
-                        f'document.querySelector("{selector}")?.innerHTML?.length || 0'
-                    )
-                    if content_length > 50:
-                        has_spa_content = True
-                        break
-                except Exception:
-                    pass
-            checks.append(("spa_root_content", has_spa_content))
-
-            # Check 3: Page has visible text content
-            visible_text_length = self.page.evaluate(
-                "document.body?.innerText?.trim()?.length || 0"
-            )
-            checks.append(("visible_text", visible_text_length > 20))
+            # Gather every measurement in a single evaluate call; each
+            # page.evaluate is its own CDP round-trip, so probing the
+            # indicators one by one cost up to ten of them
+            measured = self.page.evaluate("""() => {
+                // One comma-unioned selector walks the DOM once instead of
+                // probing each SPA root separately
+                let spa = 0;
+                for (const root of document.querySelectorAll('#root, #app, #__next, .app, [data-reactroot]')) {
+                    spa = Math.max(spa, root.innerHTML.length);
+                }
+                return {
+                    body: document.body?.innerHTML?.length || 0,
+                    spa,
+                    text: document.body?.innerText?.trim()?.length || 0,
+                    interactive: document.querySelectorAll('button, a, input, select, [role="button"]').length,
+                };
+            }""")
 
-            # Check 4: Page has interactive elements
-            interactive_count = self.page.evaluate(
-                """
-                document.querySelectorAll('button, a, input, select, [role="button"]').length
-            """
-            )
-            checks.append(("interactive_elements", interactive_count > 0))
+            # Check multiple indicators of a blank page
+            checks = [
+                ("body_content", measured["body"] > 100),
+                ("spa_root_content", measured["spa"] > 50),
+                ("visible_text", measured["text"] > 20),
+                ("interactive_elements", measured["interactive"] > 0),
+            ]
 
             # If most checks fail, it's likely a blank page
             passed = sum(1 for _, result in checks if result)
@@ -621,7 +792,7 @@ Return JSON:
                     diagnostics.append(f"{name}: {'PASS' if result else 'FAIL'}")
 
                 # Check for console errors that might explain why
-                console_errors = list(self.context.errors[-5:]) if self.context.errors else []
+                console_errors = self.context.recent_errors(5)
 
                 description = (
                     f"The page appears to be blank or failed to render. "
@@ -652,32 +823,60 @@ Return JSON:
                 url=self.page.url,
             )
 
-    def _check_for_bugs(self):
-        """Check current page state for bugs."""
-        # Check context for console errors
-        if self.context.has_critical_errors():
-            for error in self.context.get_critical_errors():
+    def _check_for_bugs(self, current_url: str):
+        """Check current page state for bugs.
+
+        Takes the caller's URL snapshot instead of re-reading page.url
+        per bug, which would cost a CDP round-trip each time.
+        """
+        # Nothing captured since the last scan means nothing new to report
+        seq = self.context._event_seq
+        if seq == self._bug_check_seq:
+            return
+        self._bug_check_seq = seq
+
+        # Check context for console errors captured since the last scan;
+        # without the high-water marks every persisting error produced a
+        # duplicate bug per iteration
+        logs = self.context.console_logs
+        page_errors = self.context.page_errors
+        new_errors = [
+            log.text
+            for log in islice(logs, self._processed_console_idx, None)
+            if log.level == LogLevel.ERROR
+        ]
+        new_errors.extend(islice(page_errors, self._processed_page_error_idx, None))
+        self._processed_console_idx = len(logs)
+        self._processed_page_error_idx = len(page_errors)
+
+        for error in new_errors:
+            if self.context._CRITICAL_RE.search(error):
                 self.report.add_bug(
                     Bug(
                         severity=BugSeverity.CRITICAL,
                         title="JavaScript Error",
                         description=error[:200],
-                        reproduction_steps=list(self.state.action_history[-5:]),
-                        url=self.page.url,
+                        reproduction_steps=self.state.recent_actions(5),
+                        url=current_url,
                         console_errors=[error],
                     )
                 )
 
-        # Check for network errors
-        for req in self.context.network_errors:
+        # Check for new network errors
+        requests = self.context.network_requests
+        new_requests = islice(requests, self._processed_network_idx, None)
+        self._processed_network_idx = len(requests)
+        for req in new_requests:
+            if not req.failed:
+                continue
             if req.status == 500:
                 self.report.add_bug(
                     Bug(
                         severity=BugSeverity.CRITICAL,
                         title=f"Server Error 500: {req.url[:50]}",
                         description=f"Backend returned 500 error for {req.method} {req.url}",
-                        reproduction_steps=list(self.state.action_history[-5:]),
-                        url=self.page.url,
+                        reproduction_steps=self.state.recent_actions(5),
+                        url=current_url,
                         network_errors=[f"{req.status} {req.method} {req.url}"],
                     )
                 )
@@ -687,12 +886,37 @@ Return JSON:
                         severity=BugSeverity.MEDIUM,
                         title=f"HTTP Error {req.status}",
                         description=f"Request failed: {req.method} {req.url}",
-                        reproduction_steps=list(self.state.action_history[-5:]),
-                        url=self.page.url,
+                        reproduction_steps=self.state.recent_actions(5),
+                        url=current_url,
                         network_errors=[f"{req.status} {req.method} {req.url}"],
                     )
                 )
 
+    def _discover_cached(self):
+        """Discover elements, reusing the last result if the page is unchanged.
+
+        Keyed on URL plus a cheap DOM sentinel (readyState and body child
+        count) so SPA mutations without a navigation still invalidate.
+        Callers that mutate the page must clear ``self._discover_cache``.
+        """
+        url = self.page.url
+        try:
+            sentinel = self.page.evaluate(
+                "() => document.readyState + ':' + "
+                "(document.body ? document.body.childElementCount : -1)"
+            )
+        except Exception:
+            sentinel = None
+
+        if sentinel is not None and self._discover_cache is not None:
+            cached_url, cached_sentinel, cached_elements = self._discover_cache
+            if cached_url == url and cached_sentinel == sentinel:
+                return cached_elements
+
+        elements = self.scout.discovery.discover()
+        self._discover_cache = (url, sentinel, elements) if sentinel is not None else None
+        return elements
+
     def _get_next_action(self) -> Optional[Dict[str, Any]]:
         """Ask AI what to do next with retry logic for JSON parsing failures."""
         action_start_time = time.time()
@@ -700,40 +924,54 @@ Return JSON:
 
         try:
             # Get current elements
-            elements = self.scout.discovery.discover()
-            element_summary = elements.to_prompt_summary() if elements else "No elements"
+            elements = self._discover_cached()
+            current_url = self.page.url
+
+            if elements:
+                signature = hash(
+                    tuple((el.ai_id, el.tag, el.text, el.is_visible) for el in elements.elements)
+                )
+                cache_key = (current_url, signature)
+                if cache_key == self._summary_cache_key:
+                    element_summary, visible_elements = self._summary_cache_value
+                else:
+                    element_summary = elements.to_prompt_summary()
+                    # Compact tuples instead of 6-key dicts; the audit
+                    # trail expands them to its on-disk schema at encode time
+                    visible_elements = [
+                        (
+                            el.ai_id,
+                            el.tag,
+                            el.text[:100] if el.text else "",
+                            el.element_type.value if el.element_type else "unknown",
+                            el.is_visible,
+                            el.aria_label if el.aria_label else None,
+                        )
+                        for el in elements.elements
+                    ]
+                    self._summary_cache_key = cache_key
+                    self._summary_cache_value = (element_summary, visible_elements)
+            else:
+                element_summary = "No elements"
+                visible_elements = []
 
-            # Get screenshots (clean and marked)
+            # Get screenshots; the clean capture only exists for the audit
+            # trail, and a browser-side screenshot costs 50-200ms
             screenshot_marked = self.scout.discovery.screenshot_with_markers()
-            screenshot_clean = self.page.screenshot()
-            screenshot_b64 = base64.b64encode(screenshot_marked).decode("utf-8")
+            screenshot_clean = self.page.screenshot() if self.audit else None
+            # The SDK base64-encodes raw bytes itself in C; encoding here
+            # would just add two extra copies of a few-hundred-KB buffer
+            image_part = {"mime_type": _sniff_mime(screenshot_marked), "data": screenshot_marked}
 
             # Build prompt - show clicked elements (e.g., "clicked button: Menu Toggle")
-            clicked_summary = ", ".join(list(self.state.action_history[-10:])) or "None yet"
+            clicked_summary = ", ".join(self.state.recent_actions(10)) or "None yet"
 
-            prompt = self.EXPLORE_PROMPT.format(
-                url=self.page.url,
-                clicked=clicked_summary,
-                elements=element_summary,
-            )
+            prompt = _render_explore_prompt(current_url, clicked_summary, element_summary)
 
             # Start audit action recording
             if self.audit:
-                # Convert elements to serializable format
-                visible_elements = []
-                if elements:
-                    for el in elements.elements:
-                        visible_elements.append({
-                            "ai_id": el.ai_id,
-                            "tag": el.tag,
-                            "text": el.text[:100] if el.text else "",
-                            "type": el.element_type.value if el.element_type else "unknown",
-                            "visible": el.is_visible,
-                            "aria_label": el.aria_label if el.aria_label else None,
-                        })
-
                 self.audit.start_action(
-                    url=self.page.url,
+                    url=current_url,
                     screenshot_clean=screenshot_clean,
                     screenshot_marked=screenshot_marked,
                     visible_elements=visible_elements,
@@ -750,20 +988,20 @@ Return JSON:
                     # On retry, add a reminder about JSON format
                     current_prompt = prompt
                     if attempt > 0:
-                        current_prompt = prompt + "\n\nIMPORTANT: Return ONLY valid JSON, no markdown, no explanation text."
+                        current_prompt = (
+                            prompt
+                            + "\n\nIMPORTANT: Return ONLY valid JSON, no markdown, no explanation text."
+                        )
 
                     # Use generate_raw which handles fallback to cheaper models
                     raw_text, model_used = self.scout.backend.generate_raw(
-                        [
-                            current_prompt,
-                            {"mime_type": "image/png", "data": screenshot_b64},
-                        ]
+                        [current_prompt, image_part]
                     )
 
                     # Check for empty response
                     if not raw_text or not raw_text.strip():
                         last_error = "Empty response from AI"
-                        time.sleep(0.5)  # Brief pause before retry
+                        time.sleep(_backoff(attempt))
                         continue
 
                     # Parse response
@@ -781,13 +1019,19 @@ Return JSON:
 
                     # Try to extract JSON if there's extra text
                     if not text.startswith("{"):
-                        # Look for JSON object in the response
-                        start_idx = text.find("{")
-                        end_idx = text.rfind("}") + 1
-                        if start_idx != -1 and end_idx > start_idx:
-                            text = text[start_idx:end_idx]
-
-                    parsed = json.loads(text)
+                        match = _JSON_BLOCK.search(text)
+                        if match:
+                            text = match.group(0)
+
+                    try:
+                        parsed = json.loads(text)
+                    except json.JSONDecodeError:
+                        if json5 is None:
+                            raise
+                        # Salvage locally before retrying the model call
+                        parsed = json5.loads(text)
+                        if not isinstance(parsed, dict):
+                            raise
 
                     # Record AI response in audit
                     if self.audit:
@@ -799,19 +1043,26 @@ Return JSON:
                     return parsed
 
                 except json.JSONDecodeError as e:
-                    last_error = f"JSON parse error (attempt {attempt + 1}/{max_retries}): {str(e)[:50]}"
-                    time.sleep(1)  # Brief pause before retry
+                    # A malformed response is a formatting glitch, not load;
+                    # retry immediately instead of sleeping
+                    last_error = (
+                        f"JSON parse error (attempt {attempt + 1}/{max_retries}): {str(e)[:50]}"
+                    )
                     continue
                 except Exception as e:
                     error_str = str(e)
                     last_error = f"AI error (attempt {attempt + 1}/{max_retries}): {error_str[:50]}"
                     # Check for rate limit (429) error - wait longer
-                    if "429" in error_str or "quota" in error_str.lower() or "rate" in error_str.lower():
+                    if (
+                        "429" in error_str
+                        or "quota" in error_str.lower()
+                        or "rate" in error_str.lower()
+                    ):
                         wait_time = 35  # Wait 35 seconds for rate limit reset
                         print(f"Rate limit hit, waiting {wait_time}s before retry...")
                         time.sleep(wait_time)
                     else:
-                        time.sleep(1)
+                        time.sleep(_backoff(attempt))
                     continue
 
             # All retries failed
@@ -845,10 +1096,11 @@ Return JSON:
 
         try:
             if action_type == "click" and element_id is not None:
-                elements = self.scout.discovery.discover()
+                elements = self._discover_cached()
                 element = elements.find_by_id(element_id)
                 if element:
                     self.page.click(element.selector(), timeout=5000)
+                    self._discover_cache = None
                     # Store a clear element description, not the AI's reason
                     element_desc = f"{element.tag}"
                     if element.text:
@@ -861,10 +1113,11 @@ Return JSON:
                     return True
 
             elif action_type == "fill" and element_id is not None and text:
-                elements = self.scout.discovery.discover()
+                elements = self._discover_cached()
                 element = elements.find_by_id(element_id)
                 if element:
                     self.page.fill(element.selector(), text, timeout=5000)
+                    self._discover_cache = None
                     # Add to action_history
                     element_desc = f"{element.tag}"
                     if element.aria_label:
@@ -876,6 +1129,7 @@ Return JSON:
                 direction = action.get("direction", "down")
                 delta = -300 if direction == "up" else 300
                 self.page.mouse.wheel(0, delta)
+                self._discover_cache = None
                 self.state.add_action(f"scrolled {direction}")
                 return True
 
@@ -886,7 +1140,7 @@ Return JSON:
                     severity=BugSeverity.MEDIUM,
                     title=f"Action Failed: {action_type}",
                     description=f"Could not {action_type}: {str(e)[:100]}",
-                    reproduction_steps=list(self.state.action_history[-5:]) + [reason],
+                    reproduction_steps=self.state.recent_actions(5) + [reason],
                     url=self.page.url,
                 )
             )
@@ -914,8 +1168,8 @@ Return JSON:
 
         title = bug_data.get("title", "Unknown Issue")
         description = bug_data.get("description", "")
-        reproduction_steps = list(self.state.action_history[-5:])
-        console_errors = list(self.context.errors[-5:])
+        reproduction_steps = self.state.recent_actions(5)
+        console_errors = self.context.recent_errors(5)
 
         self.report.add_bug(
             Bug(
@@ -16,306 +16,52 @@ Usage:
     python -m testscout.presentation audit_dir/ --output slides.html
 """
 
-import os
+import gzip
+import hashlib
+import html
+import io
 import json
-import base64
+import os
+import shutil
+
+# pybase64 encodes with SIMD (SSSE3/AVX2) and is a drop-in replacement;
+# screenshot inlining is pure base64 compute, so it is the hottest loop
+# here (install the "speed" extra to get it)
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, List, Dict, Any
-
-
-def generate_slideshow(
-    audit_dir: str,
-    output_file: str = "slideshow.html",
-    title: str = "testScout Exploration",
-    auto_advance: int = 0,  # seconds, 0 = manual
-    show_prompt: bool = False,  # Full prompts can be long
-    show_response: bool = True,
-    theme: str = "dark",  # dark or light
-) -> str:
-    """
-    Generate an HTML slideshow from an audit directory.
-
-    Args:
-        audit_dir: Path to the audit trail directory
-        output_file: Output HTML file path
-        title: Presentation title
-        auto_advance: Auto-advance interval in seconds (0 for manual)
-        show_prompt: Whether to show the full AI prompt
-        show_response: Whether to show AI response
-        theme: Color theme (dark or light)
-
-    Returns:
-        Path to the generated HTML file
-    """
-    audit_path = Path(audit_dir)
-
-    # Load summary
-    summary = {}
-    summary_file = audit_path / "summary.json"
-    if summary_file.exists():
-        with open(summary_file) as f:
-            summary = json.load(f)
-
-    # Load timeline events
-    timeline = []
-    timeline_file = audit_path / "timeline.jsonl"
-    if timeline_file.exists():
-        with open(timeline_file) as f:
-            for line in f:
-                if line.strip():
-                    timeline.append(json.loads(line))
-
-    # Find action directories
-    actions_dir = audit_path / "actions"
-    actions = []
-
-    if actions_dir.exists():
-        for action_dir in sorted(actions_dir.iterdir()):
-            if action_dir.is_dir() and action_dir.name.isdigit():
-                action_data = _load_action(action_dir)
-                if action_data:
-                    actions.append(action_data)
-
-    # Generate HTML
-    html = _generate_html(
-        title=title,
-        summary=summary,
-        timeline=timeline,
-        actions=actions,
-        auto_advance=auto_advance,
-        show_prompt=show_prompt,
-        show_response=show_response,
-        theme=theme,
-    )
-
-    # Write output
-    output_path = Path(output_file)
-    with open(output_path, "w") as f:
-        f.write(html)
-
-    return str(output_path)
-
-
-def _load_action(action_dir: Path) -> Optional[Dict[str, Any]]:
-    """Load action data from an action directory."""
-    action_data = {
-        "number": int(action_dir.name),
-        "screenshot": None,
-        "screenshot_marked": None,
-        "decision": None,
-        "prompt": None,
-        "response": None,
-        "context": None,
-    }
-
-    # Load screenshots
-    for img_file in ["screenshot.png", "screenshot_clean.png"]:
-        img_path = action_dir / img_file
-        if img_path.exists():
-            with open(img_path, "rb") as f:
-                action_data["screenshot"] = base64.b64encode(f.read()).decode()
-            break
-
-    marked_path = action_dir / "screenshot_marked.png"
-    if marked_path.exists():
-        with open(marked_path, "rb") as f:
-            action_data["screenshot_marked"] = base64.b64encode(f.read()).decode()
-
-    # Load decision
-    decision_path = action_dir / "decision.json"
-    if decision_path.exists():
-        with open(decision_path) as f:
-            raw_decision = json.load(f)
-            # Normalize to expected format: decision -> next_action
-            if "decision" in raw_decision and "next_action" not in raw_decision:
-                # Convert {decision: {action, element_id, ...}} to {next_action: {...}}
-                action_data["decision"] = {
-                    "next_action": raw_decision.get("decision", {}),
-                    "observations": [],
-                    "bugs_found": [],
-                }
-            else:
-                action_data["decision"] = raw_decision
-
-    # Load ai_response for observations/bugs
-    ai_response_path = action_dir / "ai_response.json"
-    if ai_response_path.exists():
-        with open(ai_response_path) as f:
-            ai_response = json.load(f)
-            parsed = ai_response.get("parsed") or {}  # Handle None case
-            if action_data["decision"]:
-                action_data["decision"]["observations"] = parsed.get("observations", [])
-                action_data["decision"]["bugs_found"] = parsed.get("bugs_found", [])
-
-    # Load context
-    context_path = action_dir / "context.json"
-    if context_path.exists():
-        with open(context_path) as f:
-            action_data["context"] = json.load(f)
-
-    # Load prompt
-    prompt_path = action_dir / "prompt.txt"
-    if prompt_path.exists():
-        with open(prompt_path) as f:
-            action_data["prompt"] = f.read()
-
-    # Load response
-    response_path = action_dir / "response.txt"
-    if response_path.exists():
-        with open(response_path) as f:
-            action_data["response"] = f.read()
-
-    # Only return if we have at least a screenshot
-    if action_data["screenshot"]:
-        return action_data
-    return None
-
-
-def _generate_html(
-    title: str,
-    summary: Dict,
-    timeline: List[Dict],
-    actions: List[Dict],
-    auto_advance: int,
-    show_prompt: bool,
-    show_response: bool,
-    theme: str,
-) -> str:
-    """Generate the HTML slideshow."""
-
-    # Theme colors
-    if theme == "dark":
-        bg = "#1a1a2e"
-        bg2 = "#16213e"
-        text = "#eee"
-        accent = "#4f46e5"
-        muted = "#888"
-    else:
-        bg = "#f8f9fa"
-        bg2 = "#ffffff"
-        text = "#333"
-        accent = "#4f46e5"
-        muted = "#666"
-
-    # Build slides HTML
-    slides_html = []
-
-    # Title slide
-    slides_html.append(f'''
-    <div class="slide" data-slide="0">
-        <div class="title-slide">
-            <h1>{title}</h1>
-            <div class="meta">
-                <p>URL: {summary.get("start_url", "Unknown")}</p>
-                <p>Duration: {summary.get("duration_seconds", 0):.1f}s</p>
-                <p>Actions: {summary.get("total_actions", len(actions))}</p>
-                <p>Bugs Found: {summary.get("total_bugs", 0)}</p>
-            </div>
-            <p class="hint">Press <kbd>&rarr;</kbd> or click to advance</p>
-        </div>
-    </div>
-    ''')
-
-    # Action slides
-    for i, action in enumerate(actions):
-        decision = action.get("decision") or {}
-        next_action = decision.get("next_action") or {}
-
-        action_type = next_action.get("action", "unknown")
-        reason = next_action.get("reason", "")
-        target = next_action.get("target", "")
-
-        # Format observations
-        observations = decision.get("observations", [])
-        obs_html = ""
-        if observations:
-            obs_items = "".join(f"<li>{obs}</li>" for obs in observations[:3])
-            obs_html = f"<div class='observations'><strong>Observations:</strong><ul>{obs_items}</ul></div>"
-
-        # Format bugs found
-        bugs = decision.get("bugs_found", [])
-        bugs_html = ""
-        if bugs:
-            bug_items = ""
-            for b in bugs:
-                sev = b.get('severity', 'info')
-                title = b.get('title', '')
-                bug_items += f"<li class='bug bug-{sev}'><strong>[{sev.upper()}]</strong> {title}</li>"
-            bugs_html = f"<div class='bugs'><strong>Bugs Found:</strong><ul>{bug_items}</ul></div>"
-
-        # Screenshot (prefer marked)
-        screenshot = action.get("screenshot_marked") or action.get("screenshot")
-        screenshot_html = ""
-        if screenshot:
-            screenshot_html = f'<img src="data:image/png;base64,{screenshot}" alt="Screenshot {i+1}" class="screenshot">'
-
-        # Response excerpt
-        response_html = ""
-        if show_response and action.get("response"):
-            response = action["response"][:500] + "..." if len(action.get("response", "")) > 500 else action.get("response", "")
-            response_html = f"<div class='response'><strong>AI Response:</strong><pre>{response}</pre></div>"
-
-        slides_html.append(f'''
-    <div class="slide" data-slide="{i+1}">
-        <div class="slide-header">
-            <span class="slide-number">Action {action["number"]}</span>
-            <span class="action-badge action-{action_type}">{action_type.upper()}</span>
-        </div>
-        <div class="slide-content">
-            <div class="screenshot-panel">
-                {screenshot_html}
-            </div>
-            <div class="info-panel">
-                <div class="decision">
-                    <h3>Decision</h3>
-                    <p class="reason">{reason}</p>
-                    {f'<p class="target"><strong>Target:</strong> {target}</p>' if target else ''}
-                </div>
-                {obs_html}
-                {bugs_html}
-                {response_html}
-            </div>
-        </div>
-    </div>
-    ''')
-
-    # Summary slide
-    slides_html.append(f'''
-    <div class="slide" data-slide="{len(actions)+1}">
-        <div class="title-slide summary-slide">
-            <h1>Exploration Complete</h1>
-            <div class="final-stats">
-                <div class="stat">
-                    <span class="stat-value">{summary.get("total_actions", len(actions))}</span>
-                    <span class="stat-label">Actions</span>
-                </div>
-                <div class="stat">
-                    <span class="stat-value">{summary.get("total_bugs", 0)}</span>
-                    <span class="stat-label">Bugs Found</span>
-                </div>
-                <div class="stat">
-                    <span class="stat-value">{summary.get("network_failures", 0)}</span>
-                    <span class="stat-label">Network Errors</span>
-                </div>
-                <div class="stat">
-                    <span class="stat-value">{summary.get("console_errors", 0)}</span>
-                    <span class="stat-label">Console Errors</span>
-                </div>
-            </div>
-        </div>
-    </div>
-    ''')
-
-    # Full HTML
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+from typing import Any, Dict, List, Optional
+
+# Common action types with their badge label precomputed; anything else
+# is uppercased (and escaped) on the fly
+_ACTION_BADGES = {
+    "click": "CLICK",
+    "fill": "FILL",
+    "type": "TYPE",
+    "scroll": "SCROLL",
+    "navigate": "NAVIGATE",
+    "done": "DONE",
+    "unknown": "UNKNOWN",
+}
+
+# Audit loading is dominated by JSON parsing for large sessions; orjson
+# decodes several times faster than the stdlib codec and takes bytes
+# directly. Optional - the stdlib is the fallback (json.loads accepts
+# bytes too, so both paths read files in binary mode).
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+_CSS_TEMPLATE = """        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
 
         body {{
             font-family: system-ui, -apple-system, sans-serif;
@@ -591,26 +337,16 @@ def _generate_html(
         .thumb:hover {{
             background: {accent};
         }}
-    </style>
-</head>
-<body>
-    <div class="slideshow">
-        {''.join(slides_html)}
-    </div>
-
-    <div class="thumbnails">
-        {' '.join(f'<div class="thumb" data-goto="{i}"></div>' for i in range(len(actions) + 2))}
-    </div>
-
-    <nav class="nav">
-        <button id="prev">&larr; Previous</button>
-        <button id="next">Next &rarr;</button>
-        {f'<button id="auto">Auto ({auto_advance}s)</button>' if auto_advance > 0 else ''}
-    </nav>
+"""
 
-    <div class="progress" id="progress"></div>
+# Both themes rendered once at import; there are only two, so the ~4KB
+# CSS block never needs per-call interpolation
 
-    <script>
+# The navigation script is static apart from the optional auto-advance
+# block; keeping it as a plain constant avoids re-interpolating ~2 KB of
+# brace-doubled f-string JavaScript on every call. The auto-advance
+# snippet uses %-formatting so JS braces need no escaping.
+_NAV_SCRIPT = """    <script>
         const slides = document.querySelectorAll('.slide');
         const thumbs = document.querySelectorAll('.thumb');
         const progress = document.getElementById('progress');
@@ -618,7 +354,7 @@ def _generate_html(
         let currentSlide = 0;
         let autoInterval = null;
 
-        function showSlide(n) {{
+        function showSlide(n) {
             slides.forEach(s => s.classList.remove('active'));
             thumbs.forEach(t => t.classList.remove('active'));
 
@@ -627,51 +363,516 @@ def _generate_html(
             thumbs[currentSlide].classList.add('active');
 
             progress.style.width = ((currentSlide + 1) / totalSlides * 100) + '%';
-        }}
+        }
 
-        function nextSlide() {{
+        function nextSlide() {
             showSlide(currentSlide + 1);
-        }}
+        }
 
-        function prevSlide() {{
+        function prevSlide() {
             showSlide(currentSlide - 1);
-        }}
+        }
 
         // Navigation buttons
         document.getElementById('prev').addEventListener('click', prevSlide);
         document.getElementById('next').addEventListener('click', nextSlide);
 
         // Thumbnail navigation
-        thumbs.forEach((thumb, i) => {{
+        thumbs.forEach((thumb, i) => {
             thumb.addEventListener('click', () => showSlide(i));
-        }});
+        });
 
         // Keyboard navigation
-        document.addEventListener('keydown', (e) => {{
+        document.addEventListener('keydown', (e) => {
             if (e.key === 'ArrowRight' || e.key === ' ') nextSlide();
             if (e.key === 'ArrowLeft') prevSlide();
             if (e.key === 'Home') showSlide(0);
             if (e.key === 'End') showSlide(totalSlides - 1);
-        }});
+        });
 
         // Click to advance
-        document.querySelector('.slideshow').addEventListener('click', (e) => {{
-            if (!e.target.closest('.nav') && !e.target.closest('.thumbnails')) {{
+        document.querySelector('.slideshow').addEventListener('click', (e) => {
+            if (!e.target.closest('.nav') && !e.target.closest('.thumbnails')) {
                 nextSlide();
-            }}
-        }});
+            }
+        });
 
         // Auto-advance
-        {'const autoBtn = document.getElementById("auto");' if auto_advance > 0 else ''}
-        {'if (autoBtn) { autoBtn.addEventListener("click", () => { if (autoInterval) { clearInterval(autoInterval); autoInterval = null; autoBtn.textContent = "Auto (" + ' + str(auto_advance) + ' + "s)"; } else { autoInterval = setInterval(nextSlide, ' + str(auto_advance * 1000) + '); autoBtn.textContent = "Stop"; } }); }' if auto_advance > 0 else ''}
+"""
 
+_AUTO_ADVANCE_JS = """        const autoBtn = document.getElementById("auto");
+        if (autoBtn) { autoBtn.addEventListener("click", () => { if (autoInterval) { clearInterval(autoInterval); autoInterval = null; autoBtn.textContent = "Auto (%(seconds)ds)"; } else { autoInterval = setInterval(nextSlide, %(ms)d); autoBtn.textContent = "Stop"; } }); }
+"""
+
+_NAV_SCRIPT_TAIL = """
         // Initialize
         showSlide(0);
     </script>
 </body>
-</html>'''
+</html>"""
 
-    return html
+_CSS_THEMES = {
+    "dark": _CSS_TEMPLATE.format(
+        bg="#1a1a2e", bg2="#16213e", text="#eee", accent="#4f46e5", muted="#888"
+    ),
+    "light": _CSS_TEMPLATE.format(
+        bg="#f8f9fa", bg2="#ffffff", text="#333", accent="#4f46e5", muted="#666"
+    ),
+}
+
+
+def generate_slideshow(
+    audit_dir: str,
+    output_file: str = "slideshow.html",
+    title: str = "testScout Exploration",
+    auto_advance: int = 0,  # seconds, 0 = manual
+    show_prompt: bool = False,  # Full prompts can be long
+    show_response: bool = True,
+    theme: str = "dark",  # dark or light
+    inline_images: bool = False,
+    compress: bool = False,
+) -> str:
+    """
+    Generate an HTML slideshow from an audit directory.
+
+    Args:
+        audit_dir: Path to the audit trail directory
+        output_file: Output HTML file path
+        title: Presentation title
+        auto_advance: Auto-advance interval in seconds (0 for manual)
+        show_prompt: Whether to show the full AI prompt
+        show_response: Whether to show AI response
+        theme: Color theme (dark or light)
+        inline_images: Base64-inline screenshots into the HTML instead of
+            copying them next to it. Inlining makes a self-contained file
+            but bloats it by a third and forces the browser to parse one
+            giant document; the default copies screenshots under assets/
+            and lets slides lazy-load them.
+        compress: Gzip the output (also triggered by a .gz output_file
+            suffix). An inline-image slideshow can reach hundreds of
+            megabytes and its HTML/CSS/JSON scaffolding compresses well;
+            web servers serve .html.gz transparently, local viewers
+            gunzip first.
+
+    Returns:
+        Path to the generated HTML file
+    """
+    audit_path = Path(audit_dir)
+    output_path = Path(output_file)
+    assets_dir = None if inline_images else output_path.parent / "assets"
+
+    # Load summary
+    summary = {}
+    summary_file = audit_path / "summary.json"
+    if summary_file.exists():
+        with open(summary_file, "rb") as f:
+            summary = _loads(f.read())
+
+    # Load timeline events (audits saved with compress_jsonl have a .gz suffix)
+    timeline = []
+    timeline_file = audit_path / "timeline.jsonl"
+    if timeline_file.exists():
+        data = timeline_file.read_bytes()
+    elif (audit_path / "timeline.jsonl.gz").exists():
+        with gzip.open(audit_path / "timeline.jsonl.gz", "rb") as f:
+            data = f.read()
+    else:
+        data = b""
+    if data:
+        # One bulk read + split beats line-by-line file iteration, which
+        # pays Python-level readline and append overhead per event
+        loads = _loads
+        timeline = [loads(line) for line in data.split(b"\n") if line.strip()]
+
+    # Find action directories
+    actions_dir = audit_path / "actions"
+    actions = []
+    # Unique screenshot payloads keyed by content hash; repeated views
+    # (failed clicks, scroll-then-decide) are stored once and referenced
+    images: Dict[str, str] = {}
+
+    if actions_dir.exists():
+        # scandir keeps the dirent type info Path.iterdir throws away (no
+        # extra stat per child), and sorting numerically puts action "10"
+        # after "9" instead of after "1"
+        with os.scandir(actions_dir) as it:
+            entries = [e for e in it if e.name.isdigit() and e.is_dir(follow_symlinks=False)]
+        entries.sort(key=lambda e: int(e.name))
+        action_dirs = [Path(e.path) for e in entries]
+        if action_dirs:
+            # Each directory takes several blocking file reads plus image
+            # encoding; a thread pool overlaps the IO across directories
+            # and executor.map keeps the results in submission order.
+            # Directory granularity is deliberate: with up to 32 loaders
+            # in flight, a nested pool for the handful of reads inside
+            # each _load_action would only oversubscribe these workers
+            loader = partial(_load_action, assets_dir=assets_dir, images=images)
+            with ThreadPoolExecutor(max_workers=min(32, len(action_dirs))) as pool:
+                actions = [a for a in pool.map(loader, action_dirs) if a]
+
+    # Generate HTML
+    html = _generate_html(
+        title=title,
+        summary=summary,
+        timeline=timeline,
+        actions=actions,
+        images=images,
+        auto_advance=auto_advance,
+        show_prompt=show_prompt,
+        show_response=show_response,
+        theme=theme,
+    )
+
+    # Write output; encode once and issue a single binary write instead
+    # of letting the text layer chunk-encode a potentially huge string
+    if compress and output_path.suffix != ".gz":
+        output_path = output_path.with_name(output_path.name + ".gz")
+    data = html.encode("utf-8")
+    if output_path.suffix == ".gz":
+        with gzip.open(output_path, "wb", compresslevel=6) as f:
+            f.write(data)
+    else:
+        output_path.write_bytes(data)
+
+    return str(output_path)
+
+
+def _image_mime(data: bytes) -> str:
+    """Mime type from magic bytes; audit trails write PNG or WebP."""
+    if data[:3] == b"\xff\xd8\xff":
+        return "image/jpeg"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/png"
+
+
+def _load_action(
+    action_dir: Path,
+    assets_dir: Optional[Path] = None,
+    images: Optional[Dict[str, str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Load action data from an action directory.
+
+    With assets_dir set, screenshots are copied there and referenced by
+    relative path - no base64 encode and no 4/3 payload bloat; without
+    it they are inlined into the HTML as base64.
+
+    Screenshots are keyed by content hash in both modes, so a view that
+    repeats across actions is stored (and, when inlined, emitted) once.
+    Inline payloads go into the shared ``images`` registry and slides
+    carry only the hash; identical hashes from concurrent loaders write
+    identical values, so the shared dict needs no locking.
+    """
+    # One scandir enumerates the directory instead of a stat syscall per
+    # candidate file below
+    try:
+        entries = {e.name for e in os.scandir(action_dir)}
+    except OSError:
+        return None
+
+    action_data = {
+        "number": int(action_dir.name),
+        "screenshot": None,
+        "screenshot_marked": None,
+        "decision": None,
+        "prompt": None,
+        "response": None,
+        "context": None,
+        "inline_images": assets_dir is None,
+    }
+
+    def load_image(img_path: Path) -> str:
+        with open(img_path, "rb") as f:
+            data = f.read()
+        key = hashlib.blake2b(data, digest_size=12).hexdigest()
+        if assets_dir is None:
+            if images is not None and key not in images:
+                # b64encode output is pure ASCII; saying so skips the UTF-8
+                # decoder's multibyte scanning on megabytes of screenshot data
+                b64 = base64.b64encode(data).decode("ascii")
+                images[key] = "data:" + _image_mime(data) + ";base64," + b64
+            return key
+        assets_dir.mkdir(parents=True, exist_ok=True)
+        dest = assets_dir / (key + img_path.suffix)
+        if not dest.exists():
+            shutil.copyfile(img_path, dest)
+        return f"assets/{key}{img_path.suffix}"
+
+    # Load screenshots; audit trails write .png or, with
+    # screenshot_format="webp", .webp under the same stems
+    for stem in ("screenshot", "screenshot_clean"):
+        img_file = next((stem + ext for ext in (".png", ".webp") if stem + ext in entries), None)
+        if img_file:
+            action_data["screenshot"] = load_image(action_dir / img_file)
+            break
+
+    marked = next(
+        (
+            "screenshot_marked" + ext
+            for ext in (".png", ".webp")
+            if "screenshot_marked" + ext in entries
+        ),
+        None,
+    )
+    if marked:
+        action_data["screenshot_marked"] = load_image(action_dir / marked)
+
+    # Load decision
+    if "decision.json" in entries:
+        with open(action_dir / "decision.json", "rb") as f:
+            raw_decision = _loads(f.read())
+            # Normalize to expected format: decision -> next_action
+            if "decision" in raw_decision and "next_action" not in raw_decision:
+                # Convert {decision: {action, element_id, ...}} to {next_action: {...}}
+                action_data["decision"] = {
+                    "next_action": raw_decision.get("decision", {}),
+                    "observations": [],
+                    "bugs_found": [],
+                }
+            else:
+                action_data["decision"] = raw_decision
+
+    # Load ai_response for observations/bugs
+    if "ai_response.json" in entries:
+        with open(action_dir / "ai_response.json", "rb") as f:
+            ai_response = _loads(f.read())
+            parsed = ai_response.get("parsed") or {}  # Handle None case
+            if action_data["decision"]:
+                action_data["decision"]["observations"] = parsed.get("observations", [])
+                action_data["decision"]["bugs_found"] = parsed.get("bugs_found", [])
+
+    # Load context
+    if "context.json" in entries:
+        with open(action_dir / "context.json", "rb") as f:
+            action_data["context"] = _loads(f.read())
+
+    # Load prompt
+    if "prompt.txt" in entries:
+        with open(action_dir / "prompt.txt") as f:
+            action_data["prompt"] = f.read()
+
+    # Load response
+    if "response.txt" in entries:
+        with open(action_dir / "response.txt") as f:
+            action_data["response"] = f.read()
+
+    # Only return if we have at least a screenshot
+    if action_data["screenshot"]:
+        return action_data
+    return None
+
+
+def _render_action_slide(i: int, action: Dict[str, Any], show_response: bool) -> str:
+    """Render one action slide to HTML.
+
+    Pure function of its arguments; AI-derived fields (reasons, targets,
+    observations, bug titles) are untrusted page-influenced text and must
+    be escaped.
+    """
+    escape = html.escape
+    decision = action.get("decision") or {}
+    next_action = decision.get("next_action") or {}
+
+    action_type = escape(next_action.get("action", "unknown"))
+    reason = escape(next_action.get("reason", ""))
+    target = escape(next_action.get("target", ""))
+    badge = _ACTION_BADGES.get(action_type) or escape(action_type.upper())
+
+    # Format observations
+    observations = decision.get("observations", [])
+    obs_html = ""
+    if observations:
+        # islice avoids the slice copy; a list comprehension lets join
+        # size its result in one pass
+        obs_items = "".join([f"<li>{escape(obs)}</li>" for obs in islice(observations, 3)])
+        obs_html = (
+            f"<div class='observations'><strong>Observations:</strong><ul>{obs_items}</ul></div>"
+        )
+
+    # Format bugs found
+    bugs = decision.get("bugs_found", [])
+    bugs_html = ""
+    if bugs:
+        bug_parts = []
+        for b in bugs:
+            sev = escape(b.get("severity", "info"))
+            title = escape(b.get("title", ""))
+            bug_parts.append(
+                f"<li class='bug bug-{sev}'><strong>[{sev.upper()}]</strong> {title}</li>"
+            )
+        bugs_html = (
+            f"<div class='bugs'><strong>Bugs Found:</strong><ul>{''.join(bug_parts)}</ul></div>"
+        )
+
+    # Screenshot (prefer marked)
+    screenshot = action.get("screenshot_marked") or action.get("screenshot")
+    screenshot_html = ""
+    if screenshot:
+        if action.get("inline_images"):
+            # The base64 payload lives once in the IMAGES registry; the
+            # slide carries only the content hash and a startup script
+            # assigns the data URL
+            screenshot_html = (
+                f'<img data-img="{screenshot}" alt="Screenshot {i+1}" class="screenshot">'
+            )
+        else:
+            screenshot_html = (
+                f'<img src="{screenshot}" alt="Screenshot {i+1}" class="screenshot" loading="lazy">'
+            )
+
+    # Response excerpt
+    response_html = ""
+    if show_response and action.get("response"):
+        response = (
+            action["response"][:500] + "..."
+            if len(action.get("response", "")) > 500
+            else action.get("response", "")
+        )
+        response_html = f"<div class='response'><strong>AI Response:</strong><pre>{escape(response)}</pre></div>"
+
+    return f"""
+    <div class="slide" data-slide="{i+1}">
+        <div class="slide-header">
+            <span class="slide-number">Action {action["number"]}</span>
+            <span class="action-badge action-{action_type}">{badge}</span>
+        </div>
+        <div class="slide-content">
+            <div class="screenshot-panel">
+                {screenshot_html}
+            </div>
+            <div class="info-panel">
+                <div class="decision">
+                    <h3>Decision</h3>
+                    <p class="reason">{reason}</p>
+                    {f'<p class="target"><strong>Target:</strong> {target}</p>' if target else ''}
+                </div>
+                {obs_html}
+                {bugs_html}
+                {response_html}
+            </div>
+        </div>
+    </div>
+    """
+
+
+def _generate_html(
+    title: str,
+    summary: Dict,
+    timeline: List[Dict],
+    actions: List[Dict],
+    images: Dict[str, str],
+    auto_advance: int,
+    show_prompt: bool,
+    show_response: bool,
+    theme: str,
+) -> str:
+    """Generate the HTML slideshow."""
+
+    css = _CSS_THEMES["dark" if theme == "dark" else "light"]
+
+    # Stream the document through one writer: the head, each slide,
+    # and the tail are written as they are built, instead of collecting
+    # per-slide strings and re-copying everything into a final f-string
+    buf = io.StringIO()
+    w = buf.write
+
+    w(f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+{css}
+    </style>
+</head>
+<body>
+    <div class="slideshow">
+""")
+
+    # Title slide
+    w(f"""
+    <div class="slide" data-slide="0">
+        <div class="title-slide">
+            <h1>{title}</h1>
+            <div class="meta">
+                <p>URL: {summary.get("start_url", "Unknown")}</p>
+                <p>Duration: {summary.get("duration_seconds", 0):.1f}s</p>
+                <p>Actions: {summary.get("total_actions", len(actions))}</p>
+                <p>Bugs Found: {summary.get("total_bugs", 0)}</p>
+            </div>
+            <p class="hint">Press <kbd>&rarr;</kbd> or click to advance</p>
+        </div>
+    </div>
+    """)
+
+    # Action slides; each is rendered by a pure helper so the loop body
+    # stays a straight write
+    for i, action in enumerate(actions):
+        w(_render_action_slide(i, action, show_response))
+
+    # Summary slide
+    w(f"""
+    <div class="slide" data-slide="{len(actions)+1}">
+        <div class="title-slide summary-slide">
+            <h1>Exploration Complete</h1>
+            <div class="final-stats">
+                <div class="stat">
+                    <span class="stat-value">{summary.get("total_actions", len(actions))}</span>
+                    <span class="stat-label">Actions</span>
+                </div>
+                <div class="stat">
+                    <span class="stat-value">{summary.get("total_bugs", 0)}</span>
+                    <span class="stat-label">Bugs Found</span>
+                </div>
+                <div class="stat">
+                    <span class="stat-value">{summary.get("network_failures", 0)}</span>
+                    <span class="stat-label">Network Errors</span>
+                </div>
+                <div class="stat">
+                    <span class="stat-value">{summary.get("console_errors", 0)}</span>
+                    <span class="stat-label">Console Errors</span>
+                </div>
+            </div>
+        </div>
+    </div>
+    """)
+
+    thumb_divs = " ".join(
+        f'<div class="thumb" data-goto="{i}"></div>' for i in range(len(actions) + 2)
+    )
+    auto_button = f'<button id="auto">Auto ({auto_advance}s)</button>' if auto_advance > 0 else ""
+    w(f"""    </div>
+
+    <div class="thumbnails">
+        {thumb_divs}
+    </div>
+
+    <nav class="nav">
+        <button id="prev">&larr; Previous</button>
+        <button id="next">Next &rarr;</button>
+        {auto_button}
+    </nav>
+
+    <div class="progress" id="progress"></div>
+
+""")
+    if images:
+        # Each unique screenshot is emitted once; slides reference it by
+        # content hash via data-img
+        w("    <script>const IMAGES = ")
+        w(json.dumps(images))
+        w(
+            ";document.querySelectorAll('img[data-img]').forEach("
+            "el => { el.src = IMAGES[el.dataset.img]; });"
+            "</script>\n\n"
+        )
+    w(_NAV_SCRIPT)
+    if auto_advance > 0:
+        w(_AUTO_ADVANCE_JS % {"seconds": auto_advance, "ms": auto_advance * 1000})
+    w(_NAV_SCRIPT_TAIL)
+
+    return buf.getvalue()
 
 
 # CLI
@@ -685,7 +886,17 @@ if __name__ == "__main__":
     parser.add_argument("-a", "--auto", type=int, default=0, help="Auto-advance seconds")
     parser.add_argument("--theme", choices=["dark", "light"], default="dark", help="Color theme")
     parser.add_argument("--show-prompt", action="store_true", help="Show full AI prompts")
+    parser.add_argument(
+        "--inline-images",
+        action="store_true",
+        help="Base64-inline screenshots for a self-contained HTML file",
+    )
     parser.add_argument("--show-response", action="store_true", help="Show AI responses")
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Gzip the output to a .html.gz for distribution",
+    )
 
     args = parser.parse_args()
 
@@ -697,6 +908,8 @@ if __name__ == "__main__":
         theme=args.theme,
         show_prompt=args.show_prompt,
         show_response=args.show_response,
+        inline_images=args.inline_images,
+        compress=args.compress,
     )
 
     print(f"Generated: {output}")
@@ -5,10 +5,12 @@ Provides utilities for testing with real browsers and AI backends.
 """
 
 import os
-from typing import Generator
+from typing import TYPE_CHECKING, Generator
 
 import pytest
-from playwright.sync_api import Page, sync_playwright
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
 
 
 def pytest_configure(config):
@@ -19,17 +21,51 @@ def pytest_configure(config):
 
 @pytest.fixture(scope="session")
 def playwright_browser():
-    """Session-scoped browser for faster tests."""
+    """Session-scoped browser for faster tests.
+
+    Under pytest-xdist each worker process runs its own session, so this
+    comes out to one browser per worker; CI runs
+    ``pytest -n auto --dist=loadgroup``, which keeps tests sharing an
+    ``xdist_group`` marker on one worker (and thus one browser).
+
+    Set TESTSCOUT_BROWSER_WS to a browser server's websocket endpoint
+    (from ``playwright launch-server`` or ``chromium.launch_server()``)
+    to reuse a long-lived browser across runs - in watch loops this
+    skips the launch cost entirely; closing a connected browser only
+    disconnects, the server stays up for the next run.
+    """
+    # Imported here, not at module top: playwright's import chain is a
+    # few hundred ms cold, and browser-free test runs shouldn't pay it
+    # just because pytest collects this conftest
+    from playwright.sync_api import sync_playwright
+
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+        ws_endpoint = os.environ.get("TESTSCOUT_BROWSER_WS")
+        if ws_endpoint:
+            browser = p.chromium.connect(ws_endpoint)
+        else:
+            browser = p.chromium.launch(headless=True)
         yield browser
         browser.close()
 
 
 @pytest.fixture
-def browser_page(playwright_browser) -> Generator[Page, None, None]:
+def browser_context(playwright_browser):
+    """Fresh browser context per test.
+
+    Contexts give cookie/storage isolation at a fraction of the cost of
+    a browser launch, so tests stay independent without paying process
+    startup.
+    """
+    context = playwright_browser.new_context()
+    yield context
+    context.close()
+
+
+@pytest.fixture
+def browser_page(browser_context) -> Generator["Page", None, None]:
     """Page fixture that creates a fresh page for each test."""
-    page = playwright_browser.new_page()
+    page = browser_context.new_page()
     yield page
     page.close()
 
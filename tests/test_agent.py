@@ -1,13 +1,10 @@
 """Tests for the Agent module with mock backend."""
 
-import os
-import sys
+from collections import deque
 from typing import Any, Dict, List, Optional
 
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from testscout.backends import (
     ActionPlan,
     ActionType,
@@ -21,10 +18,12 @@ class MockVisionBackend(VisionBackend):
     """Mock backend for testing without real AI."""
 
     def __init__(self):
-        self.action_responses = []
-        self.assertion_responses = []
-        self.query_responses = []
-        self.discover_responses = []
+        # deques so dequeuing is O(1); list.pop(0) shifts every
+        # remaining canned response
+        self.action_responses = deque()
+        self.assertion_responses = deque()
+        self.query_responses = deque()
+        self.discover_responses = deque()
         self._action_calls = []
         self._assertion_calls = []
 
@@ -54,7 +53,7 @@ class MockVisionBackend(VisionBackend):
         )
 
         if self.action_responses:
-            return self.action_responses.pop(0)
+            return self.action_responses.popleft()
 
         return ActionPlan(
             action=ActionType.NONE,
@@ -70,7 +69,7 @@ class MockVisionBackend(VisionBackend):
         self._assertion_calls.append({"assertion": assertion})
 
         if self.assertion_responses:
-            return self.assertion_responses.pop(0)
+            return self.assertion_responses.popleft()
 
         return AssertionResult(passed=False, reason="No mock response set")
 
@@ -81,7 +80,7 @@ class MockVisionBackend(VisionBackend):
         elements: Optional[PageElements] = None,
     ) -> str:
         if self.query_responses:
-            return self.query_responses.pop(0)
+            return self.query_responses.popleft()
         return "Mock response"
 
     def discover_elements(
@@ -90,7 +89,7 @@ class MockVisionBackend(VisionBackend):
         element_type: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         if self.discover_responses:
-            return self.discover_responses.pop(0)
+            return self.discover_responses.popleft()
         return []
 
 
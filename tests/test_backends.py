@@ -0,0 +1,74 @@
+"""Tests for the backends base module."""
+
+from testscout.backends.base import ActionType, _try_local_match
+from testscout.discovery import DiscoveredElement, ElementType, PageElements
+
+
+def make_element(ai_id, text, element_type=ElementType.BUTTON, **overrides):
+    """Build a DiscoveredElement with sensible defaults."""
+    fields = dict(
+        ai_id=ai_id,
+        element_type=element_type,
+        tag="button",
+        text=text,
+        placeholder="",
+        aria_label="",
+        name="",
+        id="",
+        classes=[],
+        href=None,
+        src=None,
+        is_visible=True,
+        is_enabled=True,
+        bounding_box={"x": 0, "y": 0, "width": 10, "height": 10},
+    )
+    fields.update(overrides)
+    return DiscoveredElement(**fields)
+
+
+class TestTryLocalMatch:
+    """Test the pre-API local instruction matcher."""
+
+    def test_unique_exact_match(self):
+        """Should resolve 'Click the X button' to the element labeled X."""
+        elements = PageElements(
+            elements=[
+                make_element(1, "Login"),
+                make_element(2, "Cancel"),
+            ]
+        )
+
+        plan = _try_local_match("Click the Login button", elements)
+
+        assert plan is not None
+        assert plan.action == ActionType.CLICK
+        assert plan.element_id == 1
+
+    def test_ambiguous_match_returns_none(self):
+        """Should defer to the model when two elements match."""
+        elements = PageElements(
+            elements=[
+                make_element(1, "Submit"),
+                make_element(2, "Submit"),
+            ]
+        )
+
+        assert _try_local_match("Click the Submit button", elements) is None
+
+    def test_fill_instruction_returns_none(self):
+        """Should never attempt instructions that carry a text payload."""
+        elements = PageElements(elements=[make_element(1, "Email")])
+
+        assert _try_local_match("Fill in the email field with a@b.com", elements) is None
+
+    def test_hidden_elements_ignored(self):
+        """Should not match invisible or disabled elements."""
+        elements = PageElements(elements=[make_element(1, "Login", is_visible=False)])
+
+        assert _try_local_match("Click the Login button", elements) is None
+
+    def test_no_match_returns_none(self):
+        """Should return None when nothing resembles the target."""
+        elements = PageElements(elements=[make_element(1, "Dashboard")])
+
+        assert _try_local_match("Click the Logout button", elements) is None
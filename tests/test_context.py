@@ -1,12 +1,7 @@
 """Tests for the Context module."""
 
-import os
-import sys
-
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from testscout.context import AIVerification, ConsoleLog, Context, LogLevel
 
 
@@ -1,12 +1,7 @@
 """Tests for the Discovery module."""
 
-import os
-import sys
-
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from testscout.discovery import (
     DiscoveredElement,
     ElementType,
@@ -66,81 +61,86 @@ class TestDiscoveredElement:
         assert data["enabled"] is True
 
 
+@pytest.fixture(scope="module")
+def sample_elements():
+    """Create sample elements for testing.
+
+    Module-scoped: every test only reads (find_by_* and summary
+    calls), so the elements are built once instead of per test.
+    """
+    return PageElements(
+        elements=[
+            DiscoveredElement(
+                ai_id=0,
+                element_type=ElementType.BUTTON,
+                tag="button",
+                text="Login",
+                placeholder="",
+                aria_label="",
+                name="",
+                id="login-btn",
+                classes=[],
+                href=None,
+                src=None,
+                is_visible=True,
+                is_enabled=True,
+                bounding_box={},
+            ),
+            DiscoveredElement(
+                ai_id=1,
+                element_type=ElementType.INPUT,
+                tag="input",
+                text="",
+                placeholder="Email",
+                aria_label="",
+                name="email",
+                id="",
+                classes=[],
+                href=None,
+                src=None,
+                is_visible=True,
+                is_enabled=True,
+                bounding_box={},
+            ),
+            DiscoveredElement(
+                ai_id=2,
+                element_type=ElementType.INPUT,
+                tag="input",
+                text="",
+                placeholder="Password",
+                aria_label="",
+                name="password",
+                id="",
+                classes=[],
+                href=None,
+                src=None,
+                is_visible=True,
+                is_enabled=True,
+                bounding_box={},
+            ),
+            DiscoveredElement(
+                ai_id=3,
+                element_type=ElementType.LINK,
+                tag="a",
+                text="Forgot Password?",
+                placeholder="",
+                aria_label="",
+                name="",
+                id="",
+                classes=[],
+                href="/forgot",
+                src=None,
+                is_visible=True,
+                is_enabled=True,
+                bounding_box={},
+            ),
+        ]
+    )
+
+
 class TestPageElements:
     """Test PageElements collection."""
 
-    @pytest.fixture
-    def sample_elements(self):
-        """Create sample elements for testing."""
-        return PageElements(
-            elements=[
-                DiscoveredElement(
-                    ai_id=0,
-                    element_type=ElementType.BUTTON,
-                    tag="button",
-                    text="Login",
-                    placeholder="",
-                    aria_label="",
-                    name="",
-                    id="login-btn",
-                    classes=[],
-                    href=None,
-                    src=None,
-                    is_visible=True,
-                    is_enabled=True,
-                    bounding_box={},
-                ),
-                DiscoveredElement(
-                    ai_id=1,
-                    element_type=ElementType.INPUT,
-                    tag="input",
-                    text="",
-                    placeholder="Email",
-                    aria_label="",
-                    name="email",
-                    id="",
-                    classes=[],
-                    href=None,
-                    src=None,
-                    is_visible=True,
-                    is_enabled=True,
-                    bounding_box={},
-                ),
-                DiscoveredElement(
-                    ai_id=2,
-                    element_type=ElementType.INPUT,
-                    tag="input",
-                    text="",
-                    placeholder="Password",
-                    aria_label="",
-                    name="password",
-                    id="",
-                    classes=[],
-                    href=None,
-                    src=None,
-                    is_visible=True,
-                    is_enabled=True,
-                    bounding_box={},
-                ),
-                DiscoveredElement(
-                    ai_id=3,
-                    element_type=ElementType.LINK,
-                    tag="a",
-                    text="Forgot Password?",
-                    placeholder="",
-                    aria_label="",
-                    name="",
-                    id="",
-                    classes=[],
-                    href="/forgot",
-                    src=None,
-                    is_visible=True,
-                    is_enabled=True,
-                    bounding_box={},
-                ),
-            ]
-        )
-
     def test_find_by_id(self, sample_elements):
         """Should find element by ai_id."""
         el = sample_elements.find_by_id(1)